@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Compare the speed of one day's part at two git revisions, with the runs
+interleaved, and report the speedup of B over A with a confidence
+interval.  A revision of "." is the working tree, changes and all.
+
+    ./ab_compare.py HEAD~1 HEAD 17 -p 2       day 17 part 2, last commit
+    ./ab_compare.py HEAD . 22 -n 40           uncommitted changes to day 22
+"""
+
+import argparse
+import statistics
+import sys
+
+from aoc.abtest import bootstrap_ratio, compare, mann_whitney, resolve
+
+
+def parse_args():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("rev_a", help="Baseline revision (A)")
+    parser.add_argument("rev_b", help="Revision to compare (B)")
+    parser.add_argument("day", type=int)
+    parser.add_argument(
+        "-p",
+        "--part",
+        type=int,
+        choices=[1, 2],
+        default=1,
+        help="Part to time (default: %(default)s)",
+    )
+    parser.add_argument(
+        "-n",
+        "--runs",
+        type=int,
+        default=20,
+        help="Timed runs of each revision (default: %(default)s)",
+    )
+    parser.add_argument(
+        "-w",
+        "--warmup",
+        type=int,
+        default=1,
+        help="Untimed runs of each first (default: %(default)s)",
+    )
+    parser.add_argument(
+        "-c",
+        "--confidence",
+        type=float,
+        default=0.95,
+        help="Confidence level of the interval (default: %(default)s)",
+    )
+    parser.add_argument(
+        "-s",
+        "--seed",
+        type=int,
+        default=0,
+        help="Seed for the run order and the bootstrap (default: %(default)s)",
+    )
+    return parser.parse_args()
+
+
+def main():
+    opt = parse_args()
+    try:
+        revs = [resolve(opt.rev_a), resolve(opt.rev_b)]
+    except ValueError as e:
+        sys.exit(e)
+    a, b = compare(*revs, opt.day, opt.part, opt.runs, opt.warmup, opt.seed)
+
+    print(f"day{opt.day} part{opt.part}, {opt.runs} interleaved runs each")
+    print(f"{'':3} {'revision':<12} {'median':>10} {'min':>10} {'max':>10}")
+    for label, worker, name in [("A", a, opt.rev_a), ("B", b, opt.rev_b)]:
+        times = worker.times
+        print(
+            f"{label:3} {name[:12]:<12} {statistics.median(times):10.4f} "
+            f"{min(times):10.4f} {max(times):10.4f}"
+        )
+    if a.answer != b.answer and "None" not in (a.answer, b.answer):
+        print(f"warning: the answers differ: A {a.answer}, B {b.answer}")
+
+    ratio, lo, hi = bootstrap_ratio(a.times, b.times, opt.confidence, seed=opt.seed)
+    u, p = mann_whitney(a.times, b.times)
+    print(
+        f"speedup of B over A: {ratio:.3f}x, "
+        f"{opt.confidence:.0%} CI [{lo:.3f}, {hi:.3f}] (bootstrap of medians)"
+    )
+    print(
+        f"Mann-Whitney U = {u:g}, p = {p:.2g}: "
+        f"{'significant' if p < 1 - opt.confidence else 'no significant difference'}"
+    )
+
+
+if __name__ == "__main__":
+    main()
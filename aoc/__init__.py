@@ -0,0 +1,7 @@
+"""
+Shared tooling for running, timing and inspecting the daily solutions.
+"""
+
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
@@ -0,0 +1,199 @@
+"""
+A/B timing of one day's part at two git revisions.
+
+Each revision is checked out into a temporary git worktree (or, for ".",
+the working tree is used as it is), and a worker process is started in
+it that imports the day module once and then times the part each time
+it's asked to.  The two workers are run in alternation, in a random order
+each round, so that drift in the machine's speed (thermal throttling,
+other load) hits both revisions alike.
+
+The speedup is the ratio of the median times, with a percentile bootstrap
+confidence interval, and the Mann-Whitney U test gives the probability of
+a difference at least that large if the revisions were equally fast.
+Neither assumes the times are normally distributed, which they seldom
+are.
+"""
+
+from dataclasses import dataclass, field
+import contextlib
+import math
+import random
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+
+from aoc import ROOT
+
+# Run in the worktree's root, so that the day module (and the aoc package
+# it imports) come from that revision.  Only long-standing parts of the day
+# scripts are used -- INPUTFILE, load_input and partN -- so that old
+# revisions can be timed too.  Where the revision has a parse cache, it is
+# bypassed, so that each run times the parse.
+WORKER = """\
+import contextlib, importlib.util, inspect, os, sys, time
+day, part = int(sys.argv[1]), int(sys.argv[2])
+root = os.getcwd()
+os.chdir(os.path.join(root, f"day{day}"))
+sys.path[:0] = [os.getcwd(), root]
+sys.argv = [f"day{day}.py"]
+try:
+    from aoc import parsecache
+    parsecache.enable(False)
+except (ImportError, AttributeError):
+    pass
+out = sys.stdout
+with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+    spec = importlib.util.spec_from_file_location(f"day{day}", f"day{day}.py")
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    func = getattr(module, f"part{part}")
+    args = []
+    if inspect.signature(func).parameters:
+        args.append(module.load_input(module.INPUTFILE))
+    for request in sys.stdin:
+        start = time.perf_counter()
+        answer = func(*args)
+        elapsed = time.perf_counter() - start
+        print(elapsed, repr(answer), file=out, flush=True)
+"""
+
+
+def resolve(rev):
+    """Return the commit hash for a revision, or "." for the working tree."""
+    if rev == ".":
+        return rev
+    proc = subprocess.run(
+        ["git", "rev-parse", "--verify", "--quiet", f"{rev}^{{commit}}"],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+    )
+    if proc.returncode != 0:
+        raise ValueError(f"unknown revision '{rev}'")
+    return proc.stdout.strip()
+
+
+@contextlib.contextmanager
+def checkout(rev):
+    """Context manager giving the root directory of a checkout of rev, in a
+    temporary worktree that is removed on exit.
+    """
+    if rev == ".":
+        yield ROOT
+        return
+    path = tempfile.mkdtemp(prefix="aoc-ab-")
+    try:
+        subprocess.run(
+            ["git", "worktree", "add", "--quiet", "--detach", path, rev],
+            cwd=ROOT,
+            check=True,
+            capture_output=True,
+        )
+        yield path
+    finally:
+        subprocess.run(
+            ["git", "worktree", "remove", "--force", path],
+            cwd=ROOT,
+            capture_output=True,
+        )
+        shutil.rmtree(path, ignore_errors=True)
+        subprocess.run(["git", "worktree", "prune"], cwd=ROOT, capture_output=True)
+
+
+@dataclass
+class Worker:
+
+    rev: str
+    root: str
+    day: int
+    part: int
+    times: list = field(default_factory=list)
+    answer: str = None
+
+    def __post_init__(self):
+        self.proc = subprocess.Popen(
+            [sys.executable, "-c", WORKER, str(self.day), str(self.part)],
+            cwd=self.root,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            text=True,
+        )
+
+    def run(self, record=True):
+        """Time one run of the part, and return the time in seconds."""
+        self.proc.stdin.write("run\n")
+        self.proc.stdin.flush()
+        reply = self.proc.stdout.readline()
+        if not reply:
+            raise RuntimeError(f"day{self.day} part{self.part} failed at {self.rev}")
+        elapsed, self.answer = reply.rstrip("\n").split(" ", 1)
+        if record:
+            self.times.append(float(elapsed))
+        return float(elapsed)
+
+    def close(self):
+        self.proc.stdin.close()
+        self.proc.wait()
+
+
+def compare(rev_a, rev_b, day, part, runs=20, warmup=1, seed=0):
+    """Time the part at both revisions, interleaved, and return the two
+    Workers with their times.
+    """
+    rng = random.Random(seed)
+    with checkout(rev_a) as root_a, checkout(rev_b) as root_b:
+        workers = [Worker(rev_a, root_a, day, part), Worker(rev_b, root_b, day, part)]
+        try:
+            for i in range(warmup + runs):
+                for worker in rng.sample(workers, 2):
+                    worker.run(record=i >= warmup)
+        finally:
+            for worker in workers:
+                worker.close()
+    return workers
+
+
+def bootstrap_ratio(a, b, confidence=0.95, resamples=10000, seed=0):
+    """Return median(a) / median(b), with the lower and upper bounds of its
+    percentile bootstrap confidence interval.
+    """
+    rng = random.Random(seed)
+    ratios = sorted(
+        statistics.median(rng.choices(a, k=len(a)))
+        / statistics.median(rng.choices(b, k=len(b)))
+        for _ in range(resamples)
+    )
+    tail = (1 - confidence) / 2
+    lo = ratios[int(tail * (resamples - 1))]
+    hi = ratios[math.ceil((1 - tail) * (resamples - 1))]
+    return statistics.median(a) / statistics.median(b), lo, hi
+
+
+def mann_whitney(a, b):
+    """Return the Mann-Whitney U statistic of a against b, and its two-sided
+    p-value, from the normal approximation with tie and continuity
+    corrections (good enough for ten or more samples each).
+    """
+    values = sorted([(v, 0) for v in a] + [(v, 1) for v in b])
+    n1, n2, n = len(a), len(b), len(values)
+    rank_sum, ties, i = 0.0, 0, 0
+    while i < n:
+        j = i
+        while j < n and values[j][0] == values[i][0]:
+            j += 1
+        # values[i:j] are tied, and share the mean of ranks i+1 .. j
+        rank = (i + j + 1) / 2
+        rank_sum += rank * sum(1 for v in values[i:j] if v[1] == 0)
+        ties += (j - i) ** 3 - (j - i)
+        i = j
+    u = rank_sum - n1 * (n1 + 1) / 2
+    mean = n1 * n2 / 2
+    sigma = math.sqrt(n1 * n2 / 12 * ((n + 1) - ties / (n * (n - 1))))
+    if sigma == 0:
+        return u, 1.0
+    z = max(abs(u - mean) - 0.5, 0) / sigma
+    return u, 2 * (1 - statistics.NormalDist().cdf(z))
@@ -0,0 +1,434 @@
+"""
+A cellular automaton engine, for life-like rules.
+
+An Automaton is configured with a neighborhood and a Rule (the neighbor
+counts at which a dead cell is born, and at which a live cell survives).
+The neighborhoods are:
+
+    moore(dims)             the 3**dims - 1 cells around a cell, in any
+                            number of dimensions (SQUARE is moore(2))
+    HEX                     the six neighbors on a hex grid, in the doubled
+                            coordinates (e = (2, 0), ne = (1, 2), ...)
+    GridNeighborhood        the square or line-of-sight neighbors, within a
+                            fixed set of cells (eg the seats in a plane)
+
+The live cells are kept by one of two backends.  The sparse backend is a
+set of the live cells, and counts neighbors cell by cell; the dense backend
+is a bitset (one big int over a box around the live cells, or a BitGrid),
+and counts the neighbors of every cell at once, with bit-sliced adds.  The
+engine switches to the dense backend once the live cells fill enough of
+their bounding box, and back again if they thin out, unless use_backend()
+has pinned every automaton to one of them (eg to check that they agree).
+"""
+
+from collections import Counter, namedtuple
+import itertools
+import time
+
+from aoc import counters
+from aoc.grid import BitGrid, DenseGrid, add_bits, count_in, popcount
+
+DENSITY = 0.05  # switch to the dense backend above this fraction of live cells
+BACKENDS = ("sparse", "dense")
+
+PINNED = None  # the backend every automaton uses, if not chosen by density
+
+
+def use_backend(name=None):
+    """Pin every automaton to the named backend, or if None, go back to
+    choosing it by density.
+    """
+    global PINNED
+    if name is not None and name not in BACKENDS:
+        raise ValueError(f"unknown backend '{name}'")
+    PINNED = name
+
+
+class Rule(namedtuple("Rule", ["born", "survive"])):
+    """The neighbor counts at which a cell is born, and survives (frozensets).
+    A namedtuple rather than a dataclass, since dataclasses is slow to import.
+    """
+
+    @classmethod
+    def parse(cls, text):
+        """Return a Rule from its B/S notation, eg "B3/S23"."""
+        born, survive = text.upper().split("/")
+        return cls(
+            frozenset(int(v) for v in born[1:]), frozenset(int(v) for v in survive[1:])
+        )
+
+
+LIFE = Rule.parse("B3/S23")
+
+
+class Lattice:
+    """An unbounded grid of cells with integer coordinates, where each
+    cell's neighbors are at the same offsets.
+    """
+
+    def __init__(self, offsets):
+        self.offsets = tuple(tuple(v) for v in offsets)
+        self.dims = len(self.offsets[0])
+        self.reach = tuple(
+            max([abs(v[k]) for v in self.offsets]) for k in range(self.dims)
+        )
+
+    def neighbors(self, cell):
+        return [tuple([a + b for a, b in zip(cell, v)]) for v in self.offsets]
+
+    def volume(self, cells):
+        """Return the volume of the bounding box of the given cells."""
+        result = 1
+        for lo, hi in bounds(cells):
+            result *= hi - lo + 1
+        return result
+
+    def dense(self, cells):
+        return BoxState(self, cells)
+
+
+def moore(dims):
+    """Return the Moore neighborhood in the given number of dimensions."""
+    offsets = [v for v in itertools.product((-1, 0, 1), repeat=dims) if any(v)]
+    return Lattice(offsets)
+
+
+SQUARE = moore(2)
+
+HEX = Lattice([(2, 0), (1, -2), (-1, -2), (-2, 0), (-1, 2), (1, 2)])
+
+
+class GridNeighborhood:
+    """The cells of a fixed plane (a BitGrid of the cells that can ever be
+    live), with the eight square neighbors of each cell, or if sight is
+    True, the first such cell seen in each of the eight directions.  Cells
+    are (row, col) tuples.
+    """
+
+    def __init__(self, universe, sight=False):
+        self.universe = universe
+        self.sight = sight
+        dense = DenseGrid(universe.width, universe.height)
+        for r, row in enumerate(universe.rows):
+            for c in range(universe.width):
+                dense.set(r, c, row >> c & 1)
+        if sight:
+            table = dense.neighbor_table(skip=0)
+        else:
+            table = {
+                i: [j for j in dense.neighbors(i) if dense.cells[j]]
+                for i in range(len(dense.cells))
+            }
+        w = universe.width
+        self.table = {
+            divmod(i, w): [divmod(j, w) for j in naybs]
+            for i, naybs in table.items()
+            if dense.cells[i]
+        }
+        self.clear = BitGrid([~row & universe.mask for row in universe.rows], w)
+
+    def neighbors(self, cell):
+        return self.table[cell]
+
+    def volume(self, cells):
+        return len(self.table)
+
+    def dense(self, cells):
+        return GridState(self, cells)
+
+
+def bounds(cells):
+    """Return a list of the (min, max) of each coordinate of the cells."""
+    return [(min(values), max(values)) for values in zip(*cells)]
+
+
+class SparseState:
+    """The live cells, as a set."""
+
+    def __init__(self, neighborhood, cells):
+        self.neighborhood = neighborhood
+        self.live = set(cells)
+
+    @property
+    def population(self):
+        return len(self.live)
+
+    def cells(self):
+        return set(self.live)
+
+    def snapshot(self):
+        return frozenset(self.live)
+
+    def density(self):
+        if not self.live:
+            return 0.0
+        return len(self.live) / self.neighborhood.volume(self.live)
+
+    def step(self, rule):
+        counts = Counter()
+        for cell in self.live:
+            counts.update(self.neighborhood.neighbors(cell))
+        counters.count("automaton.sparse.cells", len(counts))
+        live = self.live
+        result = {
+            cell
+            for cell, n in counts.items()
+            if n in (rule.survive if cell in live else rule.born)
+        }
+        if 0 in rule.survive:
+            result.update(cell for cell in live if cell not in counts)
+        if 0 in rule.born:
+            if not isinstance(self.neighborhood, GridNeighborhood):
+                raise ValueError("a rule with B0 needs a bounded neighborhood")
+            result.update(
+                cell
+                for cell in self.neighborhood.table
+                if cell not in counts and cell not in live
+            )
+        self.live = result
+        return self
+
+
+class BoxState:
+    """The live cells of a Lattice, as the bits of one int, over a box
+    around the cells.  Axis 0 runs along each row of bits, and rows are
+    padded to whole bytes, so they can be sliced out of the int's bytes.
+    The box leaves a margin of the neighborhood's reach around the live
+    cells, so that every cell that might be born is inside it.
+    """
+
+    def __init__(self, lattice, cells):
+        self.lattice = lattice
+        self.lo = ()
+        self.bits = 0
+        self.population = 0
+        self._layout(list(cells))
+
+    def _layout(self, cells, rows=None):
+        """Lay out a new box around the given cells (or, if rows is given, a
+        dict mapping the other coordinates of each row to the row's cells,
+        as bits from x = self.lo[0]).
+        """
+        reach = self.lattice.reach
+        if rows is None:
+            old_x0 = min([cell[0] for cell in cells], default=0)
+            rows = {}
+            for cell in cells:
+                rows[cell[1:]] = rows.get(cell[1:], 0) | 1 << (cell[0] - old_x0)
+        else:
+            old_x0 = self.lo[0]
+        if not rows:
+            self.lo = (0,) * self.lattice.dims
+            self.shape = (1,) * self.lattice.dims
+            self.bits = self.population = 0
+            self._strides()
+            return
+
+        allbits = 0
+        for bits in rows.values():
+            allbits |= bits
+        x_lo = old_x0 + (allbits & -allbits).bit_length() - 1
+        x_hi = old_x0 + allbits.bit_length() - 1
+        others = bounds(rows) if self.lattice.dims > 1 else []
+        lo = [x_lo - reach[0]] + [a - r for (a, _), r in zip(others, reach[1:])]
+        hi = [x_hi + reach[0]] + [b + r for (_, b), r in zip(others, reach[1:])]
+        self.lo = tuple(lo)
+        self.shape = tuple(b - a + 1 for a, b in zip(lo, hi))
+        self._strides()
+
+        buf = bytearray(self.size // 8)
+        shift = old_x0 - self.lo[0]
+        for other, bits in rows.items():
+            start = self._row_index(other) * self.rowbytes
+            bits = bits << shift if shift >= 0 else bits >> -shift
+            buf[start : start + self.rowbytes] = bits.to_bytes(self.rowbytes, "little")
+        self.bits = int.from_bytes(buf, "little")
+        self.population = sum([popcount(bits) for bits in rows.values()])
+
+    def _strides(self):
+        self.rowbytes = (self.shape[0] + 7) // 8
+        strides = [1, self.rowbytes * 8]
+        for n in self.shape[1:-1]:
+            strides.append(strides[-1] * n)
+        self.strides = strides[: len(self.shape)]
+        self.size = (
+            self.strides[-1] * self.shape[-1]
+            if len(self.shape) > 1
+            else self.rowbytes * 8
+        )
+
+    def _row_index(self, other):
+        index = 0
+        for k in range(len(other) - 1, -1, -1):
+            index = index * self.shape[k + 1] + (other[k] - self.lo[k + 1])
+        return index
+
+    def _rows(self):
+        """Return a dict mapping the other coordinates of each non-empty row
+        to the row's bits.
+        """
+        buf = self.bits.to_bytes(self.size // 8, "little")
+        empty = bytes(self.rowbytes)
+        rows = {}
+        ranges = [range(a, a + n) for a, n in zip(self.lo[1:], self.shape[1:])]
+        for index, other in enumerate(itertools.product(*reversed(ranges))):
+            row = buf[index * self.rowbytes : (index + 1) * self.rowbytes]
+            if row != empty:
+                rows[other[::-1]] = int.from_bytes(row, "little")
+        return rows
+
+    def snapshot(self):
+        return self.lo, self.shape, self.bits
+
+    def cells(self):
+        result = set()
+        for other, bits in self._rows().items():
+            while bits:
+                low = bits & -bits
+                result.add((self.lo[0] + low.bit_length() - 1,) + other)
+                bits ^= low
+        return result
+
+    def density(self):
+        if not self.population:
+            return 0.0
+        volume = 1
+        for n, r in zip(self.shape, self.lattice.reach):
+            volume *= n - 2 * r
+        return self.population / volume
+
+    def step(self, rule):
+        full = (1 << self.size) - 1
+        masks = []
+        for v in self.lattice.offsets:
+            delta = sum([a * b for a, b in zip(v, self.strides)])
+            masks.append(
+                self.bits >> delta if delta > 0 else self.bits << -delta & full
+            )
+        planes = add_bits(masks)
+        counters.count("automaton.dense.cells", self.size)
+        born = count_in(planes, rule.born, full)
+        survive = count_in(planes, rule.survive, full)
+        self.bits = (self.bits & survive) | (~self.bits & born & full)
+        self._layout(None, self._rows())
+        return self
+
+
+class GridState:
+    """The live cells of a GridNeighborhood, as a BitGrid."""
+
+    def __init__(self, neighborhood, cells):
+        self.neighborhood = neighborhood
+        universe = neighborhood.universe
+        rows = [0] * universe.height
+        for r, c in cells:
+            rows[r] |= 1 << c
+        self.grid = BitGrid(rows, universe.width)
+
+    @property
+    def population(self):
+        return self.grid.count()
+
+    def snapshot(self):
+        return tuple(self.grid.rows)
+
+    def cells(self):
+        return {
+            (r, c)
+            for r, row in enumerate(self.grid.rows)
+            for c in range(self.grid.width)
+            if row >> c & 1
+        }
+
+    def density(self):
+        return self.population / len(self.neighborhood.table)
+
+    def step(self, rule):
+        hood = self.neighborhood
+        if hood.sight:
+            counts = self.grid.sight_counts(hood.clear)
+        else:
+            counts = self.grid.neighbor_counts()
+        counters.count("automaton.dense.cells", self.grid.width * self.grid.height)
+        mask = self.grid.mask
+        rows = []
+        for cell, live, count in zip(hood.universe.rows, self.grid.rows, counts):
+            survive = live & count_in(count, rule.survive, mask)
+            born = ~live & count_in(count, rule.born, mask)
+            rows.append(cell & (survive | born))
+        self.grid = BitGrid(rows, self.grid.width)
+        return self
+
+
+class Automaton:
+    """Runs a rule over a neighborhood, from the given live cells."""
+
+    def __init__(self, neighborhood, rule, cells=(), density=DENSITY):
+        self.neighborhood = neighborhood
+        self.rule = rule
+        self.threshold = density
+        self.state = SparseState(neighborhood, cells)
+        self.generation = 0
+        self.elapsed = 0.0
+
+    @property
+    def population(self):
+        return self.state.population
+
+    @property
+    def backend(self):
+        return "sparse" if isinstance(self.state, SparseState) else "dense"
+
+    def cells(self):
+        """Return a set of the live cells."""
+        return self.state.cells()
+
+    def step(self):
+        """Advance one generation, first switching backends if the density
+        of the live cells (or use_backend) calls for it.
+        """
+        start = time.perf_counter()
+        if PINNED:
+            wanted = PINNED
+        else:
+            density = self.state.density()
+            wanted = self.backend
+            if self.backend == "sparse" and density >= self.threshold:
+                wanted = "dense"
+            elif self.backend == "dense" and density < self.threshold / 2:
+                wanted = "sparse"
+        if wanted != self.backend:
+            if wanted == "dense":
+                self.state = self.neighborhood.dense(self.state.cells())
+            else:
+                self.state = SparseState(self.neighborhood, self.state.cells())
+        self.state.step(self.rule)
+        self.generation += 1
+        self.elapsed += time.perf_counter() - start
+
+    def run(self, generations=None, progress=None):
+        """Run for the given number of generations, or if None, until the
+        live cells stop changing, reporting each generation to progress (a
+        Progress) if given.  The population is returned.
+        """
+        while generations is None or self.generation < generations:
+            before = self.state.snapshot() if generations is None else None
+            self.step()
+            if progress:
+                progress.update(self.generation)
+            if generations is None and self.state.snapshot() == before:
+                break
+        if progress:
+            progress.finish()
+        return self.population
+
+    @property
+    def rate(self):
+        """Generations per second, so far."""
+        return self.generation / self.elapsed if self.elapsed else 0.0
+
+    def report(self):
+        return (
+            f"{self.generation} generations in {self.elapsed:.3f}s "
+            f"({self.rate:.1f} generations/s, {self.backend} backend)"
+        )
@@ -0,0 +1,187 @@
+"""
+Benchmarks for the expensive solver paths.
+
+A benchmark is prepared once (loading the day module and its input), then
+run a number of times after some warm-up runs.  The median and 95th
+percentile run times are recorded, and can be compared against a stored
+baseline to catch performance regressions.  The parse cache is bypassed,
+so the parses are timed too.
+"""
+
+from dataclasses import dataclass, asdict
+from pathlib import Path
+from typing import Callable
+import json
+import statistics
+import time
+
+from aoc import parsecache
+from aoc.days import ROOT, load_day, load_day_input, quiet_output
+from aoc.generators import generate
+
+BASELINE_FILE = ROOT / "benchmark_baseline.json"
+
+
+@dataclass
+class Benchmark:
+
+    name: str
+    day: int
+    # prepare(module, lines) returns the zero-argument callable to be timed
+    prepare: Callable
+
+
+@dataclass
+class Timing:
+
+    name: str
+    runs: int
+    median: float
+    p95: float
+    min: float
+    max: float
+
+    @classmethod
+    def from_samples(cls, name, samples):
+        samples = sorted(samples)
+        return cls(
+            name,
+            len(samples),
+            statistics.median(samples),
+            percentile(samples, 95),
+            samples[0],
+            samples[-1],
+        )
+
+
+def percentile(samples, pct):
+    """Return the given percentile of a sorted list of samples, using linear
+    interpolation between the closest ranks.
+    """
+    if len(samples) == 1:
+        return samples[0]
+    pos = (len(samples) - 1) * pct / 100
+    lo = int(pos)
+    hi = min(lo + 1, len(samples) - 1)
+    return samples[lo] + (samples[hi] - samples[lo]) * (pos - lo)
+
+
+def _day13_crt_large(module, lines):
+    # a 4000-slot schedule of 1000 prime bus ids: a modulus of ~20,000 digits
+    lines = generate(13, 4000).splitlines()
+    return lambda: module.solve2(lines)
+
+
+def _day13_crt_large_reference(module, lines):
+    # the same schedule, solved with the original crt
+    lines = generate(13, 4000).splitlines()
+    return lambda: module.solve2_reference(lines)
+
+
+def _day15_solve(module, lines):
+    starters = [int(v) for v in lines[0].split(",")]
+    return lambda: module.solve(starters, 30000000)
+
+
+def _day23_solve2(module, lines):
+    return lambda: module.solve2(module.INPUT[0])
+
+
+def _day11_solve2(module, lines):
+    return lambda: module.solve(lines, sight=True)
+
+
+def _day11_propagate2(module, lines):
+    return lambda: module.solve_reference(lines, sight=True)
+
+
+def _day17_solve2(module, lines):
+    return lambda: module.solve2(lines)
+
+
+def _day17_propagate4(module, lines):
+    return lambda: module.solve_reference(lines, dims=4)
+
+
+def _day20_solve2(module, lines):
+    return lambda: module.solve2(lines)
+
+
+def _day24_solve2(module, lines):
+    return lambda: module.solve2(lines)
+
+
+def _day24_propagate_tiles(module, lines):
+    return lambda: module.solve2_reference(lines)
+
+
+def _day25_dlog_large(module, lines):
+    # a 40-bit prime modulus, so each log takes a million baby steps
+    modulus = 1000000000039
+    key = module.transform(3, 123456789012, modulus)
+    return lambda: module.find_loop_size(key, modulus, subject=3)
+
+
+def _day25_brute_force(module, lines):
+    return lambda: module.solve_reference(lines)
+
+
+BENCHMARKS = {
+    bench.name: bench
+    for bench in [
+        Benchmark("day11-solve2", 11, _day11_solve2),
+        Benchmark("day11-propagate2", 11, _day11_propagate2),
+        Benchmark("day13-crt-large", 13, _day13_crt_large),
+        Benchmark("day13-crt-large-reference", 13, _day13_crt_large_reference),
+        Benchmark("day15-solve-30M", 15, _day15_solve),
+        Benchmark("day17-solve2", 17, _day17_solve2),
+        Benchmark("day17-propagate4", 17, _day17_propagate4),
+        Benchmark("day20-solve2", 20, _day20_solve2),
+        Benchmark("day23-solve2", 23, _day23_solve2),
+        Benchmark("day24-solve2", 24, _day24_solve2),
+        Benchmark("day24-propagate-tiles", 24, _day24_propagate_tiles),
+        Benchmark("day25-dlog-large", 25, _day25_dlog_large),
+        Benchmark("day25-brute-force", 25, _day25_brute_force),
+    ]
+}
+
+
+def run_benchmark(bench, repeat=5, warmup=1):
+    """Run the given benchmark, and return its Timing."""
+    module = load_day(bench.day)
+    lines = load_day_input(module)
+    func = bench.prepare(module, lines)
+    samples = []
+    with quiet_output(), parsecache.bypassed():
+        for _ in range(warmup):
+            func()
+        for _ in range(repeat):
+            start = time.perf_counter()
+            func()
+            samples.append(time.perf_counter() - start)
+    return Timing.from_samples(bench.name, samples)
+
+
+def load_baseline(path=BASELINE_FILE):
+    """Return a dict mapping benchmark name to its baseline Timing."""
+    path = Path(path)
+    if not path.exists():
+        return {}
+    data = json.loads(path.read_text())
+    return {name: Timing(**item) for name, item in data.items()}
+
+
+def save_baseline(timings, path=BASELINE_FILE):
+    """Merge the given timings into the baseline file."""
+    baseline = load_baseline(path)
+    for timing in timings:
+        baseline[timing.name] = timing
+    data = {name: asdict(timing) for name, timing in sorted(baseline.items())}
+    Path(path).write_text(json.dumps(data, indent=2) + "\n")
+
+
+def is_regression(timing, base, threshold):
+    """Return True if the timing's median is slower than the baseline median
+    by more than the given fraction.
+    """
+    return timing.median > base.median * (1 + threshold)
@@ -0,0 +1,114 @@
+"""
+On-disk cache of part answers.
+
+An answer is keyed by the day and part, and by hashes of the sources of
+the day module and of the aoc modules it imports, and of its input file,
+so it is reused only while none of them has changed.  Each entry is a
+small JSON file; when the cache grows beyond its size cap, the least
+recently used entries are evicted.
+"""
+
+from dataclasses import asdict
+from pathlib import Path
+import hashlib
+import json
+import os
+
+from aoc.days import ROOT, PartResult, input_path, source_files
+
+CACHE_DIR = ROOT / ".cache" / "results"
+
+MAX_BYTES = 1 << 20
+
+
+def file_hash(path):
+    path = Path(path)
+    if not path.exists():
+        return hashlib.sha256(b"").hexdigest()
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def part_key(day, part):
+    """Return the cache key for one part of the given day, which changes
+    whenever the day's module, an aoc module it uses, or its input file
+    does.
+    """
+    sources = source_files(ROOT / f"day{day}" / f"day{day}.py")
+    source = ",".join(
+        [f"{path.relative_to(ROOT)}={file_hash(path)}" for path in sources]
+    )
+    infile = input_path(day)
+    input_hash = file_hash(infile) if infile else ""
+    text = f"day{day}:{part}:{source}:{input_hash}"
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
+class ResultCache:
+
+    def __init__(self, path=CACHE_DIR, max_bytes=MAX_BYTES):
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+
+    def _entry(self, key):
+        return self.path / f"{key}.json"
+
+    def get(self, key):
+        """Return the cached record for key (a dict), or None."""
+        entry = self._entry(key)
+        try:
+            record = json.loads(entry.read_text())
+        except (OSError, ValueError):
+            return None
+        os.utime(entry)  # mark as recently used
+        return record
+
+    def put(self, key, record):
+        """Store a record (a JSON-serializable dict) under key.  Records
+        that can't be serialized are not cached.
+        """
+        try:
+            text = json.dumps(record)
+        except TypeError:
+            return
+        self.path.mkdir(parents=True, exist_ok=True)
+        tmp = self._entry(key).with_suffix(".tmp")
+        tmp.write_text(text)
+        os.replace(tmp, self._entry(key))
+        self.evict()
+
+    def evict(self):
+        """Remove the least recently used entries until the cache is within
+        its size cap.
+        """
+        entries = []
+        for entry in self.path.glob("*.json"):
+            st = entry.stat()
+            entries.append((st.st_mtime, st.st_size, entry))
+        total = sum([size for _, size, _ in entries])
+        for _, size, entry in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            entry.unlink(missing_ok=True)
+            total -= size
+
+    def get_result(self, day, part):
+        """Return the cached PartResult for the given day and part, or None."""
+        record = self.get(part_key(day, part))
+        if record is None:
+            return None
+        try:
+            return PartResult(**record, cached=True)
+        except TypeError:
+            # written by an older (or newer) PartResult: a miss
+            return None
+
+    def put_result(self, result):
+        """Cache a PartResult, unless it failed."""
+        if result.error is None:
+            record = asdict(result)
+            del record["cached"], record["counts"]
+            self.put(part_key(result.day, result.part), record)
+
+    def clear(self):
+        for entry in self.path.glob("*.json"):
+            entry.unlink(missing_ok=True)
@@ -0,0 +1,138 @@
+"""
+Checkpoint and resume for the long-running simulations.
+
+A simulation keeps a Checkpoint, named for the solver and keyed by its
+parameters (so a checkpoint is only resumed by the same run), and every
+so often saves its state: a small dict of scalars, plus any number of
+arrays (array.array), eg day 15's history table as pairs of ints.  The
+file is a short JSON header followed by the zlib-compressed array data,
+written to a temporary file and renamed into place, so an interrupted
+save leaves the previous checkpoint intact.
+
+    ckpt = checkpoint.Checkpoint("day15.solve", starters, turns)
+    state = ckpt.load()                   # (meta, arrays) if resuming
+    ...
+        if ckpt.due():
+            ckpt.save({"turn": turn}, hist=array("q", ...))
+    ckpt.done()                           # the run finished; remove it
+
+Nothing is saved unless enable() is called (the day scripts' --checkpoint
+and --resume options do this), and load() returns None unless resuming.
+"""
+
+from array import array
+from pathlib import Path
+import itertools
+import json
+import os
+import struct
+import time
+import zlib
+
+from aoc import ROOT
+
+CHECKPOINT_DIR = ROOT / ".cache" / "checkpoints"
+MAGIC = b"AOCCKPT1"
+
+ENABLED = False
+RESUME = False
+INTERVAL = 60.0  # seconds between saves
+
+
+def enable(interval=INTERVAL, resume=False, directory=None):
+    """Turn on checkpointing, saving every interval seconds, and if resume
+    is True, resuming from the existing checkpoints.
+    """
+    global ENABLED, RESUME, INTERVAL, CHECKPOINT_DIR
+    ENABLED = True
+    RESUME = resume
+    INTERVAL = interval
+    if directory:
+        CHECKPOINT_DIR = Path(directory)
+
+
+def write_file(path, meta, arrays):
+    """Write meta (a JSON-able dict) and the named arrays to path."""
+    header = {
+        "meta": meta,
+        "arrays": [[name, arr.typecode, len(arr)] for name, arr in arrays.items()],
+    }
+    data = json.dumps(header).encode()
+    compress = zlib.compressobj(1)
+    tmp = path.with_suffix(f".{os.getpid()}.tmp")
+    with tmp.open("wb") as f:
+        f.write(MAGIC + struct.pack("<I", len(data)) + data)
+        for arr in arrays.values():
+            f.write(compress.compress(arr.tobytes()))
+        f.write(compress.flush())
+    tmp.replace(path)
+
+
+def read_file(path):
+    """Return the (meta, arrays) saved in path by write_file()."""
+    blob = path.read_bytes()
+    if blob[: len(MAGIC)] != MAGIC:
+        raise ValueError(f"{path} is not a checkpoint")
+    start = len(MAGIC) + 4
+    (size,) = struct.unpack("<I", blob[len(MAGIC) : start])
+    header = json.loads(blob[start : start + size])
+    data = zlib.decompress(blob[start + size :])
+    arrays = {}
+    offset = 0
+    for name, typecode, count in header["arrays"]:
+        arr = array(typecode)
+        end = offset + count * arr.itemsize
+        arr.frombytes(data[offset:end])
+        arrays[name] = arr
+        offset = end
+    return header["meta"], arrays
+
+
+def pack_cells(cells, typecode="q"):
+    """Return an array of the coordinates of the given cells, in turn."""
+    return array(typecode, itertools.chain.from_iterable(cells))
+
+
+def unpack_cells(coords, dims):
+    """Return a set of the cells whose coordinates were packed by
+    pack_cells(), for cells of the given number of dimensions.
+    """
+    return set(zip(*[coords[k::dims] for k in range(dims)]))
+
+
+class Checkpoint:
+    """The checkpoint of one run of a simulation."""
+
+    def __init__(self, name, *params):
+        import hashlib  # not needed on the days' start-up path
+
+        key = hashlib.sha256(repr(params).encode()).hexdigest()[:16]
+        self.name = name
+        self.path = CHECKPOINT_DIR / f"{name}-{key}.ckpt"
+        self.last = time.perf_counter()
+
+    @property
+    def enabled(self):
+        return ENABLED
+
+    def due(self):
+        """Return True if it's time to save a checkpoint."""
+        return ENABLED and time.perf_counter() - self.last >= INTERVAL
+
+    def save(self, meta, **arrays):
+        CHECKPOINT_DIR.mkdir(parents=True, exist_ok=True)
+        write_file(self.path, meta, arrays)
+        self.last = time.perf_counter()
+
+    def load(self):
+        """Return the saved (meta, arrays), or None if there's no checkpoint
+        to resume from.
+        """
+        if not RESUME or not self.path.exists():
+            return None
+        return read_file(self.path)
+
+    def done(self):
+        """Remove the checkpoint of a finished run."""
+        if ENABLED:
+            self.path.unlink(missing_ok=True)
@@ -0,0 +1,232 @@
+"""
+Command-line options shared by the daily solution scripts.
+
+A day's __main__ block runs each part through run_part(), which applies
+whatever instrumentation was asked for on the command line, eg
+
+    ./day15.py --profile
+    ./day15.py --sample
+    ./day23.py --memory --memory-budget 200
+    ./day19.py --counters
+    ./day15.py --progress
+    ./day23.py --checkpoint 30 --resume
+    ./day11.py --jsonl results.jsonl
+
+The instrumentation modules (profiling, sampling, memory, results,
+checkpoints) are only imported when their options are given, to keep the
+days' start-up cheap; see import_audit.py.
+
+The command line is only parsed when a day script is the program being
+run.  Hosts that import the day modules (run_all.py, benchmark.py, the
+daemon) have options of their own, so they get the defaults here, and
+enable counters, progress or checkpoints themselves.
+"""
+
+from pathlib import Path
+import argparse
+import functools
+import re
+import sys
+import time
+
+from aoc import counters, progress
+from aoc.inputs import input_hash
+
+# a day's script, or another version of it, eg day19-v1.py
+SCRIPT_RE = re.compile(r"day\d+(-[\w-]+)?$")
+
+
+def running_day_script():
+    """Return True if the program being run (__main__) is a day script."""
+    path = getattr(sys.modules.get("__main__"), "__file__", None)
+    return bool(path and SCRIPT_RE.match(Path(path).stem))
+
+
+@functools.lru_cache(maxsize=None)
+def options():
+    """Parse the shared options from the command line (once), if a day
+    script is being run, or else return their defaults.
+    """
+    parser = argparse.ArgumentParser()
+    profilers = parser.add_mutually_exclusive_group()
+    profilers.add_argument(
+        "--profile",
+        action="store_true",
+        help="Profile each part with cProfile, and write hot-function "
+        "and collapsed-stack reports",
+    )
+    profilers.add_argument(
+        "--sample",
+        action="store_true",
+        help="Profile each part by sampling its stack on a timer, and "
+        "write hot-line and speedscope reports",
+    )
+    parser.add_argument(
+        "--sample-interval",
+        type=float,
+        default=5,
+        metavar="MS",
+        help="CPU time between stack samples (default: %(default)sms)",
+    )
+    parser.add_argument(
+        "--profile-dir",
+        default="profile",
+        help="Directory for profile reports (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--memory",
+        action="store_true",
+        help="Report peak memory and allocation sites for each part",
+    )
+    parser.add_argument(
+        "--memory-budget",
+        type=float,
+        metavar="MB",
+        help="Fail if a part's peak memory exceeds this many MiB " "(implies --memory)",
+    )
+    parser.add_argument(
+        "--counters",
+        action="store_true",
+        help="Report the hot-path event counts for each part, as JSON",
+    )
+    parser.add_argument(
+        "--progress",
+        action="store_true",
+        help="Report the rate and ETA of long loops on stderr",
+    )
+    parser.add_argument(
+        "--status-file",
+        metavar="FILE",
+        help="Write the progress of long loops to FILE, as JSON, "
+        "instead of stderr (implies --progress)",
+    )
+    parser.add_argument(
+        "--checkpoint",
+        type=float,
+        metavar="SECONDS",
+        help="Save the state of long simulations this often",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Resume long simulations from their last checkpoint "
+        "(and keep saving checkpoints)",
+    )
+    parser.add_argument(
+        "--checkpoint-dir",
+        help="Directory for checkpoints (default: .cache/checkpoints)",
+    )
+    parser.add_argument(
+        "--jsonl",
+        metavar="FILE",
+        help="Append a JSON line with the answer and timings of each "
+        "example and part to FILE ('-' for stdout, with the rest of "
+        "the output on stderr)",
+    )
+    return parser.parse_args(sys.argv[1:] if running_day_script() else [])
+
+
+def day_of(func):
+    """Return the day number of the module defining func, or None."""
+    from aoc.days import DAY_RE
+
+    m = DAY_RE.match(Path(func.__code__.co_filename).stem)
+    return int(m.group(1)) if m else None
+
+
+def write_record(kind, func, wall0, cpu0, **fields):
+    """Write the JSON-lines record of an example or part run, if asked to."""
+    opt = options()
+    if not opt.jsonl:
+        return
+    from aoc import results
+
+    day = day_of(func)
+    name = f"day{day}.{func.__name__}" if day else func.__name__
+    rec = results.record(
+        kind,
+        day,
+        results.part_number(func.__name__),
+        name,
+        wall=time.perf_counter() - wall0,
+        cpu=time.process_time() - cpu0,
+        **fields,
+    )
+    results.JsonLines(opt.jsonl).write(rec)
+
+
+def run_example(func, *args):
+    """Run an example of a day's solution (which raises if it fails)."""
+    wall0, cpu0 = time.perf_counter(), time.process_time()
+    try:
+        func(*args)
+    except Exception as exc:
+        write_record("example", func, wall0, cpu0, error=f"{type(exc).__name__}: {exc}")
+        raise
+    write_record("example", func, wall0, cpu0)
+
+
+def run_part(func, *args):
+    """Run one part of a day's solution, and return its result."""
+    opt = options()
+    call = func
+    if opt.profile:
+        from aoc import profiling
+
+        call = functools.partial(profiling.profile_call, func, outdir=opt.profile_dir)
+    elif opt.sample:
+        from aoc import sampling
+
+        call = functools.partial(
+            sampling.sample_call,
+            func,
+            outdir=opt.profile_dir,
+            interval=opt.sample_interval / 1000,
+        )
+    counters.reset()
+    peak = None
+    wall0, cpu0 = time.perf_counter(), time.process_time()
+    if opt.memory or opt.memory_budget is not None:
+        from aoc import memory
+
+        result, report = memory.measure_call(call, *args)
+        peak = report.peak
+        print(f"memory usage of {func.__name__}:")
+        print(memory.format_report(report))
+        if opt.memory_budget is not None:
+            memory.check_budget(report, opt.memory_budget)
+    else:
+        result = call(*args)
+    write_record(
+        "part",
+        func,
+        wall0,
+        cpu0,
+        answer=result,
+        peak=peak,
+        input_hash=input_hash(args[0]) if args else None,
+    )
+    if opt.counters:
+        print(f"counters of {func.__name__}: {counters.dump()}")
+    if opt.profile or opt.sample:
+        print(f"profile of {func.__name__} written to {opt.profile_dir}/")
+    return result
+
+
+if options().jsonl == "-":
+    from aoc import results
+
+    results.to_stderr()
+# Counting must be switched on before the day module defines its functions.
+if options().counters:
+    counters.enable()
+if options().progress or options().status_file:
+    progress.enable(options().status_file)
+if options().checkpoint or options().resume:
+    from aoc import checkpoint
+
+    checkpoint.enable(
+        options().checkpoint or checkpoint.INTERVAL,
+        options().resume,
+        options().checkpoint_dir,
+    )
@@ -0,0 +1,76 @@
+"""
+Named event counters for the solvers' hot paths.
+
+Counting tells apart an optimization that does less work from one that
+does the same work faster.  A solver counts events with
+
+    @counters.counted("day19.match_rule")     # calls to a function
+    def match_rule(...):
+
+    counters.count("automaton.dense.cells", ncells)
+
+Counting is off unless enable() is called before the day module is
+imported (the day scripts' --counters option and run_all.py --counters do
+this).  When it is off, counted() returns the function undecorated, so
+decorated functions cost nothing; count() costs one function call, so it
+belongs outside the innermost loops, counting a whole batch at a time.
+"""
+
+from collections import Counter
+import functools
+import json
+
+ENABLED = False
+
+COUNTS = Counter()
+
+
+def enable(enabled=True):
+    global ENABLED
+    ENABLED = enabled
+
+
+def count(name, n=1):
+    """Add n to the named counter, if counting is enabled."""
+    if ENABLED:
+        COUNTS[name] += n
+
+
+def counted(name):
+    """Decorator counting the calls to a function under the given name.
+    If counting isn't enabled when the function is defined, the function
+    is returned unchanged.
+    """
+
+    def decorator(func):
+        if not ENABLED:
+            return func
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            COUNTS[name] += 1
+            return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def reset():
+    COUNTS.clear()
+
+
+def snapshot():
+    """Return the current counts, as a dict sorted by name."""
+    return dict(sorted(COUNTS.items()))
+
+
+def dump(path=None):
+    """Return the current counts as JSON text, also writing it to path if
+    one is given.
+    """
+    text = json.dumps(snapshot(), indent=2)
+    if path is not None:
+        with open(path, "w") as f:
+            f.write(text + "\n")
+    return text
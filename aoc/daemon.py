@@ -0,0 +1,196 @@
+"""
+A long-lived solver process, serving requests over a Unix domain socket.
+
+The daemon keeps each day module imported and its input loaded, so a
+request to run a part pays only for the part itself.  A module or input
+file is reloaded when its modification time changes, or when one of the
+aoc modules the day uses does (they are reloaded too), so the daemon can
+be left running through an edit-run loop.  Only one daemon can serve on a
+socket.
+
+The protocol is one JSON object per line in each direction.  Requests:
+    {"cmd": "run", "day": 15, "part": 1}    (all parts, if no part is given)
+    {"cmd": "forget", "day": 15}    drop the cached module and input
+    {"cmd": "status"}
+    {"cmd": "stop"}
+Responses are JSON objects with "ok": true, and other fields depending on
+the request; a run request is answered with a list of "results", each
+holding the fields of a PartResult.  A failed request is answered with
+"ok": false and an "error" message.
+"""
+
+from dataclasses import asdict
+from pathlib import Path
+import json
+import os
+import socket
+import socketserver
+import sys
+
+from aoc.days import (
+    PARTS,
+    ROOT,
+    has_part,
+    input_path,
+    load_day,
+    load_day_input,
+    quiet_output,
+    source_files,
+    time_part,
+)
+
+SOCKET_PATH = ROOT / ".cache" / "solverd.sock"
+
+
+class DayCache:
+    """Imported day modules and their loaded inputs, keyed by day."""
+
+    def __init__(self):
+        self.days = {}
+
+    @staticmethod
+    def _mtimes(paths):
+        return {
+            path: path.stat().st_mtime_ns if path.exists() else None for path in paths
+        }
+
+    @staticmethod
+    def _watched(day):
+        """Return the files a day depends on: its module, the aoc modules
+        that imports, and its input file.
+        """
+        paths = source_files(ROOT / f"day{day}" / f"day{day}.py")
+        infile = input_path(day)
+        return paths + [infile] if infile else paths
+
+    def get(self, day):
+        """Return (module, lines) for the given day, loading them if they
+        aren't cached or their files have changed.
+        """
+        cached = self.days.get(day)
+        if cached is None or cached[0] != self._mtimes(cached[0]):
+            if cached and any(
+                path.parent == ROOT / "aoc" and mtime != path.stat().st_mtime_ns
+                for path, mtime in cached[0].items()
+            ):
+                unload_aoc()
+            mtimes = self._mtimes(self._watched(day))
+            module = load_day(day)
+            lines = load_day_input(module)
+            cached = (mtimes, module, lines)
+            self.days[day] = cached
+        _, module, lines = cached
+        return module, lines
+
+    def forget(self, day=None):
+        if day is None:
+            self.days.clear()
+        else:
+            self.days.pop(day, None)
+
+
+def unload_aoc():
+    """Drop the aoc modules from sys.modules, so that the next day module
+    loaded imports them afresh.  (The daemon's own references to them are
+    unaffected.)
+    """
+    for name in list(sys.modules):
+        if name == "aoc" or name.startswith("aoc."):
+            del sys.modules[name]
+
+
+class SolverHandler(socketserver.StreamRequestHandler):
+
+    def handle(self):
+        for line in self.rfile:
+            message = {}
+            try:
+                message = json.loads(line)
+                response = self.server.dispatch(message)
+            except Exception as exc:
+                response = {"ok": False, "error": f"{type(exc).__name__}: {exc}"}
+            self.wfile.write((json.dumps(response, default=str) + "\n").encode())
+            self.wfile.flush()
+            if message.get("cmd") == "stop":
+                self.server.stopping = True
+                break
+
+
+class SolverServer(socketserver.UnixStreamServer):
+    """Serves one connection at a time, since the solvers share module
+    state and are CPU-bound anyway.
+    """
+
+    def __init__(self, path=SOCKET_PATH):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        if self.path.exists():
+            if is_serving(self.path):
+                raise RuntimeError(f"a daemon is already serving on {self.path}")
+            # left behind by a daemon that didn't shut down cleanly
+            self.path.unlink()
+        self.cache = DayCache()
+        self.requests = 0
+        self.stopping = False
+        super().__init__(str(self.path), SolverHandler)
+
+    def dispatch(self, request):
+        cmd = request.get("cmd")
+        self.requests += 1
+        if cmd == "run":
+            day = int(request["day"])
+            results = []
+            with quiet_output():
+                module, lines = self.cache.get(day)
+                if "part" in request:
+                    parts = [int(request["part"])]
+                    if not has_part(module, parts[0]):
+                        raise ValueError(f"day {day} has no part {parts[0]}")
+                else:
+                    parts = [part for part in PARTS if has_part(module, part)]
+                for part in parts:
+                    # hand out a copy, in case a solver modifies its input
+                    part_lines = lines.copy() if lines is not None else None
+                    results.append(asdict(time_part(day, module, part, part_lines)))
+            return {"ok": True, "results": results}
+        if cmd == "forget":
+            self.cache.forget(request.get("day"))
+            return {"ok": True}
+        if cmd == "status":
+            return {
+                "ok": True,
+                "pid": os.getpid(),
+                "requests": self.requests,
+                "days": sorted(self.cache.days),
+            }
+        if cmd == "stop":
+            return {"ok": True}
+        raise ValueError(f"unknown command '{cmd}'")
+
+    def serve(self):
+        try:
+            while not self.stopping:
+                self.handle_request()
+        finally:
+            self.server_close()
+            self.path.unlink(missing_ok=True)
+
+
+def is_serving(path=SOCKET_PATH):
+    """Return True if something accepts connections on the socket."""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        try:
+            sock.connect(str(path))
+        except OSError:
+            return False
+    return True
+
+
+def request(message, path=SOCKET_PATH):
+    """Send one request to the daemon, and return its response."""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(str(path))
+        with sock.makefile("rwb") as stream:
+            stream.write((json.dumps(message) + "\n").encode())
+            stream.flush()
+            return json.loads(stream.readline())
@@ -0,0 +1,211 @@
+"""
+Locate and load the daily solution modules, and run their parts.
+
+Each day lives in dayN/dayN.py.  A day module provides part1() and
+(usually) part2() functions, which return their answer.  They take the
+puzzle input lines returned by the module's load_input(INPUTFILE), unless
+the puzzle input is built into the module (day 23), in which case they
+take no arguments.
+"""
+
+from pathlib import Path
+from dataclasses import dataclass
+from typing import Any, Optional
+import ast
+import contextlib
+import importlib.util
+import inspect
+import os
+import re
+import sys
+import time
+
+from aoc import ROOT, counters
+from aoc.inputs import input_hash
+
+DAY_RE = re.compile(r"day(\d+)$")
+
+PARTS = (1, 2)
+
+
+@dataclass
+class PartResult:
+
+    day: int
+    part: int
+    answer: Any = None
+    wall: float = 0.0
+    cpu: float = 0.0
+    peak: Optional[int] = None
+    error: Optional[str] = None
+    cached: bool = False
+    counts: Optional[dict] = None
+    input_hash: Optional[str] = None
+
+
+def day_paths(days=None):
+    """Return a dict mapping day number to the path of that day's module,
+    for every dayN/dayN.py in the repository (or just the given days).
+    """
+    result = {}
+    for path in ROOT.glob("day*/day*.py"):
+        m = DAY_RE.match(path.stem)
+        if not m or path.parent.name != path.stem:
+            continue
+        day = int(m.group(1))
+        if days is None or day in days:
+            result[day] = path
+    return dict(sorted(result.items()))
+
+
+def load_day(day):
+    """Import and return the solution module for the given day."""
+    path = ROOT / f"day{day}" / f"day{day}.py"
+    if not path.exists():
+        raise ValueError(f"no solution module for day {day}")
+    spec = importlib.util.spec_from_file_location(f"day{day}", path)
+    module = importlib.util.module_from_spec(spec)
+    # registered, so that pickle can find the module's classes
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def load_day_input(module):
+    """Return the puzzle input lines for the given day module, or None if
+    the module has no input file.
+    """
+    if not hasattr(module, "INPUTFILE") or not hasattr(module, "load_input"):
+        return None
+    infile = Path(module.__file__).parent / module.INPUTFILE
+    return module.load_input(infile)
+
+
+def has_part(module, part):
+    return callable(getattr(module, f"part{part}", None))
+
+
+def run_part(module, part, lines=None):
+    """Run one part of a day module, and return its answer."""
+    func = getattr(module, f"part{part}")
+    if inspect.signature(func).parameters:
+        return func(lines)
+    return func()
+
+
+@contextlib.contextmanager
+def quiet_output(enabled=True):
+    """Discard anything printed to stdout within the context, if enabled."""
+    if not enabled:
+        yield
+        return
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        yield
+
+
+def timed_part(day, part, quiet=True, trace_memory=False, count_events=False):
+    """Load the given day, run one part, and return a PartResult with the
+    answer and the wall-clock and CPU time spent in the part.  Input loading
+    is not included in the timings.  The solver's own output is discarded
+    if quiet is True.  If trace_memory is True, the part's peak memory is
+    recorded too (which slows it down considerably).  If count_events is
+    True, the part's hot-path event counts are recorded too.
+    """
+    if count_events:
+        counters.enable()
+    with quiet_output(quiet):
+        try:
+            module = load_day(day)
+            lines = load_day_input(module)
+        except Exception as exc:
+            return PartResult(day, part, error=f"{type(exc).__name__}: {exc}")
+        return time_part(day, module, part, lines, trace_memory)
+
+
+def time_part(day, module, part, lines, trace_memory=False):
+    """Run one part of an already loaded day module on the given input, and
+    return a PartResult, as for timed_part().
+    """
+    result = PartResult(day, part, input_hash=input_hash(lines))
+    counters.reset()
+    try:
+        wall0, cpu0 = time.perf_counter(), time.process_time()
+        if trace_memory:
+            from aoc import memory
+
+            result.answer, report = memory.measure_call(run_part, module, part, lines)
+            result.peak = report.peak
+        else:
+            result.answer = run_part(module, part, lines)
+        result.wall = time.perf_counter() - wall0
+        result.cpu = time.process_time() - cpu0
+    except Exception as exc:
+        result.error = f"{type(exc).__name__}: {exc}"
+    if counters.ENABLED:
+        result.counts = counters.snapshot()
+    return result
+
+
+def _parsed(path):
+    return ast.parse(Path(path).read_text(), str(path))
+
+
+def source_files(path):
+    """Return the sorted source files the given module depends on: itself,
+    and the aoc modules it imports, directly or through each other.  Imports
+    made inside functions count too.
+    """
+    package = ROOT / "aoc"
+    seen = set()
+    pending = [Path(path)]
+    while pending:
+        path = pending.pop()
+        if path in seen or not path.exists():
+            continue
+        seen.add(path)
+        for node in ast.walk(_parsed(path)):
+            if isinstance(node, ast.Import):
+                names = [alias.name for alias in node.names]
+            elif isinstance(node, ast.ImportFrom) and node.module:
+                names = [node.module] + [
+                    f"{node.module}.{alias.name}" for alias in node.names
+                ]
+            else:
+                continue
+            for name in names:
+                parts = name.split(".")
+                if parts[0] != "aoc":
+                    continue
+                pending.append(package / "__init__.py")
+                if len(parts) > 1:
+                    pending.append(package / f"{parts[1]}.py")
+    return sorted(seen)
+
+
+def input_path(day):
+    """Return the path of the given day's puzzle input, as named by its
+    module's INPUTFILE (read from the source, without importing it), or
+    None if it has none.
+    """
+    path = ROOT / f"day{day}" / f"day{day}.py"
+    for node in _parsed(path).body:
+        if (
+            isinstance(node, ast.Assign)
+            and isinstance(node.value, ast.Constant)
+            and any(
+                isinstance(t, ast.Name) and t.id == "INPUTFILE" for t in node.targets
+            )
+        ):
+            return path.parent / node.value.value
+    return None
+
+
+def day_parts(days=None):
+    """Return a list of (day, part) tuples for every part that is implemented
+    by the given days (or all days).
+    """
+    result = []
+    for day in day_paths(days):
+        module = load_day(day)
+        result.extend([(day, part) for part in PARTS if has_part(module, part)])
+    return result
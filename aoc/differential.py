@@ -0,0 +1,356 @@
+"""
+Differential checks of the alternative solver backends against each other.
+
+A Check computes one answer of a day in several ways: its backends.  The
+first backend is the reference (the day's own solve or solve2, or for the
+days ported to the automaton or to aoc.numtheory, the original solver
+kept alongside it), and the others -- the chunked map-reduce solvers, the
+automaton's automatic, sparse and dense backends, the numtheory solvers,
+older versions of a day's script -- must give the same answer on every
+input: the day's samples, a generated input and the puzzle input.  Each
+backend is timed too, so the report shows its speedup over the reference
+alongside, with the parse cache bypassed.
+"""
+
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Optional
+import importlib.util
+import math
+import tempfile
+import time
+
+from aoc import ROOT, automaton, numtheory, parsecache
+from aoc.days import load_day, quiet_output
+from aoc.generators import generate
+
+
+@dataclass
+class Backend:
+
+    name: str
+    # run(module, case) returns the answer
+    run: Callable
+
+
+@dataclass
+class Check:
+
+    name: str
+    day: int
+    backends: list  # the first is the reference
+    size: int  # of the generated input
+    # samples(module) returns the texts of the day's sample inputs
+    samples: Optional[Callable] = None
+
+
+@dataclass
+class Case:
+
+    label: str
+    path: Path  # for the backends that read the file themselves
+    lines: list
+
+
+@dataclass
+class Outcome:
+
+    case: str
+    answers: dict = field(default_factory=dict)  # backend name -> answer
+    times: dict = field(default_factory=dict)  # backend name -> seconds
+    errors: dict = field(default_factory=dict)  # backend name -> message
+
+    @property
+    def agrees(self):
+        return not self.errors and len({repr(a) for a in self.answers.values()}) == 1
+
+
+def load_script(day, name):
+    """Import and return another script in a day's directory, eg
+    load_script(19, "day19-v1").
+    """
+    path = ROOT / f"day{day}" / f"{name}.py"
+    spec = importlib.util.spec_from_file_location(name.replace("-", "_"), path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+# Backends
+
+
+def _call(name, *args, **kwargs):
+    """Backend calling the day module's function name on the input lines."""
+    return lambda module, case: getattr(module, name)(case.lines, *args, **kwargs)
+
+
+def _call_file(name):
+    """Backend calling the day module's function name on the input file."""
+    return lambda module, case: getattr(module, name)(case.path)
+
+
+def _script(day, script, name):
+    """Backend calling function name of another script of the day."""
+    return lambda module, case: getattr(load_script(day, script), name)(case.lines)
+
+
+def _pinned(backend, name, *args, **kwargs):
+    """Backend calling the day module's function name with every automaton
+    pinned to the given backend.
+    """
+
+    def run(module, case):
+        automaton.use_backend(backend)
+        try:
+            return getattr(module, name)(case.lines, *args, **kwargs)
+        finally:
+            automaton.use_backend(None)
+
+    return run
+
+
+def _automaton_backends(reference, name, *args, **kwargs):
+    """Backends for a day ported to the automaton: the original solver
+    (the reference), then the day's solver with each automaton backend.
+    """
+    return [reference, Backend("auto", _call(name, *args, **kwargs))] + [
+        Backend(backend, _pinned(backend, name, *args, **kwargs))
+        for backend in automaton.BACKENDS
+    ]
+
+
+def _chunked_backends(part, reference):
+    suffix = "" if part == 1 else "2"
+    return [
+        Backend("solve" + suffix, reference),
+        Backend(f"solve{suffix}_file", _call_file(f"solve{suffix}_file")),
+    ]
+
+
+def _day2_solve(validator):
+    return lambda module, case: module.solve(case.lines, getattr(module, validator))
+
+
+def _day13_crt_fold(module, case):
+    return numtheory.crt([(n, -pos) for n, pos in module.parse_input2(case.lines)])[1]
+
+
+def _day18_conventional(module, case):
+    # evaluate.py gives * the higher precedence, as in ordinary arithmetic
+    prec = {module.LPAREN: 0, module.PLUS: 1, module.TIMES: 2}
+    return module.sum_values(case.lines, prec)
+
+
+def _day18_evaluate_py(module, case):
+    evaluate = load_script(18, "evaluate").evaluate
+    return sum([evaluate(line) for line in case.lines])
+
+
+# Samples
+
+
+def _texts(*names):
+    return lambda module: [getattr(module, name) for name in names]
+
+
+def _day2_samples(module):
+    return ["\n".join(module.sample_input())]
+
+
+def _day18_samples(module):
+    return ["\n".join(expr for expr, _ in module.SAMPLE_CASES)]
+
+
+def _checks():
+    checks = []
+    for day, samples in [
+        (2, _day2_samples),
+        (4, _texts("SAMPLE_TEXT")),
+        (5, None),
+        (6, _texts("SAMPLE_TEXT")),
+    ]:
+        for part in (1, 2):
+            if day == 2:
+                reference = _day2_solve("is_valid" if part == 1 else "is_valid2")
+            else:
+                reference = _call("solve" if part == 1 else "solve2")
+            # day 5's sample boarding passes have no missing seat to find
+            checks.append(
+                Check(
+                    f"day{day}-part{part}",
+                    day,
+                    _chunked_backends(part, reference),
+                    10000,
+                    samples if (day, part) != (5, 2) else None,
+                )
+            )
+    checks += [
+        Check(
+            "day11-part1",
+            11,
+            _automaton_backends(
+                Backend("propagate", _call("solve_reference")), "solve"
+            ),
+            40,
+            _texts("SAMPLE_INPUT"),
+        ),
+        Check(
+            "day11-part2",
+            11,
+            _automaton_backends(
+                Backend("propagate2", _call("solve_reference", sight=True)),
+                "solve",
+                sight=True,
+            ),
+            40,
+            _texts("SAMPLE_INPUT"),
+        ),
+        Check(
+            "day13-part2",
+            13,
+            [
+                Backend("crt", _call("solve2_reference")),
+                Backend("crt_tree", _call("solve2")),
+                Backend("numtheory.crt", _day13_crt_fold),
+            ],
+            2000,
+            _texts("SAMPLE_INPUT"),
+        ),
+        Check(
+            "day17-part1",
+            17,
+            _automaton_backends(
+                Backend("propagate", _call("solve_reference")), "solve"
+            ),
+            8,
+            _texts("SAMPLE_INPUT"),
+        ),
+        Check(
+            "day17-part2",
+            17,
+            _automaton_backends(
+                Backend("propagate4", _call("solve_reference", dims=4)), "solve2"
+            ),
+            8,
+            _texts("SAMPLE_INPUT"),
+        ),
+        Check(
+            "day18-part1",
+            18,
+            _chunked_backends(1, _call("sum_values")),
+            10000,
+            _day18_samples,
+        ),
+        Check(
+            "day18-part2",
+            18,
+            _chunked_backends(
+                2, lambda module, case: module.sum_values(case.lines, module.PREC2)
+            ),
+            10000,
+            _day18_samples,
+        ),
+        Check(
+            "day18-conventional",
+            18,
+            [
+                Backend("day18", _day18_conventional),
+                Backend("evaluate.py", _day18_evaluate_py),
+            ],
+            10000,
+            _day18_samples,
+        ),
+        Check(
+            "day19-part1",
+            19,
+            [
+                Backend("solve", _call("solve")),
+                Backend("day19-v1", _script(19, "day19-v1", "solve")),
+                Backend("solve_file", _call_file("solve_file")),
+            ],
+            200,
+            _texts("SAMPLE_INPUT", "SAMPLE_INPUT2"),
+        ),
+        # day19-v1's matcher takes the first alternative that matches, and
+        # can't backtrack into the looping rules, so it isn't a part 2 backend
+        Check(
+            "day19-part2",
+            19,
+            [
+                Backend("solve2", _call("solve2")),
+                Backend("solve2_file", _call_file("solve2_file")),
+            ],
+            200,
+            _texts("SAMPLE_INPUT2"),
+        ),
+        Check(
+            "day24-part2",
+            24,
+            _automaton_backends(
+                Backend("propagate_tiles", _call("solve2_reference")), "solve2"
+            ),
+            300,
+            _texts("SAMPLE_INPUT"),
+        ),
+        Check(
+            "day25-part1",
+            25,
+            [
+                Backend("brute_force", _call("solve_reference")),
+                Backend("dlog", _call("solve")),
+            ],
+            100000,
+            _texts("SAMPLE_INPUT"),
+        ),
+    ]
+    return {check.name: check for check in checks}
+
+
+CHECKS = _checks()
+
+
+def cases(check, module, tmpdir, puzzle_input=True):
+    """Generate the Cases of a check: the day's samples, a generated input
+    and the puzzle input.
+    """
+    texts = []
+    if check.samples:
+        samples = check.samples(module)
+        texts += [
+            (f"sample{i}" if len(samples) > 1 else "sample", text)
+            for i, text in enumerate(samples, 1)
+        ]
+    texts.append((f"generated-{check.size}", generate(check.day, check.size)))
+    for label, text in texts:
+        path = Path(tmpdir) / f"{check.name}-{label}.txt"
+        path.write_text(text.strip("\n") + "\n")
+        yield Case(label, path, module.load_input(path))
+    path = ROOT / f"day{check.day}" / module.INPUTFILE
+    if puzzle_input and path.exists():
+        yield Case("input", path, module.load_input(path))
+
+
+def run_check(check, repeat=1, puzzle_input=True):
+    """Run every backend of the check on each of its cases, and return the
+    Outcomes.  Each time is the fastest of repeat runs.
+    """
+    module = load_day(check.day)
+    outcomes = []
+    with tempfile.TemporaryDirectory(prefix="aoc-diff-") as tmpdir:
+        for case in cases(check, module, tmpdir, puzzle_input):
+            outcome = Outcome(case.label)
+            for backend in check.backends:
+                best = math.inf
+                try:
+                    with quiet_output(), parsecache.bypassed():
+                        for _ in range(repeat):
+                            start = time.perf_counter()
+                            answer = backend.run(module, case)
+                            best = min(best, time.perf_counter() - start)
+                except Exception as exc:
+                    outcome.errors[backend.name] = f"{type(exc).__name__}: {exc}"
+                    continue
+                outcome.answers[backend.name] = answer
+                outcome.times[backend.name] = best
+            outcomes.append(outcome)
+    return outcomes
@@ -0,0 +1,687 @@
+"""
+Seeded generators of synthetic puzzle inputs, at arbitrary scale.
+
+Each generator takes a size and a random.Random instance, and returns the
+text of a valid input for that day's puzzle, with the answers guaranteed
+to exist (eg a pair of entries summing to 2020 for day 1, a single fixable
+instruction for day 8, a consistent jigsaw for day 20).  What "size"
+counts differs from day to day, and is given in each generator's
+docstring.  The same day, size and seed always produce the same text.
+"""
+
+import itertools
+import math
+import random
+import string
+
+from aoc.days import ROOT
+
+GENERATED_DIR = ROOT / ".cache" / "generated"
+
+CONSONANTS = "bcdfghjklmnprstvwz"
+VOWELS = "aeiou"
+
+
+def word(n):
+    """Return a pronounceable lowercase word that is unique to n."""
+    syllables = []
+    while True:
+        n, rem = divmod(n, len(CONSONANTS) * len(VOWELS))
+        syllables.append(CONSONANTS[rem // len(VOWELS)] + VOWELS[rem % len(VOWELS)])
+        if n == 0:
+            break
+        n -= 1
+    return "".join(syllables)
+
+
+def words(count, rng):
+    """Return a list of count distinct words, in random order."""
+    result = [word(n) for n in range(count)]
+    rng.shuffle(result)
+    return result
+
+
+def primes(count):
+    """Return the first count primes."""
+    result = []
+    candidate = 2
+    while len(result) < count:
+        if all(candidate % p for p in result if p * p <= candidate):
+            result.append(candidate)
+        candidate += 1
+    return result
+
+
+def join_lines(lines):
+    return "\n".join(lines) + "\n"
+
+
+# Days 1 - 5
+
+
+def gen_day1(size, rng):
+    """size: number of expense report entries."""
+    size = max(size, 5)
+    while True:
+        a = rng.randint(1, 1000)
+        b, c = rng.randint(1, 600), rng.randint(1, 600)
+        planted = [a, 2020 - a, b, c, 2020 - b - c]
+        pairs = [p for p in itertools.combinations(planted, 2) if sum(p) == 2020]
+        triples = [t for t in itertools.combinations(planted, 3) if sum(t) == 2020]
+        if len(set(planted)) == 5 and len(pairs) == 1 and len(triples) == 1:
+            break
+    # the rest are above 1010, so no two or three of them can add up to
+    # 2020, and they leave out the values that would with the planted ones
+    forbidden = {2020 - x for x in planted}
+    forbidden |= {2020 - x - y for x, y in itertools.combinations(planted, 2)}
+    filler = [v for v in range(1011, 2000) if v not in forbidden]
+    entries = planted + [rng.choice(filler) for _ in range(size - len(planted))]
+    rng.shuffle(entries)
+    return join_lines([str(v) for v in entries])
+
+
+def gen_day2(size, rng):
+    """size: number of password lines."""
+    lines = []
+    for _ in range(size):
+        lo = rng.randint(1, 8)
+        hi = rng.randint(lo + 1, 16)
+        ch = rng.choice(string.ascii_lowercase)
+        length = rng.randint(hi, hi + 8)
+        pool = ch * 4 + string.ascii_lowercase
+        password = "".join(rng.choice(pool) for _ in range(length))
+        lines.append(f"{lo}-{hi} {ch}: {password}")
+    return join_lines(lines)
+
+
+def gen_day3(size, rng):
+    """size: number of rows in the map (which is 31 columns wide)."""
+    lines = [
+        "".join("#" if rng.random() < 0.2 else "." for _ in range(31))
+        for _ in range(size)
+    ]
+    return join_lines(lines)
+
+
+def gen_day4(size, rng):
+    """size: number of passports."""
+    eye_colors = ["amb", "blu", "brn", "gry", "grn", "hzl", "oth"]
+    valid_values = {
+        "byr": lambda: str(rng.randint(1920, 2002)),
+        "iyr": lambda: str(rng.randint(2010, 2020)),
+        "eyr": lambda: str(rng.randint(2020, 2030)),
+        "hgt": lambda: rng.choice(
+            [f"{rng.randint(150, 193)}cm", f"{rng.randint(59, 76)}in"]
+        ),
+        "hcl": lambda: "#" + "".join(rng.choice("0123456789abcdef") for _ in range(6)),
+        "ecl": lambda: rng.choice(eye_colors),
+        "pid": lambda: f"{rng.randint(0, 999999999):09d}",
+        "cid": lambda: str(rng.randint(100, 350)),
+    }
+    invalid_values = {
+        "byr": lambda: str(rng.randint(1800, 1919)),
+        "iyr": lambda: str(rng.randint(2021, 2030)),
+        "eyr": lambda: str(rng.randint(1990, 2019)),
+        "hgt": lambda: str(rng.randint(50, 200)),
+        "hcl": lambda: "".join(rng.choice("0123456789abcdef") for _ in range(6)),
+        "ecl": lambda: rng.choice(["xry", "zzz", "lzr"]),
+        "pid": lambda: str(rng.randint(10**9, 10**10)),
+        "cid": lambda: str(rng.randint(100, 350)),
+    }
+    lines = []
+    for _ in range(size):
+        fields = []
+        for key in valid_values:
+            if rng.random() < 0.05:
+                continue
+            if rng.random() < 0.05:
+                fields.append(f"{key}:{invalid_values[key]()}")
+            else:
+                fields.append(f"{key}:{valid_values[key]()}")
+        rng.shuffle(fields)
+        while fields:
+            count = rng.randint(1, 4)
+            lines.append(" ".join(fields[:count]))
+            fields = fields[count:]
+        lines.append("")
+    return join_lines(lines)
+
+
+def gen_day5(size, rng):
+    """size: number of boarding passes (at most 1022, since there are only
+    1024 seats).
+    """
+    size = max(3, min(size, 1022))
+    start = rng.randint(1, 1023 - size)
+    seats = list(range(start, start + size + 1))
+    seats.remove(rng.choice(seats[1:-1]))
+    rng.shuffle(seats)
+    lines = []
+    for seat in seats:
+        bits = f"{seat:010b}"
+        lines.append(
+            bits[:7].replace("0", "F").replace("1", "B")
+            + bits[7:].replace("0", "L").replace("1", "R")
+        )
+    return join_lines(lines)
+
+
+# Days 6 - 10
+
+
+def gen_day6(size, rng):
+    """size: number of groups."""
+    lines = []
+    for _ in range(size):
+        common = rng.sample(string.ascii_lowercase, rng.randint(0, 5))
+        for _ in range(rng.randint(1, 5)):
+            extra = rng.sample(string.ascii_lowercase, rng.randint(0, 4))
+            answers = set(common) | set(extra) or {"a"}
+            lines.append("".join(rng.sample(sorted(answers), len(answers))))
+        lines.append("")
+    return join_lines(lines)
+
+
+def gen_day7(size, rng, levels=6, containers=None):
+    """size: number of bag rules.  The rules form a layered DAG, so the
+    nesting depth stays at most levels.  If containers is given, that many
+    bags of the layer above shiny gold (or all of them) directly contain it.
+    """
+    size = max(size, levels * 2)
+    names = []
+    for i in itertools.count():
+        name = f"{word(i // 50)} {word(i % 50 + 1000)}"
+        if name != "shiny gold":
+            names.append(name)
+        if len(names) == size - 1:
+            break
+    rng.shuffle(names)
+    names.insert(size * (levels // 2) // levels + 1, "shiny gold")
+    bounds = [size * k // levels for k in range(levels + 1)]
+    layers = [names[bounds[k] : bounds[k + 1]] for k in range(levels)]
+    holders = set()
+    if containers:
+        above = next(k for k, layer in enumerate(layers) if "shiny gold" in layer) - 1
+        if above >= 0:
+            holders = set(
+                rng.sample(layers[above], min(containers, len(layers[above])))
+            )
+
+    lines = []
+    for k, layer in enumerate(layers):
+        for name in layer:
+            if k == levels - 1 or (
+                name != "shiny gold" and name not in holders and rng.random() < 0.1
+            ):
+                lines.append(f"{name} bags contain no other bags.")
+                continue
+            inners = rng.sample(
+                layers[k + 1], min(len(layers[k + 1]), rng.randint(1, 4))
+            )
+            if name in holders and "shiny gold" not in inners:
+                inners[0] = "shiny gold"
+            contents = []
+            for inner in inners:
+                count = rng.randint(1, 5)
+                contents.append(f"{count} {inner} {'bag' if count == 1 else 'bags'}")
+            lines.append(f"{name} bags contain {', '.join(contents)}.")
+    rng.shuffle(lines)
+    return join_lines(lines)
+
+
+def gen_day8(size, rng):
+    """size: number of instructions.  The program loops because of a single
+    backward jump, and changing that jmp to a nop is the only fix: before
+    it, no jump or nop could skip past it, and after it, all jumps are
+    forward.
+    """
+    size = max(size, 4)
+    loop_at = rng.randint(size // 2, size - 2)
+    prog = []
+    for pc in range(size):
+        if pc == loop_at:
+            prog.append(("jmp", -rng.randint(1, pc)))
+            continue
+        limit = loop_at if pc < loop_at else size
+        ins = rng.choices(["acc", "jmp", "nop"], [5, 2, 2])[0]
+        if ins == "acc":
+            prog.append(("acc", rng.randint(-99, 99)))
+        elif ins == "jmp":
+            prog.append(("jmp", rng.randint(1, max(1, min(5, limit - pc)))))
+        else:
+            # a nop converted to a jmp must not skip past the loop either
+            prog.append(("nop", rng.randint(-min(pc, 5), max(0, min(5, limit - pc)))))
+    return join_lines([f"{ins} {val:+d}" for ins, val in prog])
+
+
+def gen_day9(size, rng, prefix=25, run=None):
+    """size: number of numbers.  Each number is the sum of two of the
+    preceding prefix numbers, except for one near the end, which is the sum
+    of a contiguous run of earlier numbers: run of them if given, or three
+    to six.  Since the numbers must keep growing, they get very long for
+    large sizes.
+    """
+    size = max(size, prefix + 10, run + 2 * prefix if run else 0)
+    seq = sorted(rng.sample(range(1, 100), prefix))
+    while len(seq) < size - 1:
+        window = sorted(seq[-prefix:])
+        a, b = rng.sample(window[:6], 2)
+        seq.append(a + b)
+    while True:
+        start = rng.randint(0, prefix)
+        target = sum(seq[start : start + (run or rng.randint(3, 6))])
+        window = seq[-prefix:]
+        if all(a + b != target for a, b in itertools.combinations(window, 2)):
+            break
+    seq.append(target)
+    return join_lines([str(v) for v in seq])
+
+
+def gen_day10(size, rng):
+    """size: number of adapters."""
+    jolts = []
+    jolt = 0
+    for _ in range(size):
+        jolt += rng.choice([1, 1, 1, 3])
+        jolts.append(jolt)
+    rng.shuffle(jolts)
+    return join_lines([str(v) for v in jolts])
+
+
+# Days 11 - 15
+
+
+def gen_day11(size, rng):
+    """size: side length of the (square) seating area."""
+    lines = [
+        "".join("L" if rng.random() < 0.85 else "." for _ in range(size))
+        for _ in range(size)
+    ]
+    return join_lines(lines)
+
+
+def gen_day12(size, rng):
+    """size: number of navigation instructions."""
+    lines = []
+    for _ in range(size):
+        cmd = rng.choice("NSEWLRFF")
+        if cmd in "LR":
+            lines.append(f"{cmd}{rng.choice([90, 180, 270])}")
+        else:
+            lines.append(f"{cmd}{rng.randint(1, 99)}")
+    return join_lines(lines)
+
+
+def gen_day13(size, rng):
+    """size: number of slots in the bus schedule.  The buses have distinct
+    prime ids, so the schedule always has a solution.
+    """
+    size = max(size, 2)
+    count = max(2, size // 4)
+    ids = rng.sample(primes(count * 3)[3:], count)
+    slots = ["x"] * size
+    slots[0] = str(ids[0])
+    for bus_id, pos in zip(ids[1:], rng.sample(range(1, size), count - 1)):
+        slots[pos] = str(bus_id)
+    depart = rng.randint(10**5, 10**6)
+    while any(depart % bus_id == 0 for bus_id in ids):
+        depart += 1
+    return join_lines([str(depart), ",".join(slots)])
+
+
+def gen_day14(size, rng, max_floating=6):
+    """size: number of program lines.  Masks have at most max_floating X
+    bits, to bound the number of addresses written in part 2.
+    """
+    lines = []
+    while len(lines) < size:
+        mask = [rng.choice("01") for _ in range(36)]
+        for pos in rng.sample(range(36), rng.randint(1, max_floating)):
+            mask[pos] = "X"
+        lines.append(f"mask = {''.join(mask)}")
+        for _ in range(rng.randint(1, 6)):
+            lines.append(f"mem[{rng.randint(0, 65535)}] = {rng.randint(0, 2**36 - 1)}")
+    return join_lines(lines[:size])
+
+
+def gen_day15(size, rng):
+    """size: number of starting numbers."""
+    starters = rng.sample(range(max(20, size * 2)), max(size, 1))
+    return join_lines([",".join(str(v) for v in starters)])
+
+
+# Days 16 - 20
+
+
+def gen_day16(size, rng, fields=20):
+    """size: number of nearby tickets.  Field k accepts values up to
+    100*(k+1), and its column only holds values above 100*k, so the fields
+    can be assigned to columns by elimination.
+    """
+    fields = max(fields, 6)
+    names = [f"departure {w}" for w in words(6, rng)]
+    names += [
+        f"{w} {w2}"
+        for w, w2 in zip(words(fields - 6, rng), words(fields + 10, rng)[10:])
+    ]
+    rules = []
+    for k, name in enumerate(names):
+        mid = 50 * (k + 1)
+        rules.append(f"{name}: 1-{mid} or {mid + 1}-{100 * (k + 1)}")
+    rng.shuffle(rules)
+    column_field = rng.sample(range(fields), fields)
+
+    def ticket(invalid=False):
+        values = [rng.randint(100 * k + 1, 100 * (k + 1)) for k in column_field]
+        if invalid:
+            values[rng.randrange(fields)] = rng.randint(
+                100 * fields + 1, 100 * fields + 999
+            )
+        return ",".join(str(v) for v in values)
+
+    lines = rules + ["", "your ticket:", ticket(), "", "nearby tickets:"]
+    lines += [ticket(invalid=rng.random() < 0.25) for _ in range(max(size, 1))]
+    return join_lines(lines)
+
+
+def gen_day17(size, rng):
+    """size: side length of the initial (square) slice."""
+    lines = [
+        "".join("#" if rng.random() < 0.4 else "." for _ in range(size))
+        for _ in range(size)
+    ]
+    return join_lines(lines)
+
+
+def gen_day18(size, rng, max_depth=3, terms=None, ops="+*"):
+    """size: number of expressions.  Each has terms top-level terms if given,
+    or two to five, joined by operators drawn from ops.
+    """
+    top_terms = terms
+
+    def expression(depth):
+        terms = []
+        count = top_terms if depth == 0 and top_terms else rng.randint(2, 5)
+        for _ in range(count):
+            if depth < max_depth and rng.random() < 0.25:
+                terms.append(f"({expression(depth + 1)})")
+            else:
+                terms.append(str(rng.randint(1, 9)))
+        result = terms[0]
+        for term in terms[1:]:
+            result += f" {rng.choice(ops)} {term}"
+        return result
+
+    return join_lines([expression(0) for _ in range(size)])
+
+
+def gen_day19(size, rng, levels=3, width=5):
+    """size: number of messages.  The rules follow the real puzzle's shape
+    (0: 8 11, 8: 42, 11: 42 31), with rules 42 and 31 built from levels of
+    two-way alternations.  Every alternative of a rule matches strings of
+    the same length, and 42 and 31 start with different characters.
+    About a third of the messages are valid for part 1, another third only
+    for part 2, and the rest are random.
+    """
+    ids = iter(rng.sample(range(1, 200), 150))
+    reserved = {0, 8, 11, 31, 42}
+
+    def new_id():
+        for rule_id in ids:
+            if rule_id not in reserved:
+                return rule_id
+
+    rules = {}
+    leaf_a, leaf_b = new_id(), new_id()
+    rules[leaf_a] = '"a"'
+    rules[leaf_b] = '"b"'
+    below = [leaf_a, leaf_b]
+    for _ in range(levels):
+        layer = []
+        for _ in range(width):
+            rule_id = new_id()
+            alts = [f"{rng.choice(below)} {rng.choice(below)}" for _ in range(2)]
+            rules[rule_id] = " | ".join(alts)
+            layer.append(rule_id)
+        below = layer
+    rules[42] = f"{leaf_a} {rng.choice(below)}"
+    rules[31] = f"{leaf_b} {rng.choice(below)}"
+    rules[8] = "42"
+    rules[11] = "42 31"
+    rules[0] = "8 11"
+
+    def sample(rule_id):
+        body = rules[rule_id]
+        if body.startswith('"'):
+            return body.strip('"')
+        alt = rng.choice(body.split(" | "))
+        return "".join(sample(int(v)) for v in alt.split())
+
+    messages = []
+    for _ in range(size):
+        kind = rng.randrange(3)
+        if kind == 0:
+            count42, count31 = 2, 1
+        elif kind == 1:
+            count31 = rng.randint(1, 3)
+            count42 = count31 + rng.randint(1, 3)
+        else:
+            length = len(sample(42)) * rng.randint(2, 5)
+            messages.append("".join(rng.choice("ab") for _ in range(length)))
+            continue
+        messages.append(
+            "".join(
+                [sample(42) for _ in range(count42)]
+                + [sample(31) for _ in range(count31)]
+            )
+        )
+
+    lines = [f"{rule_id}: {body}" for rule_id, body in rules.items()]
+    rng.shuffle(lines)
+    return join_lines(lines + [""] + messages)
+
+
+def gen_day20(size, rng):
+    """size: number of tiles, rounded down to a square number (at least 4).
+    The tiles are cut from one random image with shared edges, so they fit
+    together in exactly one way.  Tiles are 10x10 for small puzzles, and
+    grow as needed to keep every edge code unique.  A few sea monsters are
+    hidden in the image.
+    """
+    side = max(2, math.isqrt(size))
+    edge_count = 2 * side * (side + 1)
+    tsize = max(10, math.ceil(math.log2(edge_count * 8)) + 1)
+    step = tsize - 1
+    gsize = side * step + 1
+    grid = [[rng.choice("#.") for _ in range(gsize)] for _ in range(gsize)]
+
+    # plant sea monsters in the image (the tile interiors)
+    monster = ["                  # ", "#    ##    ##    ###", " #  #  #  #  #  #   "]
+    inner = side * (tsize - 2)
+
+    def grid_pos(i):
+        return (i // (tsize - 2)) * step + 1 + i % (tsize - 2)
+
+    if inner >= len(monster[0]):
+        for _ in range(max(1, side * side // 20)):
+            r0 = rng.randrange(inner - len(monster) + 1)
+            c0 = rng.randrange(inner - len(monster[0]) + 1)
+            for dr, row in enumerate(monster):
+                for dc, ch in enumerate(row):
+                    if ch == "#":
+                        grid[grid_pos(r0 + dr)][grid_pos(c0 + dc)] = "#"
+
+    # make every edge code unique, by re-rolling an edge's non-corner pixels
+    def segments():
+        for k in range(side + 1):
+            for j in range(side):
+                yield [(k * step, j * step + i) for i in range(tsize)]
+                yield [(j * step + i, k * step) for i in range(tsize)]
+
+    seen = set()
+    for seg in segments():
+        while True:
+            bits = "".join("1" if grid[r][c] == "#" else "0" for r, c in seg)
+            code = min(int(bits, 2), int(bits[::-1], 2))
+            if code not in seen and bits != bits[::-1]:
+                seen.add(code)
+                break
+            for r, c in seg[1:-1]:
+                grid[r][c] = rng.choice("#.")
+
+    tile_ids = rng.sample(range(1000, 1000 + 10 * side * side), side * side)
+    lines = []
+    for n, tile_id in enumerate(tile_ids):
+        r0, c0 = (n // side) * step, (n % side) * step
+        tile = [row[c0 : c0 + tsize] for row in grid[r0 : r0 + tsize]]
+        for _ in range(rng.randrange(4)):
+            tile = [list(row) for row in zip(*tile[::-1])]
+        if rng.random() < 0.5:
+            tile = [row[::-1] for row in tile]
+        lines.append(f"Tile {tile_id}:")
+        lines.extend("".join(row) for row in tile)
+        lines.append("")
+    return join_lines(lines)
+
+
+# Days 21 - 25
+
+
+def gen_day21(size, rng, allergens=8):
+    """size: number of foods.  Each allergen is in exactly one ingredient,
+    and the foods are re-rolled until the allergens can be assigned by
+    elimination.
+    """
+    size = max(size, allergens * 2)
+    names = words(allergens + size // 2 + 20, rng)
+    allergen_names = names[:allergens]
+    ingredients = names[allergens:]
+    source = dict(zip(allergen_names, rng.sample(ingredients, allergens)))
+    safe = [v for v in ingredients if v not in source.values()]
+
+    while True:
+        foods = []
+        for _ in range(size):
+            listed = rng.sample(allergen_names, rng.randint(1, 3))
+            items = {source[a] for a in listed}
+            items |= set(rng.sample(safe, rng.randint(2, 8)))
+            if rng.random() < 0.3:
+                items.add(source[rng.choice(allergen_names)])
+            foods.append((rng.sample(sorted(items), len(items)), listed))
+        if _assignable(foods):
+            break
+
+    lines = [
+        f"{' '.join(items)} (contains {', '.join(listed)})" for items, listed in foods
+    ]
+    return join_lines(lines)
+
+
+def _assignable(foods):
+    candidates = {}
+    for items, listed in foods:
+        for allergen in listed:
+            candidates[allergen] = candidates.get(allergen, set(items)) & set(items)
+    assigned = set()
+    while len(assigned) < len(candidates):
+        done = {next(iter(v)) for v in candidates.values() if len(v) == 1}
+        if done <= assigned:
+            return False
+        assigned |= done
+        for allergen, items in candidates.items():
+            if len(items) > 1:
+                items -= assigned
+    return True
+
+
+def gen_day22(size, rng):
+    """size: number of cards in each player's deck."""
+    cards = rng.sample(range(1, 2 * size + 1), 2 * size)
+    lines = ["Player 1:"] + [str(v) for v in cards[:size]]
+    lines += ["", "Player 2:"] + [str(v) for v in cards[size:]]
+    return join_lines(lines)
+
+
+def gen_day23(size, rng):
+    """size is ignored: the cup labels are single digits, so the input is
+    always an ordering of the nine cups.  (Day 23 scales through its number
+    of cups and moves instead.)
+    """
+    return join_lines(["".join(rng.sample("123456789", 9))])
+
+
+def gen_day24(size, rng, steps=None):
+    """size: number of tile paths, each of steps steps if given, or ten to
+    twenty.
+    """
+    moves = ["e", "se", "sw", "w", "nw", "ne"]
+    lines = [
+        "".join(rng.choice(moves) for _ in range(steps or rng.randint(10, 20)))
+        for _ in range(size)
+    ]
+    return join_lines(lines)
+
+
+def gen_day25(size, rng, modulus=20201227, subject=7):
+    """size: largest loop size for the card and door keys."""
+    size = max(size, 2)
+    loops = [rng.randint(max(1, size // 2), size) for _ in range(2)]
+    return join_lines([str(pow(subject, loop, modulus)) for loop in loops])
+
+
+GENERATORS = {
+    1: gen_day1,
+    2: gen_day2,
+    3: gen_day3,
+    4: gen_day4,
+    5: gen_day5,
+    6: gen_day6,
+    7: gen_day7,
+    8: gen_day8,
+    9: gen_day9,
+    10: gen_day10,
+    11: gen_day11,
+    12: gen_day12,
+    13: gen_day13,
+    14: gen_day14,
+    15: gen_day15,
+    16: gen_day16,
+    17: gen_day17,
+    18: gen_day18,
+    19: gen_day19,
+    20: gen_day20,
+    21: gen_day21,
+    22: gen_day22,
+    23: gen_day23,
+    24: gen_day24,
+    25: gen_day25,
+}
+
+
+def generate(day, size, seed=0, **options):
+    """Return the text of a generated input for the given day.  Any options
+    are passed on to the day's generator (eg terms for day 18), and are
+    part of the seed.
+    """
+    if day not in GENERATORS:
+        raise ValueError(f"no input generator for day {day}")
+    key = f"{day}:{size}:{seed}"
+    if options:
+        key += ":" + ",".join(
+            f"{name}={value}" for name, value in sorted(options.items())
+        )
+    rng = random.Random(key)
+    return GENERATORS[day](size, rng, **options)
+
+
+def generated_input(day, size, seed=0):
+    """Return the path of a generated input file for the given day, size
+    and seed, generating it if it isn't already cached.
+    """
+    path = GENERATED_DIR / f"day{day}-{size}-{seed}.txt"
+    if not path.exists():
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(generate(day, size, seed))
+        tmp.replace(path)
+    return path
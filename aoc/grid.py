@@ -0,0 +1,341 @@
+"""
+Two-dimensional grids, with two backends.
+
+DenseGrid stores small integer cells row by row in a flat array, and finds
+neighbors by flat index arithmetic.  BitGrid stores on/off cells as one int
+per row (bit c is column c), so that a whole row is shifted, masked and
+counted at once; its neighbor counts are bit-sliced, with one int per bit
+of the count.
+
+Both take (row, col) coordinates, and can read with wraparound and make
+padded copies.
+"""
+
+from array import array
+
+# (drow, dcol) of the eight neighbors, and of the four orthogonal ones
+MOORE = ((-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1))
+VON_NEUMANN = ((-1, 0), (0, -1), (0, 1), (1, 0))
+
+
+def popcount(n):
+    return bin(n).count("1")
+
+
+class DenseGrid:
+    """A grid of small integers, in a flat array of width * height cells."""
+
+    def __init__(self, width, height, fill=0, typecode="b"):
+        self.width = width
+        self.height = height
+        self.cells = array(typecode, [fill]) * (width * height)
+
+    @classmethod
+    def from_lines(cls, lines, codes, typecode="b"):
+        """Return a grid from lines of text, mapping each character through
+        codes (a dict of character to cell value).
+        """
+        grid = cls(len(lines[0]) if lines else 0, len(lines), typecode=typecode)
+        grid.cells = array(typecode, [codes[ch] for line in lines for ch in line])
+        return grid
+
+    def to_lines(self, chars):
+        """Return the grid as lines of text, mapping each cell value through
+        chars (a dict, or a string indexed by value).
+        """
+        w = self.width
+        return [
+            "".join([chars[v] for v in self.cells[i : i + w]])
+            for i in range(0, len(self.cells), w)
+        ]
+
+    def copy(self):
+        grid = DenseGrid(self.width, self.height, typecode=self.cells.typecode)
+        grid.cells = array(self.cells.typecode, self.cells)
+        return grid
+
+    def in_bounds(self, r, c):
+        return 0 <= r < self.height and 0 <= c < self.width
+
+    def index(self, r, c, wrap=False):
+        if wrap:
+            r, c = r % self.height, c % self.width
+        return r * self.width + c
+
+    def get(self, r, c, wrap=False, default=None):
+        """Return the cell at (r, c).  Out of bounds, the grid wraps around
+        if wrap is True, and otherwise default is returned.
+        """
+        if not wrap and not self.in_bounds(r, c):
+            return default
+        return self.cells[self.index(r, c, wrap)]
+
+    def set(self, r, c, value):
+        self.cells[r * self.width + c] = value
+
+    def padded(self, n=1, fill=0):
+        """Return a copy of the grid with a border n cells wide."""
+        grid = DenseGrid(
+            self.width + 2 * n, self.height + 2 * n, fill, self.cells.typecode
+        )
+        for r in range(self.height):
+            start = (r + n) * grid.width + n
+            grid.cells[start : start + self.width] = self.cells[
+                r * self.width : (r + 1) * self.width
+            ]
+        return grid
+
+    def count(self, value):
+        return self.cells.count(value)
+
+    def bounds(self, empty=0):
+        """Return ((rmin, rmax), (cmin, cmax)) of the cells that aren't empty,
+        or None if they all are.
+        """
+        rows, cols = set(), set()
+        for i, v in enumerate(self.cells):
+            if v != empty:
+                r, c = divmod(i, self.width)
+                rows.add(r)
+                cols.add(c)
+        if not rows:
+            return None
+        return (min(rows), max(rows)), (min(cols), max(cols))
+
+    def neighbors(self, i, dirs=MOORE, skip=None):
+        """Return a list of the flat indexes of the cell i's neighbors.  If
+        skip is given, each direction continues past cells with that value
+        (a line-of-sight neighbor).
+        """
+        r, c = divmod(i, self.width)
+        result = []
+        for dr, dc in dirs:
+            nr, nc = r + dr, c + dc
+            while self.in_bounds(nr, nc):
+                j = nr * self.width + nc
+                if skip is None or self.cells[j] != skip:
+                    result.append(j)
+                    break
+                nr, nc = nr + dr, nc + dc
+        return result
+
+    def neighbor_table(self, cells=None, dirs=MOORE, skip=None):
+        """Return a dict mapping the flat index of each of the given cells
+        (default: all) to the list of its neighbors' indexes.  Building the
+        table once makes repeated neighbor counts cheap.
+        """
+        if cells is None:
+            cells = range(len(self.cells))
+        return {i: self.neighbors(i, dirs, skip) for i in cells}
+
+    def neighbor_counts(self, value, dirs=MOORE):
+        """Return an array of the number of each cell's neighbors that hold
+        value, counting only neighbors within the grid.
+        """
+        w, h = self.width, self.height
+        counts = array("b", [0]) * (w * h)
+        for dr, dc in dirs:
+            for r in range(max(0, -dr), min(h, h - dr)):
+                src = (r + dr) * w
+                dst = r * w
+                for c in range(max(0, -dc), min(w, w - dc)):
+                    if self.cells[src + c + dc] == value:
+                        counts[dst + c] += 1
+        return counts
+
+
+class BitGrid:
+    """A grid of on/off cells, as one int per row."""
+
+    def __init__(self, rows, width):
+        self.rows = list(rows)
+        self.width = width
+
+    @classmethod
+    def from_lines(cls, lines, on="#"):
+        rows = []
+        for line in lines:
+            bits = 0
+            for c, ch in enumerate(line):
+                if ch == on:
+                    bits |= 1 << c
+            rows.append(bits)
+        return cls(rows, len(lines[0]) if lines else 0)
+
+    def to_lines(self, on="#", off="."):
+        return [
+            "".join([on if row >> c & 1 else off for c in range(self.width)])
+            for row in self.rows
+        ]
+
+    @property
+    def height(self):
+        return len(self.rows)
+
+    @property
+    def mask(self):
+        """The bits of a full row."""
+        return (1 << self.width) - 1
+
+    def get(self, r, c, wrap=False):
+        if wrap:
+            r, c = r % self.height, c % self.width
+        elif not (0 <= r < self.height and 0 <= c < self.width):
+            return 0
+        return self.rows[r] >> c & 1
+
+    def count(self):
+        return sum([popcount(row) for row in self.rows])
+
+    def padded(self, n=1):
+        """Return a copy of the grid with an empty border n cells wide."""
+        empty = [0] * n
+        return BitGrid(
+            empty + [row << n for row in self.rows] + empty, self.width + 2 * n
+        )
+
+    def bounds(self):
+        """Return ((rmin, rmax), (cmin, cmax)) of the cells that are on, or
+        None if none are.
+        """
+        used = [r for r, row in enumerate(self.rows) if row]
+        if not used:
+            return None
+        bits = 0
+        for row in self.rows:
+            bits |= row
+        low = (bits & -bits).bit_length() - 1
+        return (used[0], used[-1]), (low, bits.bit_length() - 1)
+
+    def flipped(self):
+        """Return the grid mirrored left to right."""
+        w = self.width
+        return BitGrid(
+            [int(f"{row:0{w}b}"[::-1], 2) if w else 0 for row in self.rows], w
+        )
+
+    def transposed(self):
+        rows = []
+        for c in range(self.width):
+            bits = 0
+            for r, row in enumerate(self.rows):
+                bits |= (row >> c & 1) << r
+            rows.append(bits)
+        return BitGrid(rows, self.height)
+
+    def rotated(self):
+        """Return the grid rotated 90 degrees clockwise."""
+        return BitGrid(self.rows[::-1], self.width).transposed()
+
+    def orientations(self):
+        """Yield the grid in each of its eight rotations and reflections."""
+        grid = self
+        for _ in range(4):
+            yield grid
+            yield grid.flipped()
+            grid = grid.rotated()
+
+    def shifted_rows(self, r, wrap=False):
+        """Return the eight neighbor masks of row r: the rows above, at and
+        below r, shifted so that bit c of each mask is a neighbor of column c.
+        """
+        h, w, mask = self.height, self.width, self.mask
+        masks = []
+        for dr in (-1, 0, 1):
+            nr = r + dr
+            if wrap:
+                row = self.rows[nr % h]
+            else:
+                row = self.rows[nr] if 0 <= nr < h else 0
+            if wrap:
+                left = ((row << 1) | (row >> (w - 1))) & mask
+                right = ((row >> 1) | (row << (w - 1))) & mask
+            else:
+                left, right = (row << 1) & mask, row >> 1
+            masks.extend([left, right] if dr == 0 else [left, row, right])
+        return masks
+
+    def neighbor_counts(self, wrap=False):
+        """Return, for each row, the bit-sliced counts of each cell's eight
+        neighbors: a tuple of four ints, the first holding bit 0 of the
+        counts, and so on.  See count_is() and count_in().
+        """
+        return [add_bits(self.shifted_rows(r, wrap)) for r in range(self.height)]
+
+    def sight_counts(self, clear):
+        """Like neighbor_counts(), but for each of the eight directions,
+        looking past the cells that are on in clear (a BitGrid of the same
+        shape) to the first cell that isn't.
+        """
+        h, mask = self.height, self.mask
+        masks = [[] for _ in range(h)]
+        for r, (row, see) in enumerate(zip(self.rows, clear.rows)):
+            masks[r].append(smear(row, see, 1, mask) >> 1)
+            masks[r].append(smear(row, see, -1, mask) << 1 & mask)
+        for dc in (-1, 0, 1):
+            # seen holds what is visible from each cell of the previous row
+            # scanned, looking in direction dc across the rows
+            seen = 0
+            for r in range(h - 1, -1, -1):
+                masks[r].append(shift(seen, dc, mask))
+                seen = self.rows[r] | (clear.rows[r] & shift(seen, dc, mask))
+            seen = 0
+            for r in range(h):
+                masks[r].append(shift(seen, dc, mask))
+                seen = self.rows[r] | (clear.rows[r] & shift(seen, dc, mask))
+        return [add_bits(m) for m in masks]
+
+
+def shift(bits, dc, mask):
+    """Shift a row's bits so that bit c of the result is bit c+dc."""
+    if dc > 0:
+        return bits >> dc
+    return bits << -dc & mask
+
+
+def smear(bits, clear, direction, mask):
+    """Return a mask whose bit c is on if bit c of bits is on, or if bit c
+    of clear is on and the next bit in the given direction (+1 for higher
+    columns, -1 for lower) of the result is on.
+    """
+    k = 1
+    while k < mask.bit_length():
+        if direction > 0:
+            bits |= clear & (bits >> k)
+            clear &= clear >> k
+        else:
+            bits |= clear & (bits << k) & mask
+            clear &= clear << k
+        k *= 2
+    return bits
+
+
+def add_bits(masks):
+    """Add up the given masks column by column.  The sums are returned
+    bit-sliced, as a tuple of ints holding bit 0, bit 1, ... of each
+    column's sum (at least four of them, and enough for len(masks)).
+    """
+    planes = [0] * max(4, len(masks).bit_length())
+    for m in masks:
+        for i, plane in enumerate(planes):
+            planes[i] = plane ^ m
+            m &= plane
+            if not m:
+                break
+    return tuple(planes)
+
+
+def count_is(counts, n, mask):
+    """Return a mask of the columns whose bit-sliced count equals n."""
+    result = mask
+    for i, bits in enumerate(counts):
+        result &= bits if n >> i & 1 else ~bits
+    return result
+
+
+def count_in(counts, values, mask):
+    """Return a mask of the columns whose bit-sliced count is in values."""
+    result = 0
+    for n in values:
+        result |= count_is(counts, n, mask)
+    return result
@@ -0,0 +1,96 @@
+"""
+Import-time audit of the day modules, from `python -X importtime`.
+
+Each day module is imported in a fresh interpreter with -X importtime, and
+the report on stderr is parsed into a tree of Imports: each line gives a
+module's own ("self") import time and the cumulative time including the
+modules it imported first, in microseconds, indented by nesting depth.
+Only the subtree under the day module is kept, so the interpreter's own
+start-up (site, encodings) isn't counted against the day.
+"""
+
+from dataclasses import dataclass, field
+import os
+import re
+import subprocess
+import sys
+
+from aoc import ROOT
+
+LINE_RE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \| (\s*)(\S+)")
+
+BUDGET_MS = 25.0  # default start-up budget for a day module's imports
+
+
+@dataclass
+class Import:
+
+    name: str
+    self_us: int
+    cumulative_us: int
+    children: list = field(default_factory=list)
+
+    @property
+    def ms(self):
+        return self.cumulative_us / 1000
+
+    def walk(self):
+        """Generate this import and every import below it."""
+        yield self
+        for child in self.children:
+            yield from child.walk()
+
+
+def parse(text):
+    """Parse -X importtime output, and return a list of the top-level
+    Imports.  A module's line follows those of the modules it imported.
+    """
+    # pending[depth] collects the imports at that depth still waiting for
+    # the parent whose line comes after them
+    pending = {}
+    for line in text.splitlines():
+        m = LINE_RE.match(line)
+        if not m:
+            continue
+        self_us, cumulative_us, indent, name = m.groups()
+        depth = len(indent) // 2
+        node = Import(
+            name, int(self_us), int(cumulative_us), pending.pop(depth + 1, [])
+        )
+        pending.setdefault(depth, []).append(node)
+    return pending.get(0, [])
+
+
+def measure(day, repeat=3):
+    """Import the given day module in fresh interpreters, and return its
+    Import tree from the fastest of the runs.  A first, untimed import
+    writes the bytecode caches, so compiling isn't counted.
+    """
+    daydir = ROOT / f"day{day}"
+    code = (
+        f"import sys; sys.argv = ['day{day}.py']; "
+        f"sys.path[:0] = [{str(daydir)!r}, {str(ROOT)!r}]; import day{day}"
+    )
+    env = dict(os.environ, PYTHONPATH="")
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    best = None
+    for i in range(repeat + 1):
+        proc = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", code],
+            cwd=daydir,
+            env=env,
+            capture_output=True,
+            text=True,
+        )
+        if proc.returncode != 0:
+            raise RuntimeError(f"importing day{day} failed:\n{proc.stderr[-2000:]}")
+        node = next((n for n in parse(proc.stderr) if n.name == f"day{day}"), None)
+        if i and node and (best is None or node.cumulative_us < best.cumulative_us):
+            best = node
+    return best
+
+
+def heaviest(node, count=5):
+    """Return the count imports under node with the most self time."""
+    below = [n for n in node.walk() if n is not node]
+    return sorted(below, key=lambda n: n.self_us, reverse=True)[:count]
@@ -0,0 +1,134 @@
+"""
+Shared puzzle input handling for the daily solutions.
+
+Input files are read through mmap, and split into stripped lines by
+iter_lines(); the load_* functions materialize the whole input as a list
+of strings, which every day's parts (and the hosts running them) share.
+The list carries a digest of the file's contents, so parse caches can key
+on it without hashing the lines again.  The chunked solvers (see
+aoc.mapreduce) map the file themselves, to process inputs too large for a
+list.
+"""
+
+from pathlib import Path
+import contextlib
+import mmap
+import os
+
+
+@contextlib.contextmanager
+def mapped(infile):
+    """Memory-map the given file read-only, for the duration of the context.
+    An empty file yields an empty bytes object, since it can't be mapped.
+    """
+    with Path(infile).open("rb") as fp:
+        if os.fstat(fp.fileno()).st_size == 0:
+            yield b""
+            return
+        with mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            yield data
+
+
+def _line_spans(data):
+    """Generate (start, end) offsets of each line in data, excluding the
+    line terminator.
+    """
+    start, size = 0, len(data)
+    while start < size:
+        end = data.find(b"\n", start)
+        if end < 0:
+            end = size
+        yield start, end
+        start = end + 1
+
+
+def iter_lines(infile, skip_blank=False):
+    """Generate each line of the given file as a stripped string.
+    Blank lines are skipped if skip_blank is True.
+    """
+    with mapped(infile) as data:
+        yield from _lines(data, skip_blank)
+
+
+def _lines(data, skip_blank):
+    for start, end in _line_spans(data):
+        line = data[start:end].decode().strip()
+        if line or not skip_blank:
+            yield line
+
+
+def _sections(lines):
+    sect = []
+    for line in lines:
+        line = line.strip()
+        if not line:
+            if sect:
+                yield sect
+            sect = []
+        else:
+            sect.append(line)
+    if sect:
+        yield sect
+
+
+class Lines(list):
+    """The lines of an input file, with a sha256 digest of the loader and
+    the file's contents.  Slices and other derived lists are plain lists,
+    without a digest; copy() keeps it.
+    """
+
+    def __init__(self, lines, digest):
+        super().__init__(lines)
+        self.digest = digest
+
+    def copy(self):
+        return Lines(self, self.digest)
+
+
+def _load(infile, loader, skip_blank):
+    """Return the Lines of the given file, hashing the same mapped bytes
+    that they are split from.
+    """
+    import hashlib  # not needed on the days' start-up path
+
+    with mapped(infile) as data:
+        digest = hashlib.sha256(f"{loader}:".encode())
+        digest.update(data)
+        return Lines(_lines(data, skip_blank), digest.hexdigest())
+
+
+def load_input(infile):
+    """Return a list of the non-blank lines in the given file, stripped."""
+    return _load(infile, "load_input", skip_blank=True)
+
+
+def load_lines(infile):
+    """Return a list of all lines in the given file, stripped.  Blank lines
+    are kept, for inputs where they separate sections.
+    """
+    return _load(infile, "load_lines", skip_blank=False)
+
+
+def input_hash(lines):
+    """Return a hash of the given input lines, or None if there are none."""
+    if lines is None:
+        return None
+    import hashlib  # not needed on the days' start-up path
+
+    digest = hashlib.sha256()
+    for line in lines:
+        digest.update(str(line).encode())
+        digest.update(b"\n")
+    return digest.hexdigest()
+
+
+def filter_blank_lines(lines):
+    """Return the non-blank lines of the given lines, stripped."""
+    return [line.strip() for line in lines if line.strip()]
+
+
+def parse_sections(lines):
+    """Split the given lines into sections separated by blank lines.
+    A list of lists is returned.  Each item is the list of lines for a section.
+    """
+    return list(_sections(lines))
@@ -0,0 +1,103 @@
+"""
+Chunked map-reduce over large input files, across a pool of processes.
+
+For inputs made of independent records (lines, or sections separated by
+blank lines), the file is split into byte ranges that end on record
+boundaries.  Only the (start, end) offsets are sent to the workers; each
+memory-maps the file and decodes just its own range, so nothing large is
+pickled.  A day's mapper takes the lines of one chunk and returns a
+partial result (a count, a max, a set), and the partial results are
+combined with a reducer, eg
+
+    map_reduce(infile, count_valid)                         # sum the counts
+    map_reduce(infile, solve, max)
+    map_reduce(infile, count_groups, sep=SECTION)           # blank-line records
+
+Mappers must be picklable: module-level functions, or functools.partial()
+of them.
+"""
+
+from pathlib import Path
+import functools
+import operator
+import os
+
+from aoc.inputs import mapped
+
+LINE = b"\n"
+SECTION = b"\n\n"
+
+MAX_CHUNK = 64 << 20  # bytes; bounds each worker's decoded chunk
+
+
+def chunk_ranges(infile, chunks, sep=LINE, start=0):
+    """Split the given file, from offset start, into about the given number
+    of byte ranges, each ending just after a record separator (or at the
+    end of the file).  A list of (start, end) offsets is returned.
+    """
+    with mapped(infile) as data:
+        size = len(data)
+        step = max(1, (size - start) // max(1, chunks))
+        ranges = []
+        while start < size:
+            end = data.find(sep, start + step)
+            end = size if end < 0 else end + len(sep)
+            ranges.append((start, end))
+            start = end
+    return ranges
+
+
+def read_chunk(infile, start, end, skip_blank=False):
+    """Return the lines in the given byte range of the file, stripped.
+    Blank lines are skipped if skip_blank is True.
+    """
+    with mapped(infile) as data:
+        lines = [line.strip() for line in data[start:end].decode().split("\n")]
+    if skip_blank:
+        return [line for line in lines if line]
+    return lines
+
+
+def _map_chunk(mapper, infile, skip_blank, span):
+    return mapper(read_chunk(infile, *span, skip_blank))
+
+
+def map_reduce(
+    infile, mapper, reducer=operator.add, jobs=None, sep=LINE, start=0, skip_blank=None
+):
+    """Apply mapper to the lines of each chunk of the given file, from offset
+    start, and return the partial results combined with reducer.  Records
+    are lines, or if sep is SECTION, groups of lines separated by a blank
+    line; blank lines are skipped for line records unless skip_blank says
+    otherwise.  Chunks are run on jobs worker processes (default: one per
+    core), or in this process if there's only one chunk.
+    """
+    if skip_blank is None:
+        skip_blank = sep == LINE
+    jobs = jobs or os.cpu_count()
+    size = Path(infile).stat().st_size
+    chunks = max(jobs * 4, -(-size // MAX_CHUNK))
+    ranges = chunk_ranges(infile, chunks, sep, start) or [(start, start)]
+    run = functools.partial(_map_chunk, mapper, str(infile), skip_blank)
+    if jobs == 1 or len(ranges) == 1:
+        return functools.reduce(reducer, map(run, ranges))
+    # imported here, since it's costly and the days import this module
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        return functools.reduce(reducer, pool.map(run, ranges))
+
+
+def header_end(infile, sep=SECTION):
+    """Return the offset just past the first record separator in the file
+    (eg the blank line ending a header section), or the file size if there
+    is none.
+    """
+    with mapped(infile) as data:
+        end = data.find(sep)
+        return len(data) if end < 0 else end + len(sep)
+
+
+def read_header(infile, sep=SECTION):
+    """Return the lines before the first record separator in the file."""
+    return read_chunk(infile, 0, header_end(infile, sep), skip_blank=True)
@@ -0,0 +1,90 @@
+"""
+Memory instrumentation of a solver part with tracemalloc.
+
+measure_call() reports the peak traced memory during the call, the net
+change in allocated memory and blocks once it returns, and the source
+lines responsible for most of the memory still allocated at that point.
+"""
+
+from dataclasses import dataclass, field
+import tracemalloc
+
+TOP_SITES = 10
+
+SNAPSHOT_FILTERS = [
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, __file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<unknown>"),
+]
+
+
+@dataclass
+class MemoryReport:
+
+    peak: int = 0  # bytes, above the level when the call started
+    net_size: int = 0  # bytes still allocated after the call
+    net_blocks: int = 0  # memory blocks still allocated after the call
+    top: list = field(default_factory=list)  # (site, size_diff, count_diff)
+
+
+class MemoryBudgetError(AssertionError):
+    pass
+
+
+def measure_call(func, *args, top=TOP_SITES):
+    """Call func(*args) with tracemalloc running.  A tuple of the function's
+    result and a MemoryReport is returned.
+    """
+    started = not tracemalloc.is_tracing()
+    if started:
+        tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        before = tracemalloc.take_snapshot().filter_traces(SNAPSHOT_FILTERS)
+        base, _ = tracemalloc.get_traced_memory()
+        result = func(*args)
+        _, peak = tracemalloc.get_traced_memory()
+        after = tracemalloc.take_snapshot().filter_traces(SNAPSHOT_FILTERS)
+    finally:
+        if started:
+            tracemalloc.stop()
+
+    diffs = after.compare_to(before, "lineno")
+    report = MemoryReport(peak=peak - base)
+    report.net_size = sum([diff.size_diff for diff in diffs])
+    report.net_blocks = sum([diff.count_diff for diff in diffs])
+    for diff in diffs[:top]:
+        frame = diff.traceback[0]
+        report.top.append(
+            (f"{frame.filename}:{frame.lineno}", diff.size_diff, diff.count_diff)
+        )
+    return result, report
+
+
+def check_budget(report, budget_mb):
+    """Raise MemoryBudgetError if the report's peak exceeds the budget."""
+    if report.peak > budget_mb * 2**20:
+        raise MemoryBudgetError(
+            f"peak memory {format_size(report.peak)} exceeds budget of {budget_mb} MiB"
+        )
+
+
+def format_size(size):
+    if abs(size) < 1024:
+        return f"{size} B"
+    for unit in ("KiB", "MiB", "GiB"):
+        size /= 1024
+        if abs(size) < 1024 or unit == "GiB":
+            return f"{size:.1f} {unit}"
+
+
+def format_report(report):
+    lines = [
+        f"peak memory: {format_size(report.peak)}",
+        f"net change:  {format_size(report.net_size)} in {report.net_blocks:+d} blocks",
+        "top allocation sites (net):",
+    ]
+    for site, size, count in report.top:
+        lines.append(f"  {format_size(size):>12} {count:+9d} blocks  {site}")
+    return "\n".join(lines)
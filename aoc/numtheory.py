@@ -0,0 +1,133 @@
+"""
+Number theory for the modular-arithmetic puzzles.
+
+Congruences are (mod, rem) pairs, meaning val = rem (mod mod).  They are
+merged with the Chinese Remainder Theorem one pair at a time: crt() folds
+them left to right, while crt_tree() merges them in a balanced tree, which
+keeps the operands of each merge about the same size and so is faster for
+many large moduli.  Moduli need not be coprime; congruences that
+contradict each other raise ValueError.
+
+DiscreteLog solves base**x = target (mod mod) by baby-step giant-step.
+Its table of baby steps is built once, so any number of logs to the same
+base and modulus can share it.
+"""
+
+import math
+
+
+def ext_euclid(a, b):
+    """Use the extended Euclid algorithm to find the gcd of a and b, along
+    with the coefficients of Bezout's identity, a*x + b*y = gcd(a, b).
+    The tuple (gcd(a, b), x, y) is returned.
+    """
+    r0, s0, t0 = a, 1, 0
+    r1, s1, t1 = b, 0, 1
+    while r1:
+        q = r0 // r1
+        r0, r1 = r1, r0 - q * r1
+        s0, s1 = s1, s0 - q * s1
+        t0, t1 = t1, t0 - q * t1
+    if r0 < 0:
+        r0, s0, t0 = -r0, -s0, -t0
+    return r0, s0, t0
+
+
+def modinv(a, mod):
+    """Return the inverse of a modulo mod, raising ValueError if a and mod
+    aren't coprime.
+    """
+    try:
+        return pow(a, -1, mod)
+    except ValueError:
+        raise ValueError(f"{a} has no inverse modulo {mod}") from None
+
+
+def modpow(base, exp, mod):
+    """Return base**exp modulo mod, by square-and-multiply (the builtin
+    three-argument pow).  A negative exp raises the inverse of base.
+    """
+    if exp < 0:
+        return pow(modinv(base, mod), -exp, mod)
+    return pow(base, exp, mod)
+
+
+def crt_pair(a, b):
+    """Merge two congruences (mod, rem) into one, modulo the lcm of their
+    moduli.
+    """
+    m1, r1 = a
+    m2, r2 = b
+    g = math.gcd(m1, m2)
+    diff = r2 - r1
+    if diff % g:
+        raise ValueError(f"no solution to val = {r1} mod {m1} and val = {r2} mod {m2}")
+    # r1 + m1*k = r2 (mod m2), so k = diff/g * (m1/g)**-1 (mod m2/g); the
+    # inverse is taken of m1 reduced mod m2, which is cheap when m2 is small
+    n = m2 // g
+    k = diff // g * modinv(m1 // g % n, n) % n if n > 1 else 0
+    lcm = m1 * n
+    return lcm, (r1 + m1 * k) % lcm
+
+
+def crt(congruences):
+    """Solve a system of congruences [(mod1, rem1), (mod2, rem2), ...] by
+    merging them left to right.  The merged (mod, rem) is returned.
+    """
+    result = (1, 0)
+    for cong in congruences:
+        result = crt_pair(result, cong)
+    return result
+
+
+def crt_tree(congruences):
+    """Like crt(), but merging neighboring pairs of congruences, then pairs
+    of those, and so on.
+    """
+    level = list(congruences) or [(1, 0)]
+    while len(level) > 1:
+        merged = [crt_pair(a, b) for a, b in zip(level[::2], level[1::2])]
+        if len(level) % 2:
+            merged.append(level[-1])
+        level = merged
+    mod, rem = level[0]
+    return mod, rem % mod
+
+
+class DiscreteLog:
+    """Baby-step giant-step logs to the given base, modulo mod.  order is a
+    bound on the order of base (default: mod - 1, for a prime mod); the
+    table holds isqrt(order) + 1 baby steps.
+    """
+
+    def __init__(self, base, mod, order=None):
+        self.base = base % mod
+        self.mod = mod
+        self.order = mod - 1 if order is None else order
+        self.steps = math.isqrt(self.order) + 1
+        self.table = {}
+        value = 1
+        for j in range(self.steps):
+            self.table.setdefault(value, j)
+            value = value * self.base % mod
+        # multiplying by base**-steps takes one giant step back
+        self.giant = modpow(self.base, -self.steps, mod)
+
+    def log(self, target):
+        """Return the smallest x >= 0 such that base**x = target (mod mod),
+        or None if there is none.
+        """
+        value = target % self.mod
+        for i in range(self.steps + 1):
+            j = self.table.get(value)
+            if j is not None:
+                return i * self.steps + j
+            value = value * self.giant % self.mod
+        return None
+
+
+def discrete_log(base, target, mod):
+    """Return the smallest x >= 0 such that base**x = target (mod mod), or
+    None if there is none.
+    """
+    return DiscreteLog(base, mod).log(target)
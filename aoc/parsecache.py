@@ -0,0 +1,151 @@
+"""
+Parse-once caching of the days' parsed inputs.
+
+A day's parse function, decorated with @parse_once, runs once per input
+(and per version of the day's source): its result is pickled and kept in
+memory, and on disk under .cache/parsed, so later calls, from the other
+part or from a later run, just unpickle it.  Every call gets a fresh copy,
+so solvers are free to modify what they're given.  Results that can't be
+pickled (eg a linked structure too deep for pickle's recursion) are
+simply not cached.  When the disk cache grows beyond its size cap, the
+least recently used entries are evicted.
+
+An input loaded by aoc.inputs carries a digest of its file and of the
+loader that split it (load_input or load_lines), which is the key, so a
+hit costs no more than the unpickling; other arguments (eg the sample
+lines) are pickled and hashed.
+
+Timing harnesses run with the cache bypassed (enable(False), or the
+bypassed() context), so that they time the parse rather than the unpickle.
+
+Pickle is used rather than marshal, since the parsed structures include
+the days' own classes (day 20's Mosaic and Tiles).
+"""
+
+from pathlib import Path
+import contextlib
+import functools
+import hashlib
+import os
+import pickle
+
+from aoc import ROOT
+
+CACHE_DIR = ROOT / ".cache" / "parsed"
+
+MAX_BYTES = 16 << 20
+
+ENABLED = True
+
+_memory = {}
+
+
+def enable(enabled=True):
+    global ENABLED
+    ENABLED = enabled
+
+
+@contextlib.contextmanager
+def bypassed():
+    """Context in which parse functions always parse, and nothing is
+    cached.
+    """
+    previous = ENABLED
+    enable(False)
+    try:
+        yield
+    finally:
+        enable(previous)
+
+
+def source_hash(func):
+    """Return a hash of the source file that defines func."""
+    path = func.__code__.co_filename
+    return hashlib.sha256(Path(path).read_bytes()).hexdigest()
+
+
+def _key(ident, args, kwargs):
+    """Return the cache key for a call, or None if its arguments can't be
+    pickled.
+    """
+    digest = getattr(args[0], "digest", None) if args else None
+    if digest is not None:
+        ident += digest + ":"
+        args = args[1:]
+    try:
+        data = pickle.dumps((args, kwargs), pickle.HIGHEST_PROTOCOL)
+    except (pickle.PicklingError, TypeError, AttributeError):
+        return None
+    return hashlib.sha256(ident.encode() + data).hexdigest()
+
+
+def parse_once(func):
+    """Decorator caching the (pickled) result of a parse function, by the
+    digest of its input (or the hash of its arguments) and of its source
+    file.
+    """
+    version = source_hash(func)
+    ident = f"{func.__module__}.{func.__qualname__}:{version}:"
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        key = _key(ident, args, kwargs) if ENABLED else None
+        if key is None:
+            return func(*args, **kwargs)
+
+        blob = _memory.get(key)
+        path = CACHE_DIR / f"{key}.pickle"
+        if blob is None:
+            try:
+                blob = path.read_bytes()
+            except OSError:
+                pass
+            else:
+                os.utime(path)  # mark as recently used
+                _memory[key] = blob
+        if blob is not None:
+            try:
+                return pickle.loads(blob)
+            except Exception:
+                pass  # eg a stale class definition; just parse again
+
+        result = func(*args, **kwargs)
+        try:
+            blob = pickle.dumps(result, pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, TypeError, AttributeError, RecursionError):
+            return result
+        _memory[key] = blob
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_bytes(blob)
+        tmp.replace(path)
+        evict()
+        return result
+
+    return wrapper
+
+
+def evict(max_bytes=MAX_BYTES):
+    """Remove the least recently used entries until the disk cache is
+    within its size cap.
+    """
+    entries = []
+    for entry in CACHE_DIR.glob("*.pickle"):
+        try:
+            st = entry.stat()
+        except OSError:
+            continue
+        entries.append((st.st_mtime, st.st_size, entry))
+    total = sum([size for _, size, _ in entries])
+    for _, size, entry in sorted(entries):
+        if total <= max_bytes:
+            break
+        entry.unlink(missing_ok=True)
+        total -= size
+
+
+def clear():
+    """Empty the in-memory and on-disk caches."""
+    _memory.clear()
+    for path in CACHE_DIR.glob("*.pickle"):
+        path.unlink(missing_ok=True)
@@ -0,0 +1,100 @@
+"""
+Deterministic profiling of a solver part with cProfile.
+
+For each profiled call, three files are written:
+    NAME.prof       the raw cProfile data, for pstats, snakeviz, etc.
+    NAME.txt        the hot functions, sorted by own time and by cumulative time
+    NAME.collapsed  collapsed stacks ("a;b;c microseconds"), for flamegraph.pl
+                    or speedscope
+cProfile only records caller/callee pairs, not whole stacks, so the
+collapsed stacks are reconstructed by sharing each function's time among
+its callers in proportion to the time spent under each of them.
+"""
+
+from pathlib import Path
+import cProfile
+import io
+import os
+import pstats
+
+TOP_FUNCTIONS = 30
+
+
+def profile_call(func, *args, name=None, outdir="profile"):
+    """Call func(*args) under cProfile, write the reports, and return the
+    function's result.
+    """
+    name = name or func.__name__
+    outdir = Path(outdir)
+    outdir.mkdir(parents=True, exist_ok=True)
+
+    prof = cProfile.Profile()
+    try:
+        result = prof.runcall(func, *args)
+    finally:
+        prof.create_stats()
+        prof.dump_stats(outdir / f"{name}.prof")
+        (outdir / f"{name}.txt").write_text(hot_functions(prof))
+        write_collapsed(prof, outdir / f"{name}.collapsed")
+    return result
+
+
+def hot_functions(prof, limit=TOP_FUNCTIONS):
+    """Return a report of the hottest functions in the profile, by own time
+    and by cumulative time.
+    """
+    out = io.StringIO()
+    stats = pstats.Stats(prof, stream=out)
+    stats.strip_dirs()
+    for key in ("tottime", "cumulative"):
+        stats.sort_stats(key).print_stats(limit)
+    return out.getvalue()
+
+
+def frame_name(func):
+    filename, lineno, funcname = func
+    if filename == "~":
+        return funcname
+    return f"{os.path.basename(filename)}:{funcname}:{lineno}"
+
+
+def collapsed_stacks(prof):
+    """Return a dict mapping a collapsed stack (frame names joined by ';')
+    to the microseconds of own time attributed to it.
+    """
+    stats = pstats.Stats(prof).stats
+    callees = {func: {} for func in stats}
+    for func, (_, _, _, _, callers) in stats.items():
+        for caller, edge in callers.items():
+            callees.setdefault(caller, {})[func] = edge[3]
+
+    result = {}
+
+    def walk(func, share, stack):
+        _, _, tottime, cumtime, _ = stats[func]
+        stack = stack + [func]
+        own = int(tottime * share * 1e6)
+        if own > 0:
+            key = ";".join([frame_name(f) for f in stack])
+            result[key] = result.get(key, 0) + own
+        for callee, edge_time in callees.get(func, {}).items():
+            if callee in stack or callee not in stats:
+                continue
+            total = stats[callee][3]
+            if total <= 0:
+                continue
+            child_share = share * edge_time / total
+            if child_share * total >= 1e-6:
+                walk(callee, child_share, stack)
+
+    roots = [func for func, (_, _, _, _, callers) in stats.items() if not callers]
+    for root in roots:
+        walk(root, 1.0, [])
+    return result
+
+
+def write_collapsed(prof, path):
+    lines = [
+        f"{stack} {count}" for stack, count in sorted(collapsed_stacks(prof).items())
+    ]
+    Path(path).write_text("\n".join(lines) + "\n")
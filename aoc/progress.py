@@ -0,0 +1,137 @@
+"""
+Progress and ETA reports for the long-running simulation loops.
+
+A loop reports through a Progress, either by calling update(done) now and
+then, or, for tight loops, by iterating over the blocks from ranges():
+
+    prog = progress.Progress("day15.solve", total=turns)
+    for block in prog.ranges(start, turns + 1):
+        for turn in block:
+            ...
+    prog.finish()
+
+Reporting is off unless enable() is called (the day scripts' --progress
+and --status-file options do this); then ranges() hands out a single
+range and update() returns at once, so the loops run as before.  When it
+is on, ranges() splits the loop into blocks of a fixed number of
+iterations, and at most once per interval the rate since the last sample
+and the time remaining are written as a line to stderr, or to a JSON
+status file (rewritten in place, for watching from another terminal).
+"""
+
+from pathlib import Path
+import json
+import os
+import sys
+import time
+
+ENABLED = False
+STATUS_FILE = None
+INTERVAL = 1.0  # seconds between reports
+
+BLOCK = 1 << 16  # iterations per block from ranges()
+
+
+def enable(status_file=None, interval=INTERVAL):
+    """Turn on progress reports, to stderr or to the given status file."""
+    global ENABLED, STATUS_FILE, INTERVAL
+    ENABLED = True
+    STATUS_FILE = Path(status_file) if status_file else None
+    INTERVAL = interval
+
+
+def format_count(n):
+    for scale, suffix in ((1e9, "G"), (1e6, "M"), (1e3, "k")):
+        if abs(n) >= scale:
+            return f"{n / scale:.1f}{suffix}"
+    return f"{n:.0f}"
+
+
+class Progress:
+    """The progress of one loop of a known total number of iterations (or
+    of an open-ended one, if total is None, which gets no ETA).
+    """
+
+    def __init__(self, name, total=None, unit="it", block=BLOCK, done=0):
+        self.name = name
+        self.total = total
+        self.unit = unit
+        self.block = block
+        self.done = done  # nonzero for a resumed run
+        self.start = self.last = time.perf_counter()
+        self.last_done = self.first = done
+        self.rate = 0.0
+
+    def ranges(self, start, stop, split=False):
+        """Generate ranges covering start to stop, updating the progress
+        after each one.  They are blocks even with reporting off if split is
+        True (eg to check for a checkpoint between blocks).
+        """
+        if not (ENABLED or split):
+            yield range(start, stop)
+            return
+        for lo in range(start, stop, self.block):
+            hi = min(lo + self.block, stop)
+            yield range(lo, hi)
+            self.update(self.done + hi - lo)
+
+    def update(self, done):
+        """Record that done iterations are complete, and report if it's
+        time to.
+        """
+        if not ENABLED:
+            return
+        self.done = done
+        now = time.perf_counter()
+        if now - self.last < INTERVAL:
+            return
+        self.rate = (done - self.last_done) / (now - self.last)
+        self.last, self.last_done = now, done
+        self.report(now)
+
+    @property
+    def eta(self):
+        """Estimated seconds to completion, at the last sampled rate."""
+        if self.total is None or not self.rate:
+            return None
+        return max(0.0, (self.total - self.done) / self.rate)
+
+    def finish(self):
+        """Report the final count and average rate."""
+        if not ENABLED:
+            return
+        now = time.perf_counter()
+        elapsed = now - self.start
+        self.rate = (self.done - self.first) / elapsed if elapsed else 0.0
+        self.report(now, finished=True)
+
+    def status(self, now, finished=False):
+        return {
+            "name": self.name,
+            "pid": os.getpid(),
+            "done": self.done,
+            "total": self.total,
+            "unit": self.unit,
+            "rate": self.rate,
+            "elapsed": now - self.start,
+            "eta": 0.0 if finished else self.eta,
+            "finished": finished,
+        }
+
+    def report(self, now, finished=False):
+        if STATUS_FILE:
+            tmp = STATUS_FILE.with_suffix(f".{os.getpid()}.tmp")
+            tmp.write_text(json.dumps(self.status(now, finished)) + "\n")
+            tmp.replace(STATUS_FILE)
+            return
+        done = format_count(self.done)
+        if self.total is not None:
+            done += f"/{format_count(self.total)} ({self.done / self.total:.1%})"
+        rate = f"{format_count(self.rate)} {self.unit}/s"
+        if finished:
+            tail = f"done in {now - self.start:.1f}s"
+        elif self.eta is not None:
+            tail = f"eta {self.eta:.1f}s"
+        else:
+            tail = f"{now - self.start:.1f}s so far"
+        print(f"{self.name}: {done} {self.unit}, {rate}, {tail}", file=sys.stderr)
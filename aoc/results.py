@@ -0,0 +1,148 @@
+"""
+Machine-readable results, as JSON lines.
+
+Each example and part run writes one JSON object per line, eg
+
+    {"kind": "part", "day": 15, "part": 2, "name": "day15.part2",
+     "answer": 16439, "wall": 9.87, "cpu": 9.85, "peak": null,
+     "input_hash": "3b5d...", "error": null, "cached": false,
+     "revision": "5d3081f...", "time": "2020-12-15T08:00:00+00:00"}
+
+peak is the peak traced memory in bytes, when memory tracing is on, and
+otherwise null.  input_hash is a hash of the input lines the part was
+given, so runs on different inputs aren't compared by mistake; revision is
+the git commit the code was run at.  Examples don't return their answer,
+so theirs is null, and a failed one has an error.
+"""
+
+from datetime import datetime, timezone
+import functools
+import json
+import re
+import subprocess
+import sys
+
+from aoc.days import ROOT
+
+PART_RE = re.compile(r"(?:part|example)(\d*)$")
+
+
+@functools.lru_cache(maxsize=None)
+def revision():
+    """Return the git commit of the working tree (with "+" appended if it has
+    uncommitted changes), or None outside a git checkout.
+    """
+    try:
+        head = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+        dirty = subprocess.run(
+            ["git", "status", "--porcelain", "--untracked-files=no"],
+            cwd=ROOT,
+            capture_output=True,
+            text=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return head + "+" if dirty else head
+
+
+def part_number(func_name):
+    """Return the part a part or example function is for (example and
+    lines_example are part 1).
+    """
+    m = PART_RE.search(func_name)
+    return int(m.group(1) or 1) if m else None
+
+
+def record(
+    kind,
+    day,
+    part,
+    name,
+    answer=None,
+    wall=0.0,
+    cpu=0.0,
+    peak=None,
+    input_hash=None,
+    error=None,
+    cached=False,
+):
+    """Return a result record, as a dict."""
+    return {
+        "kind": kind,
+        "day": day,
+        "part": part,
+        "name": name,
+        "answer": answer,
+        "wall": wall,
+        "cpu": cpu,
+        "peak": peak,
+        "input_hash": input_hash,
+        "error": error,
+        "cached": cached,
+        "revision": revision(),
+        "time": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+    }
+
+
+def part_record(res):
+    """Return the record of a PartResult."""
+    return record(
+        "part",
+        res.day,
+        res.part,
+        f"day{res.day}.part{res.part}",
+        res.answer,
+        res.wall,
+        res.cpu,
+        res.peak,
+        res.input_hash,
+        res.error,
+        res.cached,
+    )
+
+
+def case_record(res):
+    """Return the record of a sample CaseResult."""
+    case = res.case
+    return record(
+        "example",
+        case.day,
+        part_number(case.func),
+        case.name,
+        wall=res.wall,
+        cpu=res.cpu,
+        error=res.error,
+    )
+
+
+class JsonLines:
+    """Writes records to a file (appending), or to stdout if path is "-".
+    The records are written to the process's real stdout, so that hosts
+    can send everything else they print to stderr (see to_stderr()).
+    """
+
+    def __init__(self, path):
+        self.path = path
+
+    def write(self, rec):
+        line = json.dumps(rec, default=str) + "\n"
+        if self.path == "-":
+            sys.__stdout__.write(line)
+            sys.__stdout__.flush()
+        else:
+            with open(self.path, "a") as f:
+                f.write(line)
+
+
+def to_stderr():
+    """Send whatever is printed from now on to stderr, leaving stdout to the
+    JSON lines, so that it can be parsed.
+    """
+    sys.stdout.flush()
+    sys.stdout = sys.stderr
@@ -0,0 +1,91 @@
+"""
+Collect the sample cases from the day modules, and run them one at a time.
+
+Every function named example, example1, example2, ... in a day module is a
+sample case.  If the function takes a cases argument defaulting to a list
+(eg example1(cases=SAMPLE_CASES)), each entry of the list becomes its own
+case, run by calling the function with a one-entry list, so the slow
+entries can run in parallel.
+"""
+
+from dataclasses import dataclass
+from typing import Optional
+import inspect
+import re
+import time
+
+from aoc.days import day_paths, load_day, quiet_output
+
+EXAMPLE_RE = re.compile(r"example\d*$")
+
+
+@dataclass
+class SampleCase:
+
+    day: int
+    func: str
+    index: Optional[int] = None  # entry in the function's cases list
+
+    @property
+    def name(self):
+        if self.index is None:
+            return f"day{self.day}.{self.func}"
+        return f"day{self.day}.{self.func}[{self.index}]"
+
+
+@dataclass
+class CaseResult:
+
+    case: SampleCase
+    wall: float = 0.0
+    cpu: float = 0.0
+    error: Optional[str] = None
+
+
+def module_cases(day, module):
+    """Return a list of the SampleCases in an already loaded day module."""
+    result = []
+    for name, func in vars(module).items():
+        if not EXAMPLE_RE.match(name) or not inspect.isfunction(func):
+            continue
+        param = inspect.signature(func).parameters.get("cases")
+        if param is not None and isinstance(param.default, list):
+            result.extend(SampleCase(day, name, i) for i in range(len(param.default)))
+        else:
+            result.append(SampleCase(day, name))
+    return result
+
+
+def collect_cases(days=None):
+    """Return a list of the SampleCases in every day module (or just the
+    given days).
+    """
+    result = []
+    for day in day_paths(days):
+        with quiet_output():
+            module = load_day(day)
+        result.extend(module_cases(day, module))
+    return result
+
+
+def run_case(case, quiet=True):
+    """Load the case's day module, run the case, and return a CaseResult.
+    A case fails if it raises any exception (usually an AssertionError).
+    """
+    result = CaseResult(case)
+    with quiet_output(quiet):
+        try:
+            func = getattr(load_day(case.day), case.func)
+            args = {}
+            if case.index is not None:
+                cases = inspect.signature(func).parameters["cases"].default
+                args["cases"] = [cases[case.index]]
+            wall0, cpu0 = time.perf_counter(), time.process_time()
+            try:
+                func(**args)
+            finally:
+                result.wall = time.perf_counter() - wall0
+                result.cpu = time.process_time() - cpu0
+        except Exception as exc:
+            result.error = f"{type(exc).__name__}: {exc}"
+    return result
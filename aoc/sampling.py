@@ -0,0 +1,131 @@
+"""
+Statistical profiling of a solver part, by sampling its stack on a timer.
+
+A SIGPROF interval timer interrupts the process every few milliseconds of
+CPU time, and the handler records the interrupted Python stack.  Unlike
+cProfile, nothing runs on function calls, so tight loops (day 15's solve,
+day 23's play_game) run at very nearly their normal speed, and the time
+is attributed to the lines actually executing.  Unix only.
+
+For each sampled call, two files are written:
+    NAME.speedscope.json  the samples, for https://www.speedscope.app
+    NAME.lines.txt        the hottest lines (own samples) and functions
+                          (samples anywhere under them)
+Frames are per line, so speedscope shows which line of each function the
+time went to.
+"""
+
+from collections import Counter
+from pathlib import Path
+import json
+import os
+import signal
+import sys
+
+INTERVAL = 0.005  # seconds of CPU time between samples
+TOP_LINES = 30
+
+
+class Sampler:
+
+    def __init__(self, interval=INTERVAL):
+        if not hasattr(signal, "setitimer"):
+            raise RuntimeError("sampling needs signal.setitimer (Unix only)")
+        self.interval = interval
+        self.frames = {}  # (name, file, line) -> frame index
+        self.samples = []  # lists of frame indices, outermost first
+        self.base = None
+
+    def _handler(self, signum, frame):
+        stack = []
+        while frame is not None and frame is not self.base:
+            code = frame.f_code
+            key = (code.co_name, code.co_filename, frame.f_lineno)
+            stack.append(self.frames.setdefault(key, len(self.frames)))
+            frame = frame.f_back
+        stack.reverse()
+        self.samples.append(stack)
+
+    def start(self):
+        # samples are cut off at the caller's frame
+        self.base = sys._getframe(1)
+        self.previous = signal.signal(signal.SIGPROF, self._handler)
+        signal.setitimer(signal.ITIMER_PROF, self.interval, self.interval)
+
+    def stop(self):
+        signal.setitimer(signal.ITIMER_PROF, 0, 0)
+        signal.signal(signal.SIGPROF, self.previous)
+
+    def speedscope(self, name):
+        """Return the samples as a speedscope file (a dict for JSON)."""
+        frames = [
+            {"name": key[0], "file": key[1], "line": key[2]} for key in self.frames
+        ]
+        return {
+            "$schema": "https://www.speedscope.app/file-format-schema.json",
+            "name": name,
+            "exporter": "aoc.sampling",
+            "shared": {"frames": frames},
+            "profiles": [
+                {
+                    "type": "sampled",
+                    "name": name,
+                    "unit": "seconds",
+                    "startValue": 0,
+                    "endValue": len(self.samples) * self.interval,
+                    "samples": self.samples,
+                    "weights": [self.interval] * len(self.samples),
+                }
+            ],
+        }
+
+    def hot_lines(self, limit=TOP_LINES):
+        """Return a report of the lines with the most own samples, and the
+        functions with the most samples under them.
+        """
+        keys = list(self.frames)
+        total = len(self.samples) or 1
+        own = Counter(stack[-1] for stack in self.samples if stack)
+        under = Counter()
+        for stack in self.samples:
+            under.update({keys[i][:2] for i in stack})
+
+        def where(name, filename, line=None):
+            suffix = f":{line}" if line is not None else ""
+            return f"{os.path.basename(filename)}{suffix} ({name})"
+
+        out = [
+            f"{len(self.samples)} samples, "
+            f"every {self.interval * 1000:g}ms of CPU time",
+            "",
+            "hottest lines (own samples):",
+        ]
+        for i, count in own.most_common(limit):
+            out.append(f"{count:8d} {100 * count / total:5.1f}%  {where(*keys[i])}")
+        out += ["", "hottest functions (samples under them):"]
+        for (name, filename), count in under.most_common(limit):
+            out.append(
+                f"{count:8d} {100 * count / total:5.1f}%  {where(name, filename)}"
+            )
+        return "\n".join(out) + "\n"
+
+
+def sample_call(func, *args, name=None, outdir="profile", interval=INTERVAL):
+    """Call func(*args) under the sampling profiler, write the reports, and
+    return the function's result.
+    """
+    name = name or func.__name__
+    outdir = Path(outdir)
+    outdir.mkdir(parents=True, exist_ok=True)
+
+    sampler = Sampler(interval)
+    sampler.start()
+    try:
+        result = func(*args)
+    finally:
+        sampler.stop()
+        (outdir / f"{name}.speedscope.json").write_text(
+            json.dumps(sampler.speedscope(name))
+        )
+        (outdir / f"{name}.lines.txt").write_text(sampler.hot_lines())
+    return result
@@ -0,0 +1,158 @@
+"""
+Empirical complexity checks: time a solver on generated inputs of growing
+size, and fit the growth order of its run time.
+
+A Study names the solver path to time and how to scale its input: n is
+doubled from the start size, and prepare(module, n) returns the
+zero-argument callable to be timed on an input of size n (what n counts
+is given in each study's note).  The exponent k of t ~ n**k is fitted by
+least squares on log t against log n, over the largest sizes only (a
+quadratic step often hides behind the constant costs at the small ones),
+and leaving out runs too short to time reliably.  A linear solver fits
+k ~ 1; anything well above that has a hidden superlinear step (a
+list.pop(0), a string slice or a sum over a slice in a loop) that a
+production-sized input will find.  The parse cache is bypassed, so the
+parses are timed too.
+"""
+
+from dataclasses import dataclass
+from typing import Callable
+import math
+import time
+
+from aoc import parsecache
+from aoc.days import load_day, quiet_output
+from aoc.generators import generate
+
+MIN_TIME = 0.002  # seconds; shorter runs are dominated by overhead
+TAIL = 4  # fit to this many of the largest sizes
+SUPERLINEAR = 1.3  # fitted exponents above this are flagged
+ORDERS = [(0.5, "sublinear"), (1.3, "~n"), (1.7, "superlinear"), (2.5, "~n^2")]
+
+
+@dataclass
+class Study:
+
+    name: str
+    day: int
+    # prepare(module, n) returns the zero-argument callable to be timed
+    prepare: Callable
+    note: str
+
+
+@dataclass
+class Point:
+
+    size: int
+    time: float
+
+
+@dataclass
+class Fit:
+
+    exponent: float
+    last: float  # exponent over the last doubling alone
+    points: int  # number of points used in the fit
+
+    @property
+    def order(self):
+        for limit, label in ORDERS:
+            if self.exponent < limit:
+                return label
+        return "~n^3 or worse"
+
+    @property
+    def flagged(self):
+        return self.exponent > SUPERLINEAR
+
+
+def _lines(text):
+    return text.splitlines()
+
+
+def _day7_solve(module, n):
+    lines = _lines(generate(7, n, containers=n))
+    return lambda: module.solve(lines)
+
+
+def _day9_solve2(module, n):
+    lines = _lines(generate(9, n + 100, run=n))
+    target = module.solve(lines)
+    return lambda: module.solve2(lines, target)
+
+
+def _day15_solve(module, n):
+    return lambda: module.solve([0, 3, 6], 10 * n)
+
+
+def _day18_evaluate(module, n):
+    lines = _lines(generate(18, 10, terms=n, ops="+"))
+    return lambda: module.sum_values(lines)
+
+
+def _day24_set_tiles(module, n):
+    lines = _lines(generate(24, 10, steps=n))
+    return lambda: module.set_tiles(lines)
+
+
+STUDIES = {
+    study.name: study
+    for study in [
+        Study(
+            "day7-solve", 7, _day7_solve, "n bag rules, n/6 of them holding shiny gold"
+        ),
+        Study("day9-solve2", 9, _day9_solve2, "n numbers in the contiguous run"),
+        Study("day15-solve", 15, _day15_solve, "10n turns (linear control)"),
+        Study("day18-evaluate", 18, _day18_evaluate, "10 sums of n terms"),
+        Study("day24-set-tiles", 24, _day24_set_tiles, "10 paths of n steps"),
+    ]
+}
+
+
+def ladder(start=1000, steps=7):
+    """Return the input sizes: start, doubled steps - 1 times."""
+    return [start << k for k in range(steps)]
+
+
+def run_study(study, sizes, repeat=3, max_time=2.0):
+    """Time the study at each of the given sizes, and return the Points.
+    Each time is the fastest of repeat runs.  The ladder stops early once
+    a run takes longer than max_time seconds.
+    """
+    module = load_day(study.day)
+    points = []
+    with quiet_output(), parsecache.bypassed():
+        for size in sizes:
+            func = study.prepare(module, size)
+            best = math.inf
+            for _ in range(repeat):
+                start = time.perf_counter()
+                func()
+                best = min(best, time.perf_counter() - start)
+                if best > max_time:
+                    break
+            points.append(Point(size, best))
+            if best > max_time:
+                break
+    return points
+
+
+def fit_order(points, min_time=MIN_TIME, tail=TAIL):
+    """Fit t ~ n**k to the last tail points, and return the Fit.  Points
+    faster than min_time are left out, unless that would leave fewer than
+    two.
+    """
+    timed = [p for p in points[-tail:] if p.time >= min_time]
+    if len(timed) < 2:
+        timed = points[-2:]
+    if len(timed) < 2:
+        raise ValueError("need at least two points to fit a growth order")
+    xs = [math.log(p.size) for p in timed]
+    ys = [math.log(max(p.time, 1e-9)) for p in timed]
+    mx, my = sum(xs) / len(xs), sum(ys) / len(ys)
+    exponent = sum((x - mx) * (y - my) for x, y in zip(xs, ys)) / sum(
+        (x - mx) ** 2 for x in xs
+    )
+    a, b = timed[-2:]
+    last = math.log(b.time / a.time) / math.log(b.size / a.size)
+    return Fit(exponent, last, len(timed))
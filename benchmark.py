@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Benchmark the expensive solver paths, and compare them against the stored
+baseline timings.  Exits with a non-zero status if any benchmark has
+regressed by more than the threshold.
+"""
+
+import argparse
+import sys
+
+from aoc.bench import (
+    BASELINE_FILE,
+    BENCHMARKS,
+    is_regression,
+    load_baseline,
+    run_benchmark,
+    save_baseline,
+)
+
+
+def parse_args():
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "names",
+        nargs="*",
+        metavar="name",
+        help=f"Benchmarks to run (default: all); one of {', '.join(BENCHMARKS)}",
+    )
+    parser.add_argument(
+        "-n",
+        "--repeat",
+        type=int,
+        default=5,
+        help="Number of timed runs (default: %(default)s)",
+    )
+    parser.add_argument(
+        "-w",
+        "--warmup",
+        type=int,
+        default=1,
+        help="Number of untimed warm-up runs (default: %(default)s)",
+    )
+    parser.add_argument(
+        "-t",
+        "--threshold",
+        type=float,
+        default=0.10,
+        help="Allowed slowdown vs the baseline median, as a fraction "
+        "(default: %(default)s)",
+    )
+    parser.add_argument(
+        "-b",
+        "--baseline",
+        default=BASELINE_FILE,
+        help="Baseline file (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--save", action="store_true", help="Record these timings as the new baseline"
+    )
+    opt = parser.parse_args()
+    for name in opt.names:
+        if name not in BENCHMARKS:
+            parser.error(f"unknown benchmark '{name}'")
+    return opt
+
+
+def main():
+    opt = parse_args()
+    baseline = load_baseline(opt.baseline)
+
+    timings = []
+    regressions = []
+    names = opt.names or list(BENCHMARKS)
+    width = max(20, *[len(name) for name in names])
+    print(
+        f"{'benchmark':{width}} {'median':>9} {'p95':>9} {'baseline':>9} {'change':>8}"
+    )
+    print("-" * (width + 40))
+    for name in names:
+        timing = run_benchmark(BENCHMARKS[name], opt.repeat, opt.warmup)
+        timings.append(timing)
+        base = baseline.get(name)
+        if base:
+            change = timing.median / base.median - 1
+            status = ""
+            if is_regression(timing, base, opt.threshold):
+                regressions.append(name)
+                status = "  REGRESSION"
+            print(
+                f"{name:{width}} {timing.median:9.3f} {timing.p95:9.3f} "
+                f"{base.median:9.3f} {change:+8.1%}{status}"
+            )
+        else:
+            print(
+                f"{name:{width}} {timing.median:9.3f} {timing.p95:9.3f} "
+                f"{'-':>9} {'-':>8}"
+            )
+
+    if opt.save:
+        save_baseline(timings, opt.baseline)
+        print(f"saved baseline to {opt.baseline}")
+
+    if regressions:
+        print(
+            f"{len(regressions)} benchmark(s) slower than baseline by more "
+            f"than {opt.threshold:.0%}: {', '.join(regressions)}"
+        )
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
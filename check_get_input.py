@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Check get_input.py against a local stub of the puzzle site, without
+touching the network or the real inputs and cache.
+
+The stub serves made-up inputs with ETags (answering a matching
+If-None-Match with 304), and answers a day's first request with 429 and a
+Retry-After header.  Exits with a non-zero status if any check fails.
+
+    ./check_get_input.py
+"""
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+import hashlib
+import re
+import sys
+import tempfile
+import threading
+import time
+
+import get_input
+
+INPUTS = {day: f"day {day} input\n".encode() * day for day in (1, 2, 3)}
+THROTTLED_DAY = 3
+RETRY_AFTER = 2  # seconds; longer than get_input's first backoff
+PATH_RE = re.compile(r"/2020/day/(\d+)/input$")
+
+
+class StubSite(ThreadingHTTPServer):
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), StubHandler)
+        self.requests = []  # (day, time, status)
+        self.throttled = set()
+        self.lock = threading.Lock()
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.server_address[1]}/2020"
+
+
+class StubHandler(BaseHTTPRequestHandler):
+
+    def do_GET(self):
+        m = PATH_RE.match(self.path)
+        day = int(m.group(1)) if m else None
+        with self.server.lock:
+            status = self.respond(day)
+            self.server.requests.append((day, time.monotonic(), status))
+
+    def respond(self, day):
+        if day not in INPUTS or "session=" not in self.headers.get("Cookie", ""):
+            self.send_response(404)
+            self.end_headers()
+            return 404
+        if day == THROTTLED_DAY and day not in self.server.throttled:
+            self.server.throttled.add(day)
+            self.send_response(429)
+            self.send_header("Retry-After", str(RETRY_AFTER))
+            self.end_headers()
+            return 429
+        content = INPUTS[day]
+        etag = '"' + hashlib.sha256(content).hexdigest()[:16] + '"'
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.end_headers()
+            return 304
+        self.send_response(200)
+        self.send_header("ETag", etag)
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+        return 200
+
+    def log_message(self, *args):
+        pass
+
+
+def main():
+    site = StubSite()
+    threading.Thread(target=site.serve_forever, daemon=True).start()
+    failures = []
+
+    def check(name, ok):
+        print(f"{'ok' if ok else 'FAILED':>6}  {name}")
+        if not ok:
+            failures.append(name)
+
+    with tempfile.TemporaryDirectory(prefix="aoc-stub-") as tmpdir:
+        cache = get_input.InputCache(f"{tmpdir}/cache")
+        days = sorted(INPUTS)
+
+        def run(session_key="stub-session", **options):
+            return get_input.get_inputs(
+                days,
+                cache,
+                session_key,
+                site=site.url,
+                rate=100,
+                retries=2,
+                root=tmpdir,
+                **options,
+            )
+
+        statuses = run()
+        check(
+            "inputs are fetched",
+            all(s.startswith("fetched") for s in statuses.values()),
+        )
+        check(
+            "inputs are written",
+            all(
+                (Path(tmpdir) / f"day{day}" / "input.txt").read_bytes() == content
+                for day, content in INPUTS.items()
+            ),
+        )
+        throttled = [t for day, t, _ in site.requests if day == THROTTLED_DAY]
+        check(
+            "a 429 is retried after Retry-After",
+            len(throttled) == 2 and throttled[1] - throttled[0] >= RETRY_AFTER - 0.1,
+        )
+
+        count = len(site.requests)
+        statuses = run()
+        check(
+            "known inputs are served from the cache",
+            all(s.startswith("cached") for s in statuses.values())
+            and len(site.requests) == count,
+        )
+
+        statuses = run(refresh=True)
+        check(
+            "a refresh revalidates with the ETag",
+            all(s.startswith("not modified") for s in statuses.values()),
+        )
+
+        statuses = run("other-session", offline=True)
+        check(
+            "offline, another session's inputs aren't served",
+            all(s.startswith("failed") for s in statuses.values()),
+        )
+        statuses = run(None, offline=True)
+        check(
+            "offline, no session key serves nothing",
+            all(s.startswith("failed") for s in statuses.values()),
+        )
+
+    site.shutdown()
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -4,6 +4,11 @@
 #
 from pathlib import Path
 from itertools import combinations
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from aoc.inputs import load_input
+from aoc.cli import run_example, run_part
 
 
 INPUTFILE = 'input.txt'
@@ -14,14 +19,6 @@ def sample_input():
 
 # Utility functions
 
-def load_input(infile):
-    lines = []
-    with Path(infile).open() as fp:
-        for line in fp:
-            line = line.strip()
-            if line:
-                lines.append(line)
-        return lines
 
 def split_nonblank_lines(text):
     lines = []
@@ -56,10 +53,12 @@ def example():
     print("part 1: 'sample-input' -> {} (expected {})".format(result, expected))
     assert result == expected
 
-def part1(items):
+def part1(lines):
+    items = [int(v) for v in lines]
     result = solve(items)
     print("result is {}".format(result))
     print('= ' * 32)
+    return result
 
 
 # PART 2
@@ -73,13 +72,15 @@ def example2():
     print('= ' * 32)
 
 def part2(lines):
+    items = [int(v) for v in lines]
     result = solve2(items)
     print("result is {}".format(result))
     print('= ' * 32)
+    return result
 
 if __name__ == '__main__':
-    example()
-    items = [int(v) for v in load_input(INPUTFILE)]
-    part1(items)
-    example2()
-    part2(items)
+    run_example(example)
+    lines = load_input(INPUTFILE)
+    run_part(part1, lines)
+    run_example(example2)
+    run_part(part2, lines)
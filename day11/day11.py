@@ -3,6 +3,14 @@
 #  Advent of Code 2020 - day 11
 #
 from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from aoc.inputs import load_input, filter_blank_lines
+from aoc.cli import run_example, run_part
+from aoc import progress
+from aoc.automaton import Automaton, GridNeighborhood, Rule
+from aoc.grid import BitGrid
 
 INPUTFILE = "input.txt"
 
@@ -31,21 +39,47 @@ def sample_input():
     return filter_blank_lines(SAMPLE_INPUT.split("\n"))
 
 
-# Utility functions
+# Solution
 
-def load_input(infile):
-    return filter_blank_lines(Path(infile).open())
+def load_seats(lines):
+    """Return a BitGrid of the seats in the seating area."""
+    return BitGrid.from_lines(lines, on=EMPTY)
 
+def draw(lines, occupied):
+    """Return the seating chart, as a list of strings, given the (row, col)
+    positions of the occupied seats.
+    """
+    return ["".join([OCC if (r, c) in occupied else ch for c, ch in enumerate(line)])
+            for r, line in enumerate(lines)]
 
-def filter_blank_lines(lines):
-    return [line.strip() for line in lines if line.strip()]
+def seating_rule(crowd):
+    """Return the Rule for the seating area: an empty seat is taken if none
+    of its neighbors are occupied, and an occupied seat is vacated if at
+    least crowd of its neighbors are.
+    """
+    return Rule(born=frozenset([0]), survive=frozenset(range(crowd)))
 
+def solve(lines, sight=False):
+    """Solve the problem, counting either the adjacent seats, or if sight is
+    True, the first seat visible in each direction.
+    """
+    seats = load_seats(lines)
+    crowd = 5 if sight else 4
+    seating = Automaton(GridNeighborhood(seats, sight), seating_rule(crowd))
+    seating.run(progress=progress.Progress("day11.solve", unit="rounds"))
 
-# Solution
+    print("\n".join(draw(lines, seating.cells())))
+    print("-" * seats.width)
+    print(seating.report())
+    return seating.population
 
-def load_seats(lines):
+
+# Reference solver: the original string-grid simulation, which the
+# automaton's answers are checked against (see aoc.differential)
+
+def load_walled_seats(lines):
     """Return a matrix (list of lists) representing the seating area.
-    A border of floor tiles is added, to make the logic for counting neighbors simpler.
+    A border of wall tiles is added, to make the logic for counting neighbors simpler.
     """
     rows, cols = len(lines) + 2, len(lines[0]) + 2
     result = [WALL * cols] + [WALL + row + WALL for row in lines] + [WALL * cols]
@@ -115,19 +149,17 @@ def propagate2(seats):
 def same_seats(seats1, seats2):
     return all([row1 == row2 for row1, row2 in zip(seats1, seats2)])
 
-def solve(lines, propagator):
-    """Solve the problem."""
-    seats = load_seats(lines)
-    rows, cols = len(seats), len(seats[0])
-
+def solve_reference(lines, sight=False):
+    """Solve the problem with the original propagate (or propagate2, if
+    sight is True).
+    """
+    propagator = propagate2 if sight else propagate
+    seats = load_walled_seats(lines)
     while True:
         old_seats = seats
         seats = propagator(old_seats)
         if same_seats(old_seats, seats):
             break
-
-    print("\n".join(seats))
-    print("-" * cols)
     return count_occupied(seats)
 
 
@@ -136,7 +168,7 @@ def solve(lines, propagator):
 
 def example1():
     lines = sample_input()
-    result = solve(lines, propagate)
+    result = solve(lines)
     expected = 37
     print(f"'sample-input' -> {result} (expected {expected})")
     assert result == expected
@@ -144,9 +176,10 @@ def example1():
 
 
 def part1(lines):
-    result = solve(lines, propagate)
+    result = solve(lines)
     print(f"result is {result}")
     print("= " * 32)
+    return result
 
 
 # PART 2
@@ -154,7 +187,7 @@ def part1(lines):
 
 def example2():
     lines = sample_input()
-    result = solve(lines, propagate2)
+    result = solve(lines, sight=True)
     expected = 26
     print(f"'sample-input' -> {result} (expected {expected})")
     assert result == expected
@@ -162,14 +195,15 @@ def example2():
 
 
 def part2(lines):
-    result = solve(lines, propagate2)
+    result = solve(lines, sight=True)
     print(f"result is {result}")
     print("= " * 32)
+    return result
 
 
 if __name__ == "__main__":
-    example1()
+    run_example(example1)
     lines = load_input(INPUTFILE)
-    part1(lines)
-    example2()
-    part2(lines)
+    run_part(part1, lines)
+    run_example(example2)
+    run_part(part2, lines)
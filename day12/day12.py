@@ -3,6 +3,11 @@
 #  Advent of Code 2020 - day 12
 #
 from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from aoc.inputs import load_input, filter_blank_lines
+from aoc.cli import run_example, run_part
 
 INPUTFILE = "input.txt"
 
@@ -19,16 +24,6 @@ def sample_input():
     return filter_blank_lines(SAMPLE_INPUT.split("\n"))
 
 
-# Utility functions
-
-def load_input(infile):
-    return filter_blank_lines(Path(infile).open())
-
-
-def filter_blank_lines(lines):
-    return [line.strip() for line in lines if line.strip()]
-
-
 # Solution
 
 def solve(lines):
@@ -122,6 +117,7 @@ def part1(lines):
     result = solve(lines)
     print(f"result is {result}")
     print("= " * 32)
+    return result
 
 
 # PART 2
@@ -139,11 +135,12 @@ def part2(lines):
     result = solve2(lines)
     print(f"result is {result}")
     print("= " * 32)
+    return result
 
 
 if __name__ == "__main__":
-    example1()
+    run_example(example1)
     lines = load_input(INPUTFILE)
-    part1(lines)
-    example2()
-    part2(lines)
+    run_part(part1, lines)
+    run_example(example2)
+    run_part(part2, lines)
@@ -4,6 +4,12 @@
 #
 from pathlib import Path
 import math
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from aoc.inputs import load_input, filter_blank_lines
+from aoc.cli import run_example, run_part
+from aoc.numtheory import crt_tree
 
 INPUTFILE = "input.txt"
 
@@ -19,8 +25,6 @@ def sample_input():
 
 # Utility functions
 
-def load_input(infile):
-    return filter_blank_lines(Path(infile).open())
 
 def parse_input(lines):
     depart = int(lines[0])
@@ -31,11 +35,38 @@ def parse_input2(lines):
     ids = [(int(v), pos) for pos, v in enumerate(lines[1].split(",")) if v != "x"]
     return ids
 
-def filter_blank_lines(lines):
-    return [line.strip() for line in lines if line.strip()]
 
 # Solution
 
+def solve(lines):
+    """Solve the problem."""
+    depart, ids = parse_input(lines)
+    print("earliest departure:", depart)
+    print("bus ids:", ids)
+    buses = []
+    for bus_id in ids:
+        last_bus = depart % bus_id
+        if last_bus > 0:
+            buses.append((bus_id - last_bus, bus_id))
+        else:
+            buses.append((0, bus_id))
+    buses.sort()
+    delay, bus_id = buses[0]
+    return bus_id * delay
+
+def solve2(lines):
+    """Solve the problem."""
+    ids = parse_input2(lines)
+    print("bus ids and positions:", ids)
+    cong = [(n, -pos) for n, pos in ids]
+    mod, result = crt_tree(cong)
+    print(f"modulus = {mod}")
+    return result
+
+
+# Reference solver: the original one-congruence-at-a-time CRT, which the
+# numtheory port is checked against (see aoc.differential)
+
 def crt(cong):
     """Use the Chinese Remainder THeorem to solve the given system of
     congruences, cong = [(mod1, rem1), (mod2, rem2), ...] where
@@ -80,29 +111,10 @@ def ext_euclid(a, b):
         return r0, t0, s0
     return r0, s0, t0
 
-def solve(lines):
-    """Solve the problem."""
-    depart, ids = parse_input(lines)
-    print("earliest departure:", depart)
-    print("bus ids:", ids)
-    buses = []
-    for bus_id in ids:
-        last_bus = depart % bus_id
-        if last_bus > 0:
-            buses.append((bus_id - last_bus, bus_id))
-        else:
-            buses.append((0, bus_id))
-    buses.sort()
-    delay, bus_id = buses[0]
-    return bus_id * delay
-
-def solve2(lines):
-    """Solve the problem."""
-    ids = parse_input2(lines)
-    print("bus ids and positions:", ids)
-    cong = [(n, -pos) for n, pos in ids]
-    result = crt(cong)
-    return result
+def solve2_reference(lines):
+    """Solve the problem with the original crt."""
+    cong = [(n, -pos) for n, pos in parse_input2(lines)]
+    return crt(cong)
 
 # PART 1
 
@@ -118,6 +130,7 @@ def part1(lines):
     result = solve(lines)
     print(f"result is {result}")
     print("= " * 32)
+    return result
 
 
 # PART 2
@@ -134,11 +147,12 @@ def part2(lines):
     result = solve2(lines)
     print(f"result is {result}")
     print("= " * 32)
+    return result
 
 
 if __name__ == "__main__":
-    example1()
+    run_example(example1)
     lines = load_input(INPUTFILE)
-    part1(lines)
-    example2()
-    part2(lines)
+    run_part(part1, lines)
+    run_example(example2)
+    run_part(part2, lines)
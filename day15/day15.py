@@ -2,64 +2,93 @@
 #
 #  Advent of Code 2020 - day 15
 #
+from array import array
 from pathlib import Path
+import itertools
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from aoc.inputs import load_input, filter_blank_lines
+from aoc.cli import run_example, run_part
+from aoc import checkpoint, progress
 
 INPUTFILE = "input.txt"
 
 SAMPLE_INPUT = """
 """
 
-def sample_input():
-    return filter_blank_lines(SAMPLE_INPUT.split("\n"))
-
+SAMPLE_CASES = [
+    ([0, 3, 6], 436),
+    ([1, 3, 2], 1),
+    ([2, 1, 3], 10),
+    ([1, 2, 3], 27),
+    ([2, 3, 1], 78),
+    ([3, 2, 1], 438),
+    ([3, 1, 2], 1836),
+]
+
+SAMPLE_CASES2 = [
+    ([0, 3, 6], 175594),
+    ([1, 3, 2], 2578),
+    ([2, 1, 3], 3544142),
+    ([1, 2, 3], 261214),
+    ([2, 3, 1], 6895259),
+    ([3, 2, 1], 18),
+    ([3, 1, 2], 362),
+]
 
-# Utility functions
 
-def load_input(infile):
-    return filter_blank_lines(Path(infile).open())
-
-def filter_blank_lines(lines):
-    return [line.strip() for line in lines if line.strip()]
+def sample_input():
+    return filter_blank_lines(SAMPLE_INPUT.split("\n"))
 
 
 # Solution
 
 def solve(starters, turns=2020):
     """Solve the problem."""
-    hist = dict()
-    for turn, val in enumerate(starters):
-        if val not in hist:
-            nextval = 0
-        else:
-            nextval = turn + 1 - hist[val]
-        hist[val] = turn + 1
-        # print(f"{turn+1:04d}: {val:3d} ({nextval})")
-
-    for turn in range(len(starters) + 1, turns + 1):
-        val = nextval
-        if val not in hist:
-            nextval = 0
-        else:
-            nextval = turn - hist[val]
-        hist[val] = turn
-        # print(f"{turn:04d}: {val:3d}  {nextval}")
-        lastval = val
+    ckpt = checkpoint.Checkpoint("day15.solve", starters, turns)
+    state = ckpt.load()
+    if state:
+        meta, arrays = state
+        pairs = arrays["hist"]
+        hist = dict(zip(pairs[::2], pairs[1::2]))
+        start, nextval, lastval = meta["turn"], meta["nextval"], meta["lastval"]
+    else:
+        hist = dict()
+        for turn, val in enumerate(starters):
+            if val not in hist:
+                nextval = 0
+            else:
+                nextval = turn + 1 - hist[val]
+            hist[val] = turn + 1
+            # print(f"{turn+1:04d}: {val:3d} ({nextval})")
+        start = len(starters) + 1
+
+    prog = progress.Progress("day15.solve", total=turns - len(starters), unit="turns",
+                             done=start - len(starters) - 1)
+    for block in prog.ranges(start, turns + 1, split=ckpt.enabled):
+        for turn in block:
+            val = nextval
+            if val not in hist:
+                nextval = 0
+            else:
+                nextval = turn - hist[val]
+            hist[val] = turn
+            # print(f"{turn:04d}: {val:3d}  {nextval}")
+            lastval = val
+        if ckpt.due():
+            pairs = array("q", itertools.chain.from_iterable(hist.items()))
+            meta = {"turn": block.stop, "nextval": nextval, "lastval": lastval}
+            ckpt.save(meta, hist=pairs)
+    prog.finish()
+    ckpt.done()
     return lastval
 
 
 # PART 1
 
-def example1():
+def example1(cases=SAMPLE_CASES):
     """Run example for problem with input arguments."""
-    cases = [
-        ([0, 3, 6], 436),
-        ([1, 3, 2], 1),
-        ([2, 1, 3], 10),
-        ([1, 2, 3], 27),
-        ([2, 3, 1], 78),
-        ([3, 2, 1], 438),
-        ([3, 1, 2], 1836),
-    ]
     for arg, expected in cases:
         result = solve(arg)
         print(f"'{arg}' -> {result} (expected {expected})")
@@ -72,21 +101,13 @@ def part1(lines):
     result = solve(starters)
     print(f"result is {result}")
     print("= " * 32)
+    return result
 
 
 # PART 2
 
-def example2():
+def example2(cases=SAMPLE_CASES2):
     """Run example for problem with input arguments."""
-    cases = [
-        ([0, 3, 6], 175594),
-        ([1, 3, 2], 2578),
-        ([2, 1, 3], 3544142),
-        ([1, 2, 3], 261214),
-        ([2, 3, 1], 6895259),
-        ([3, 2, 1], 18),
-        ([3, 1, 2], 362),
-    ]
     for arg, expected in cases:
         result = solve(arg, 30000000)
         print(f"'{arg}' -> {result} (expected {expected})")
@@ -99,11 +120,12 @@ def part2(lines):
     result = solve(starters, 30000000)
     print(f"result is {result}")
     print("= " * 32)
+    return result
 
 
 if __name__ == "__main__":
-    example1()
+    run_example(example1)
     lines = load_input(INPUTFILE)
-    part1(lines)
-    example2()
-    part2(lines)
+    run_part(part1, lines)
+    run_example(example2)
+    run_part(part2, lines)
@@ -5,7 +5,12 @@
 from pathlib import Path
 from collections import defaultdict
 import math
-from pprint import pprint
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from aoc.inputs import load_lines, parse_sections
+from aoc.cli import run_example, run_part
+from aoc.parsecache import parse_once
 
 INPUTFILE = "input.txt"
 
@@ -65,14 +70,9 @@ class Field():
 def maybe_valid(rules, val):
     return any([field.valid(val) for field in rules.values()])
 
-def load_input(infile):
-    lines = [line.strip("\n") for line in list(Path(infile).open())]
-    while not lines[0]:
-        lines = lines[1:]
-    while not lines[-1]:
-        lines = lines[:-1]
-    return lines
+load_input = load_lines
 
+@parse_once
 def parse_input(lines):
     """Parse the input document, which contains validity rules for the various
     ticket fields, a representation of my ticket, and representations of a
@@ -92,22 +92,6 @@ def parse_rules(lines):
         fields[field.name] = field
     return fields
 
-def parse_sections(lines):
-    """Parse the input document into sections, separated by blank lines.
-    A list of lists is returned.  Each item is the list of lines for a section.
-    """
-    secid = 0
-    section = []
-    for line in lines:
-        if not line.strip():
-            secid += 1
-            continue
-        if len(section) == secid:
-            section.append([line])
-        else:
-            section[secid].append(line)
-    return [v for v in section if v]
-
 def parse_ticket(line):
     return [int(v) for v in line.split(",")]
 
@@ -173,6 +157,7 @@ def part1(lines):
     result = solve(lines)
     print(f"result is {result}")
     print("= " * 32)
+    return result
 
 
 # PART 2
@@ -189,16 +174,18 @@ def example2():
 
 def part2(lines):
     ticket = solve2(lines)
+    from pprint import pprint   # only needed for the report
     print("my ticket:")
     pprint(ticket)
     result = math.prod([v for k, v in ticket.items() if "departure" in k])
     print(f"result is {result}")
     print("= " * 32)
+    return result
 
 
 if __name__ == "__main__":
-    example1()
+    run_example(example1)
     lines = load_input(INPUTFILE)
-    part1(lines)
-    example2()
-    part2(lines)
+    run_part(part1, lines)
+    run_example(example2)
+    run_part(part2, lines)
@@ -4,6 +4,14 @@
 #
 from pathlib import Path
 from collections import defaultdict
+import itertools
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from aoc.inputs import load_input, filter_blank_lines
+from aoc.cli import run_example, run_part
+from aoc.automaton import LIFE, Automaton, bounds, moore
+from aoc import checkpoint
 
 INPUTFILE = "input.txt"
 
@@ -13,166 +21,78 @@ SAMPLE_INPUT = """
 ###
 """
 
-NEIGHBORS = [
-    (0, 0, -1),
-    (0, 0, 1),
-
-    (0, -1, 0),
-    (0, -1, -1),
-    (0, -1, 1),
-
-    (0, 1, 0),
-    (0, 1, -1),
-    (0, 1, 1),
-
-    (-1, 0, 0),
-    (-1, 0, -1),
-    (-1, 0, 1),
-
-    (-1, -1, 0),
-    (-1, -1, -1),
-    (-1, -1, 1),
-
-    (-1, 1, 0),
-    (-1, 1, -1),
-    (-1, 1, 1),
-
-    (1, 0, 0),
-    (1, 0, -1),
-    (1, 0, 1),
-
-    (1, -1, 0),
-    (1, -1, -1),
-    (1, -1, 1),
-
-    (1, 1, 0),
-    (1, 1, -1),
-    (1, 1, 1),
-]
-
-NEIGHBORS4 = [
-    (0, 0, -1, 0),
-    (0, 0, 1, 0),
-
-    (0, -1, 0, 0),
-    (0, -1, -1, 0),
-    (0, -1, 1, 0),
-
-    (0, 1, 0, 0),
-    (0, 1, -1, 0),
-    (0, 1, 1, 0),
-
-    (-1, 0, 0, 0),
-    (-1, 0, -1, 0),
-    (-1, 0, 1, 0),
-
-    (-1, -1, 0, 0),
-    (-1, -1, -1, 0),
-    (-1, -1, 1, 0),
-
-    (-1, 1, 0, 0),
-    (-1, 1, -1, 0),
-    (-1, 1, 1, 0),
-
-    (1, 0, 0, 0),
-    (1, 0, -1, 0),
-    (1, 0, 1, 0),
-
-    (1, -1, 0, 0),
-    (1, -1, -1, 0),
-    (1, -1, 1, 0),
-
-    (1, 1, 0, 0),
-    (1, 1, -1, 0),
-    (1, 1, 1, 0),
-
-    (0, 0, 0, -1),
-    (0, 0, -1, -1),
-    (0, 0, 1, -1),
-
-    (0, -1, 0, -1),
-    (0, -1, -1, -1),
-    (0, -1, 1, -1),
-
-    (0, 1, 0, -1),
-    (0, 1, -1, -1),
-    (0, 1, 1, -1),
-
-    (-1, 0, 0, -1),
-    (-1, 0, -1, -1),
-    (-1, 0, 1, -1),
-
-    (-1, -1, 0, -1),
-    (-1, -1, -1, -1),
-    (-1, -1, 1, -1),
-
-    (-1, 1, 0, -1),
-    (-1, 1, -1, -1),
-    (-1, 1, 1, -1),
+NEIGHBORS = [d for d in itertools.product((-1, 0, 1), repeat=3) if any(d)]
 
-    (1, 0, 0, -1),
-    (1, 0, -1, -1),
-    (1, 0, 1, -1),
-
-    (1, -1, 0, -1),
-    (1, -1, -1, -1),
-    (1, -1, 1, -1),
-
-    (1, 1, 0, -1),
-    (1, 1, -1, -1),
-    (1, 1, 1, -1),
-
-    (0, 0, 0, 1),
-    (0, 0, -1, 1),
-    (0, 0, 1, 1),
-
-    (0, -1, 0, 1),
-    (0, -1, -1, 1),
-    (0, -1, 1, 1),
-
-    (0, 1, 0, 1),
-    (0, 1, -1, 1),
-    (0, 1, 1, 1),
-
-    (-1, 0, 0, 1),
-    (-1, 0, -1, 1),
-    (-1, 0, 1, 1),
-
-    (-1, -1, 0, 1),
-    (-1, -1, -1, 1),
-    (-1, -1, 1, 1),
-
-    (-1, 1, 0, 1),
-    (-1, 1, -1, 1),
-    (-1, 1, 1, 1),
-
-    (1, 0, 0, 1),
-    (1, 0, -1, 1),
-    (1, 0, 1, 1),
-
-    (1, -1, 0, 1),
-    (1, -1, -1, 1),
-    (1, -1, 1, 1),
-
-    (1, 1, 0, 1),
-    (1, 1, -1, 1),
-    (1, 1, 1, 1),
-]
+NEIGHBORS4 = [d for d in itertools.product((-1, 0, 1), repeat=4) if any(d)]
 
 def sample_input():
     return filter_blank_lines(SAMPLE_INPUT.split("\n"))
 
 
-# Utility functions
+# Solution
 
-def load_input(infile):
-    return filter_blank_lines(Path(infile).open())
+def parse_input(lines, dims=3):
+    """Return a set of the coordinates of the active cubes, in the given
+    number of dimensions.
+    """
+    extra = (0,) * (dims - 2)
+    cells = set()
+    for r, row in enumerate(lines):
+        for c, ch in enumerate(row):
+            if ch == "#":
+                cells.add((c, -r) + extra)
+    return cells
+
+def print_grid(cells):
+    """Print each x-y slice of the given cells, in any number of dimensions."""
+    (xmin, xmax), (ymin, ymax), *rest = bounds(cells)
+    for extra in itertools.product(*[range(lo, hi+1) for lo, hi in reversed(rest)]):
+        extra = extra[::-1]
+        print(", ".join([f"{name}={v}" for name, v in zip("zw", extra)]))
+        for y in range(ymax, ymin-1, -1):
+            row = ["#" if (x, y) + extra in cells else "." for x in range(xmin, xmax+1)]
+            print("".join(row))
+        print()
 
-def filter_blank_lines(lines):
-    return [line.strip() for line in lines if line.strip()]
+def run_cycles(lines, dims, cycles=6):
+    """Run the given number of cycles of the pocket dimension, and return
+    the number of active cubes.
+    """
+    ckpt = checkpoint.Checkpoint("day17.run_cycles", lines, dims, cycles)
+    state = ckpt.load()
+    if state:
+        meta, arrays = state
+        start, cells = meta["cycle"], checkpoint.unpack_cells(arrays["cells"], dims)
+        print(f"After {start} cycles (resumed):")
+    else:
+        start, cells = 0, parse_input(lines, dims)
+        print("Before any cycles:")
+    print_grid(cells)
+
+    life = Automaton(moore(dims), LIFE, cells)
+    for iter in range(start + 1, cycles + 1):
+        print()
+        life.step()
+        print(f"After {iter} cycles:")
+        print()
+        print_grid(life.cells())
+        if ckpt.due():
+            ckpt.save({"cycle": iter}, cells=checkpoint.pack_cells(life.cells()))
+    ckpt.done()
+    print(life.report())
+    return life.population
 
+def solve(lines):
+    """Solve the problem."""
+    return run_cycles(lines, 3)
+
+def solve2(lines):
+    """Solve the problem."""
+    return run_cycles(lines, 4)
 
-# Solution
+
+# Reference solver: the original dict-grid simulation, which the
+# automaton's answers are checked against (see aoc.differential)
 
 def neighbors(grid, xyz):
     """Return the number of active neghbors for cel xyz on the given grid.
@@ -186,38 +106,6 @@ def neighbors(grid, xyz):
             result += 1
     return result
 
-def parse_input(lines):
-    grid = defaultdict(int)
-    for r, row in enumerate(lines):
-        for c, ch in enumerate(row):
-            if ch == "#":
-                grid[(c, -r, 0)] = 1
-    return grid
-
-def bounds(grid):
-    """Return a list of tuples reporting the min and max value of each coordinate
-    in the given grid.
-    """
-    xmin, ymin, zmin = list(grid.keys())[0]
-    xmax, ymax, zmax = xmin, ymin, zmin 
-    for x, y, z in grid:
-        xmin = min(xmin, x)
-        ymin = min(ymin, y)
-        zmin = min(zmin, z)
-        xmax = max(xmax, x)
-        ymax = max(ymax, y)
-        zmax = max(zmax, z)
-    return [(xmin, xmax), (ymin, ymax), (zmin, zmax)]
-
-def print_grid(grid):
-    (xmin, xmax), (ymin, ymax), (zmin, zmax) = bounds(grid)
-    for z in range(zmin, zmax+1):
-        print(f"z={z}")
-        for y in range(ymax, ymin-1, -1):
-            row = ["#" if grid[(x, y, z)] else "." for x in range(xmin, xmax+1)]
-            print("".join(row))
-        print()
-
 def propagate(grid):
     """Propagate the given grid for a single cycle.
     The propagated grid is returned.  (The input grid is untouched.)
@@ -235,28 +123,10 @@ def propagate(grid):
                     result[(x, y, z)] = 1
     return result
 
-def solve(lines):
-    """Solve the problem."""
-    grid = parse_input(lines)
-    print("Before any cycles:")
-    print_grid(grid)
-
-    for iter in range(1, 7):
-        print()
-        grid = propagate(grid)
-        print(f"After {iter} cycles:")
-        print()
-        print_grid(grid)
-
-    return sum(grid.values())
-
-
-# Part 2 code
-
 def neighbors4(grid, xyzw):
-    """Return the number of active neghbors for cel xyz on the given grid.
+    """Return the number of active neghbors for cel xyzw on the given grid.
     grid is a dict mapping coordinates to 0 (inactive) or 1 (active).
-    xyz is a list or tuple of three integer coordinates.
+    xyzw is a list or tuple of four integer coordinates.
     """
     x, y, z, w = xyzw
     result = 0
@@ -265,47 +135,12 @@ def neighbors4(grid, xyzw):
             result += 1
     return result
 
-def parse_input4(lines):
-    grid = defaultdict(int)
-    for r, row in enumerate(lines):
-        for c, ch in enumerate(row):
-            if ch == "#":
-                grid[(c, -r, 0, 0)] = 1
-    return grid
-
-def bounds4(grid):
-    """Return a list of tuples reporting the min and max value of each coordinate
-    in the given grid.
-    """
-    xmin, ymin, zmin, wmin = list(grid.keys())[0]
-    xmax, ymax, zmax, wmax = xmin, ymin, zmin, wmin
-    for x, y, z, w in grid:
-        xmin = min(xmin, x)
-        ymin = min(ymin, y)
-        zmin = min(zmin, z)
-        wmin = min(wmin, w)
-        xmax = max(xmax, x)
-        ymax = max(ymax, y)
-        zmax = max(zmax, z)
-        wmax = max(wmax, w)
-    return [(xmin, xmax), (ymin, ymax), (zmin, zmax), (wmin, wmax)]
-
-def print_grid4(grid):
-    (xmin, xmax), (ymin, ymax), (zmin, zmax), (wmin, wmax) = bounds4(grid)
-    for w in range(wmin, wmax+1):
-        for z in range(zmin, zmax+1):
-            print(f"z={z}, w={w}")
-            for y in range(ymax, ymin-1, -1):
-                row = ["#" if grid[(x, y, z, w)] else "." for x in range(xmin, xmax+1)]
-                print("".join(row))
-            print()
-
 def propagate4(grid):
     """Propagate the given grid for a single cycle.
     The propagated grid is returned.  (The input grid is untouched.)
     """
     result = defaultdict(int)
-    (xmin, xmax), (ymin, ymax), (zmin, zmax), (wmin, wmax) = bounds4(grid)
+    (xmin, xmax), (ymin, ymax), (zmin, zmax), (wmin, wmax) = bounds(grid)
     for x in range(xmin-1, xmax+2):
         for y in range(ymin-1, ymax+2):
             for z in range(zmin-1, zmax+2):
@@ -318,19 +153,14 @@ def propagate4(grid):
                         result[(x, y, z, w)] = 1
     return result
 
-def solve2(lines):
-    """Solve the problem."""
-    grid = parse_input4(lines)
-    print("Before any cycles:")
-    print_grid4(grid)
-
-    for iter in range(1, 7):
-        print()
-        grid = propagate4(grid)
-        print(f"After {iter} cycles:")
-        print()
-        print_grid4(grid)
-
+def solve_reference(lines, dims=3, cycles=6):
+    """Solve the problem with the original propagate (or propagate4, if
+    dims is 4).
+    """
+    propagator = propagate4 if dims == 4 else propagate
+    grid = defaultdict(int, dict.fromkeys(parse_input(lines, dims), 1))
+    for _ in range(cycles):
+        grid = propagator(grid)
     return sum(grid.values())
 
 # PART 1
@@ -349,6 +179,7 @@ def part1(lines):
     result = solve(lines)
     print(f"result is {result}")
     print("= " * 32)
+    return result
 
 
 # PART 2
@@ -367,11 +198,12 @@ def part2(lines):
     result = solve2(lines)
     print(f"result is {result}")
     print("= " * 32)
+    return result
 
 
 if __name__ == "__main__":
-    example1()
+    run_example(example1)
     lines = load_input(INPUTFILE)
-    part1(lines)
-    example2()
-    part2(lines)
+    run_part(part1, lines)
+    run_example(example2)
+    run_part(part2, lines)
@@ -3,7 +3,14 @@
 #  Advent of Code 2020 - day 18
 #
 from pathlib import Path
+import functools
 import re
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from aoc.inputs import load_input
+from aoc.cli import run_example, run_part
+from aoc.mapreduce import map_reduce
 
 INPUTFILE = "input.txt"
 
@@ -48,15 +55,6 @@ PREC2 = {
 TOKEN_RE = re.compile(r" *(\d+|[+*()])")
 
 
-# Utility functions
-
-def load_input(infile):
-    return filter_blank_lines(Path(infile).open())
-
-def filter_blank_lines(lines):
-    return [line.strip() for line in lines if line.strip()]
-
-
 # Solution
 
 def parse_expression(expr):
@@ -142,11 +140,25 @@ def evaluate(expr, prec=PREC1):
     return output.pop()
 
 
+def sum_values(lines, prec=PREC1):
+    """Return the sum of the values of the expressions in lines."""
+    return sum([evaluate(line, prec) for line in lines])
+
+
+def solve_file(infile, jobs=None):
+    """Solve the problem for a (large) input file, in parallel chunks."""
+    return map_reduce(infile, sum_values, jobs=jobs)
+
+
+def solve2_file(infile, jobs=None):
+    return map_reduce(infile, functools.partial(sum_values, prec=PREC2), jobs=jobs)
+
+
 # PART 1
 
-def example1():
+def example1(cases=SAMPLE_CASES):
     """Run example for problem with input arguments."""
-    for arg, expected in SAMPLE_CASES:
+    for arg, expected in cases:
         result = evaluate(arg)
         print(f"'{arg}' -> {result} (expected {expected})")
         assert result == expected
@@ -154,16 +166,17 @@ def example1():
 
 
 def part1(lines):
-    result = sum([evaluate(line) for line in lines])
+    result = sum_values(lines)
     print(f"result is {result}")
     print("= " * 32)
+    return result
 
 
 # PART 2
 
-def example2():
+def example2(cases=SAMPLE_CASES2):
     """Run example for problem with input arguments."""
-    for arg, expected in SAMPLE_CASES2:
+    for arg, expected in cases:
         result = evaluate(arg, prec=PREC2)
         print(f"'{arg}' -> {result} (expected {expected})")
         assert result == expected
@@ -171,14 +184,15 @@ def example2():
 
 
 def part2(lines):
-    result = sum([evaluate(line, prec=PREC2) for line in lines])
+    result = sum_values(lines, PREC2)
     print(f"result is {result}")
     print("= " * 32)
+    return result
 
 
 if __name__ == "__main__":
-    example1()
+    run_example(example1)
     lines = load_input(INPUTFILE)
-    part1(lines)
-    example2()
-    part2(lines)
+    run_part(part1, lines)
+    run_example(example2)
+    run_part(part2, lines)
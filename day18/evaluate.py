@@ -45,7 +45,6 @@ def parse_expression(expr):
     """
     tokens = []
     idx = 0
-    print(expr[idx:])
     m = TOKEN_RE.match(expr[idx:])
     while m:
         token = m.group(1)
@@ -54,7 +53,6 @@ def parse_expression(expr):
             tokens.append(int(token))
         else:
             tokens.append(token)
-        print(expr[idx:])
         m = TOKEN_RE.match(expr[idx:])
     return tokens
 
@@ -92,7 +90,6 @@ def evaluate(expr):
         token = tokens.pop(0)
         if is_val(token):
             output.append(token)
-            print(f"token: {token} // output: {output} // ops: {opstack}")
             continue
 
         if token in OPERATORS:
@@ -102,12 +99,10 @@ def evaluate(expr):
                 val1 = output.pop()
                 output.append(apply_op(op, val1, val2))
             opstack.append(token)
-            print(f"token: {token} // output: {output} // ops: {opstack}")
             continue
 
         if token == LPAREN:
             opstack.append(token)
-            print(f"token: {token} // output: {output} // ops: {opstack}")
             continue
 
         if token == RPAREN:
@@ -117,7 +112,6 @@ def evaluate(expr):
                 val1 = output.pop()
                 output.append(apply_op(op, val1, val2))
                 op = opstack.pop()
-            print(f"token: {token} // output: {output} // ops: {opstack}")
             continue
 
     while opstack:
@@ -125,6 +119,5 @@ def evaluate(expr):
         val2 = output.pop()
         val1 = output.pop()
         output.append(apply_op(op, val1, val2))
-        print(f"------   // output: {output} // ops: {opstack}")
 
     return output.pop()
@@ -4,6 +4,11 @@
 #
 from pathlib import Path
 from pprint import pprint
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from aoc.inputs import load_lines
+from aoc.cli import run_example, run_part
 
 INPUTFILE = "input.txt"
 
@@ -75,11 +80,7 @@ bbbbbbbaaaabbbbaaabbabaaa
 
 # Utility functions
 
-def load_input(infile):
-    return [v.strip() for v in Path(infile).open()]
-
-def filter_blank_lines(lines):
-    return [line.strip() for line in lines if line.strip()]
+load_input = load_lines
 
 
 # Solution
@@ -239,8 +240,8 @@ def part2(lines):
 
 
 if __name__ == "__main__":
-    example1()
+    run_example(example1)
     lines = load_input(INPUTFILE)
-    part1(lines)
-    example2()
-    part2(lines)
+    run_part(part1, lines)
+    run_example(example2)
+    run_part(part2, lines)
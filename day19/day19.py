@@ -3,7 +3,14 @@
 #  Advent of Code 2020 - day 19
 #
 from pathlib import Path
-from pprint import pprint
+import functools
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from aoc.inputs import load_lines
+from aoc.cli import run_example, run_part
+from aoc import counters
+from aoc.mapreduce import map_reduce, header_end, read_header
 
 INPUTFILE = "input.txt"
 
@@ -79,11 +86,7 @@ bbbbbbbaaaabbbbaaabbabaaa
 
 # Utility functions
 
-def load_input(infile):
-    return [v.strip() for v in Path(infile).open()]
-
-def filter_blank_lines(lines):
-    return [line.strip() for line in lines if line.strip()]
+load_input = load_lines
 
 
 # Solution
@@ -122,6 +125,7 @@ def expand_rules(rule):
     """Propagate static rules, to simplify the search tree."""
     pass
 
+@counters.counted("day19.match_rule")
 def match_rule(rule, message, num, idx, step=0):
     """Returns an integer, reporting the new message position, if we
     successfully matched the message, or 0 if we did not match it.
@@ -191,13 +195,8 @@ def validate(rule, message):
     return False
 
 
-def solve(lines):
-    """Solve the problem."""
-    rule, messages = parse_input(lines)
-    print("RULES:")
-    pprint(rule)
-    # print("MESSAGES:")
-    # print("\n".join(messages))
+def count_valid(messages, rule):
+    """Return the number of the messages that are valid."""
     result = 0
     for message in messages:
         if validate(rule, message):
@@ -205,21 +204,52 @@ def solve(lines):
     return result
 
 
-def solve2(lines):
-    """Solve the problem."""
-    rule, messages = parse_input(lines)
+def loop_rules(rule):
+    """Replace rules 8 and 11 with their looping versions, for part 2."""
     rule['8'] = [['42'], ['42', '8']]
     rule['11'] = [['42', '31'], ['42', '11', '31']]
     rule['0'] = [['42+', '11']]
+    return rule
+
+
+def print_rules(rule):
+    from pprint import pprint   # only needed for the report
     print("RULES:")
     pprint(rule)
+
+
+def solve(lines):
+    """Solve the problem."""
+    rule, messages = parse_input(lines)
+    print_rules(rule)
+    # print("MESSAGES:")
+    # print("\n".join(messages))
+    return count_valid(messages, rule)
+
+
+def solve2(lines):
+    """Solve the problem."""
+    rule, messages = parse_input(lines)
+    loop_rules(rule)
+    print_rules(rule)
     print("MESSAGES:")
     print("\n".join(messages))
-    result = 0
-    for message in messages:
-        if validate(rule, message):
-            result += 1
-    return result
+    return count_valid(messages, rule)
+
+
+def solve_file(infile, jobs=None, looping=False):
+    """Solve the problem for a (large) input file: the rules are parsed
+    here, and the messages after them are checked in parallel chunks.
+    """
+    rule, _ = parse_input(read_header(infile) + [""])
+    if looping:
+        loop_rules(rule)
+    return map_reduce(infile, functools.partial(count_valid, rule=rule), jobs=jobs,
+                      start=header_end(infile))
+
+
+def solve2_file(infile, jobs=None):
+    return solve_file(infile, jobs, looping=True)
 
 
 # PART 1
@@ -241,6 +271,7 @@ def part1(lines):
     print(f"result is {result}")
     assert result == 149
     print("= " * 32)
+    return result
 
 
 # PART 2
@@ -261,11 +292,12 @@ def part2(lines):
     result = solve2(lines)
     print(f"result is {result}")
     print("= " * 32)
+    return result
 
 
 if __name__ == "__main__":
-    example1()
+    run_example(example1)
     lines = load_input(INPUTFILE)
-    part1(lines)
-    example2()
-    part2(lines)
+    run_part(part1, lines)
+    run_example(example2)
+    run_part(part2, lines)
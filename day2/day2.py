@@ -4,7 +4,14 @@
 #
 from pathlib import Path
 from collections import Counter
+import functools
 import re
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from aoc.inputs import load_input, filter_blank_lines
+from aoc.cli import run_example, run_part
+from aoc.mapreduce import map_reduce
 
 LINE_RE = re.compile(r"(\d+)-(\d+) (\w): (\w+)$")
 
@@ -17,17 +24,6 @@ def sample_input():
 2-9 c: ccccccccc
 """.split("\n"))
 
-# Utility functions
-
-def load_input(infile):
-    return filter_blank_lines(Path(infile).open())
-
-def filter_blank_lines(lines):
-    for line in lines:
-        line = line.strip()
-        if line:
-            yield line
-
 # Solution
 
 def is_valid(line: str) -> bool:
@@ -53,6 +49,13 @@ def solve(lines, is_valid) -> int:
             count += 1
     return count
 
+def solve_file(infile, jobs=None) -> int:
+    """Solve the problem for a (large) input file, in parallel chunks."""
+    return map_reduce(infile, functools.partial(solve, is_valid=is_valid), jobs=jobs)
+
+def solve2_file(infile, jobs=None) -> int:
+    return map_reduce(infile, functools.partial(solve, is_valid=is_valid2), jobs=jobs)
+
 # PART 1
 
 def example():
@@ -67,6 +70,7 @@ def part1(lines):
     result = solve(lines, is_valid)
     print("result is {}".format(result))
     print('= ' * 32)
+    return result
 
 
 # PART 2
@@ -83,10 +87,11 @@ def part2(lines):
     result = solve(lines, is_valid2)
     print("result is {}".format(result))
     print('= ' * 32)
+    return result
 
 if __name__ == '__main__':
-    example()
+    run_example(example)
     lines = list(load_input(INPUTFILE))
-    part1(lines)
-    example2()
-    part2(lines)
+    run_part(part1, lines)
+    run_example(example2)
+    run_part(part2, lines)
@@ -3,20 +3,21 @@
 #  Advent of Code 2020 - day 20
 #
 from pathlib import Path
-from copy import deepcopy
 from collections import defaultdict
 import re
 import math
-import pdb
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from aoc.inputs import load_lines, parse_sections
+from aoc.cli import run_example, run_part
+from aoc.grid import BitGrid
+from aoc.parsecache import parse_once
 
 INPUTFILE = "input.txt"
 
 HEADER_RE = re.compile(r"Tile (\d+):")
 
-MONSTER_RE1 = re.compile(r"..................#.")
-MONSTER_RE2 = re.compile(r"#....##....##....###")
-MONSTER_RE3 = re.compile(r".#..#..#..#..#..#...")
-
 MONSTER = [
     "                  # ",
     "#    ##    ##    ###",
@@ -158,11 +159,11 @@ def sample_input():
 
 # Utility functions
 
-def load_input(infile):
-    return [line.strip() for line in Path(infile).open()]
+load_input = load_lines
 
 # Solution
 
+@parse_once
 def parse_input(lines):
     """Return a dict mapping tile id to a 10x10 array,
     representing the tile.
@@ -174,21 +175,6 @@ def parse_input(lines):
         tiles.append(tile)
     return Mosaic(tiles)
 
-def parse_sections(lines):
-    result = []
-    sect = []
-    for line in lines:
-        line = line.strip()
-        if not line:
-            if sect:
-                result.append(sect)
-            sect = []
-        else:
-            sect.append(line)
-    if sect:
-        result.append(sect)
-    return result
-
 
 class Mosaic():
     def __init__(self, tiles):
@@ -448,23 +434,25 @@ def assemble_tiles(tiles, topleft):
     """
     return []
 
-def find_monsters(rows):
-    row_len = len(rows[0])
+def find_monsters(image):
+    """Return a list of the (row, col) positions of the top left corners of
+    the sea monsters in the given image (a BitGrid).
+    """
+    monster = BitGrid.from_lines(MONSTER, on="#")
+    # bit c of found is set while a monster could start at column c
+    starts = (1 << (image.width - MONSTER_LEN + 1)) - 1
     matches = []
-    r = 2
-    while r < len(rows):
-        pos = 0
-        while pos <= row_len:
-            m = MONSTER_RE3.search(rows[r], pos)
-            if not m:
-                break
-            # print(f"<match 3 @ {r},{m.start()}>")
-            start = m.start()
-            if MONSTER_RE2.match(rows[r-1], start) and MONSTER_RE1.match(rows[r-2], start):
-                matches.append((r, start))
-                print(f"*** MATCH @ {r}, {start}")
-            pos = start + 1
-        r += 1
+    for r in range(image.height - len(MONSTER) + 1):
+        found = starts
+        for dr, bits in enumerate(monster.rows):
+            row = image.rows[r + dr]
+            for dc in range(MONSTER_LEN):
+                if bits >> dc & 1:
+                    found &= row >> dc
+        while found:
+            low = found & -found
+            matches.append((r, low.bit_length() - 1))
+            found ^= low
     return matches
 
 
@@ -477,53 +465,20 @@ def solve2(lines):
     """Solve the problem."""
     moz  = parse_input(lines)
 
-    # assemble the tiles using each of the corners as the top left corner
-    # and search each of those for the sea monsters
-    result = 100 * moz.tile_count  # total number of pixels
-
+    # assemble the image, and search it for sea monsters in each of its
+    # orientations
     moz.set_top_left(moz.corners[0].id)
-    pixels = moz.pixels()
-    total_pixels = sum([row.count('#') for row in pixels])
+    image = BitGrid.from_lines(moz.pixels(), on="#")
+    total_pixels = image.count()
     print(f"total pixels: {total_pixels}")
 
-    for corner in moz.corners:
-        moz.set_top_left(corner.id)
-        pixels = moz.pixels()
-        print("\n".join(pixels))
-        matches = find_monsters(pixels)
-        if matches:
-            print(f"==> {len(matches)} SEA MONSTERS FOUND")
-            result = min(result, total_pixels - (MONSTER_PIXELS * len(matches)))
-        else:
-            print("==> no matches")
-
-        pixels = [row[::-1] for row in pixels]
-        print("\n".join(pixels))
-        matches = find_monsters(pixels)
-        if matches:
-            print(f"==> {len(matches)} SEA MONSTERS FOUND")
-            result = min(result, total_pixels - (MONSTER_PIXELS * len(matches)))
-        else:
-            print("==> no matches")
-
-        pixels = pixels[::-1]
-        print("\n".join(pixels))
-        matches = find_monsters(pixels)
+    result = total_pixels
+    for oriented in image.orientations():
+        matches = find_monsters(oriented)
         if matches:
+            print("\n".join(oriented.to_lines()))
             print(f"==> {len(matches)} SEA MONSTERS FOUND")
             result = min(result, total_pixels - (MONSTER_PIXELS * len(matches)))
-        else:
-            print("==> no matches")
-
-        pixels = [row[::-1] for row in pixels]
-        print("\n".join(pixels))
-        matches = find_monsters(pixels)
-        if matches:
-            print(f"==> {len(matches)} SEA MONSTERS FOUND")
-            result = min(result, total_pixels - (MONSTER_PIXELS * len(matches)))
-        else:
-            print("==> no matches")
-
     return result
 
 
@@ -543,6 +498,7 @@ def part1(lines):
     result = solve(lines)
     print(f"result is {result}")
     print("= " * 32)
+    return result
 
 
 # PART 2
@@ -561,11 +517,12 @@ def part2(lines):
     result = solve2(lines)
     print(f"result is {result}")
     print("= " * 32)
+    return result
 
 
 if __name__ == "__main__":
-    example1()
+    run_example(example1)
     lines = load_input(INPUTFILE)
-    part1(lines)
-    example2()
-    part2(lines)
+    run_part(part1, lines)
+    run_example(example2)
+    run_part(part2, lines)
@@ -3,6 +3,12 @@
 #  Advent of Code 2020 - day 22
 #
 from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from aoc.inputs import load_lines, parse_sections
+from aoc.cli import run_example, run_part
+from aoc import counters
 
 INPUTFILE = "input.txt"
 
@@ -28,23 +34,7 @@ Player 2:
 def sample_input():
     return SAMPLE_INPUT.strip("\n").split("\n")
 
-def load_input(infile):
-    return [line.strip() for line in Path(infile).open()]
-
-def parse_sections(lines):
-    result = []
-    sect = []
-    for line in lines:
-        line = line.strip()
-        if not line:
-            if sect:
-                result.append(sect)
-            sect = []
-        else:
-            sect.append(line)
-    if sect:
-        result.append(sect)
-    return result
+load_input = load_lines
 
 
 # Solution
@@ -96,6 +86,7 @@ def parse_player(name, lines):
             cards.append(int(line))
     return Player(name, cards)
 
+@counters.counted("day22.play_game")
 def play_game(player1, player2, recursive=False, game=1):
     """Play out a single game of combat."""
     print(f"\nGAME {game}")
@@ -150,6 +141,7 @@ def play_game(player1, player2, recursive=False, game=1):
 
         print(f"{winner.name} wins round {round} of game {game}!")
         print()
+    counters.count("day22.play_game.rounds", round)
     print(f"{winner.name} wins game {game}!")
     return winner
 
@@ -184,6 +176,7 @@ def part1(lines):
     result = solve(lines)
     print(f"result is {result}")
     print("= " * 32)
+    return result
 
 
 # PART 2
@@ -204,11 +197,12 @@ def part2(lines):
     result = solve2(lines)
     print(f"result is {result}")
     print("= " * 32)
+    return result
 
 
 if __name__ == "__main__":
-    example1()
+    run_example(example1)
     lines = load_input(INPUTFILE)
-    part1(lines)
-    example2()
-    part2(lines)
+    run_part(part1, lines)
+    run_example(example2)
+    run_part(part2, lines)
@@ -3,8 +3,14 @@
 #  Advent of Code 2020 - day 23
 #
 from typing import Optional
+from array import array
 from pathlib import Path
 from dataclasses import dataclass
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from aoc.cli import run_example, run_part
+from aoc import checkpoint, progress
 
 INPUT = ("538914762", 100)
 
@@ -66,6 +72,18 @@ class LinkedList:
         firstNode.left = node
         return firstNode
 
+    @classmethod
+    def from_successors(cls, succ, current: int) -> "LinkedList":
+        """Return the ring where cup succ[v] follows cup v (for v from 1),
+        at the given current cup.
+        """
+        nodes = [None] + [LinkedList(v) for v in range(1, len(succ))]
+        for value in range(1, len(succ)):
+            node = nodes[value]
+            node.right = nodes[succ[value]]
+            node.right.left = node
+        return nodes[current]
+
     def cut(self, ncut: int) -> "LinkedList":
         if ncut < 1:
             return None
@@ -93,7 +111,15 @@ class LinkedList:
         after.left = p
 
 
-def play_game(cups: LinkedList, moves: int) -> LinkedList:
+def play_game(
+    cups: LinkedList, moves: int, ckpt: checkpoint.Checkpoint = None
+) -> LinkedList:
+    start = 0
+    state = ckpt.load() if ckpt else None
+    if state:
+        meta, arrays = state
+        cups = LinkedList.from_successors(arrays["succ"], meta["current"])
+        start = meta["move"]
     curr = cups
     ncup = cups.size()
 
@@ -104,24 +130,32 @@ def play_game(cups: LinkedList, moves: int) -> LinkedList:
         node[p.value] = p
         p = p.right
 
-    for move in range(moves):
-        three = curr.cut(3)
+    prog = progress.Progress("day23.play_game", total=moves, unit="moves", done=start)
+    for block in prog.ranges(start, moves, split=bool(ckpt and ckpt.enabled)):
+        for move in block:
+            three = curr.cut(3)
 
-        if curr.value > 1:
-            destVal = curr.value - 1
-        else:
-            destVal = ncup
-        while (destVal == three.value or 
-               destVal == three.right.value or
-               destVal == three.right.right.value):
-            if destVal > 1:
-                destVal = destVal - 1
+            if curr.value > 1:
+                destVal = curr.value - 1
             else:
                 destVal = ncup
-
-        dest = node[destVal]
-        dest.insert(three)
-        curr = curr.right
+            while (destVal == three.value or 
+                   destVal == three.right.value or
+                   destVal == three.right.right.value):
+                if destVal > 1:
+                    destVal = destVal - 1
+                else:
+                    destVal = ncup
+
+            dest = node[destVal]
+            dest.insert(three)
+            curr = curr.right
+        if ckpt and ckpt.due():
+            succ = array("i", [0] + [node[v].right.value for v in range(1, ncup + 1)])
+            ckpt.save({"move": block.stop, "current": curr.value}, succ=succ)
+    prog.finish()
+    if ckpt:
+        ckpt.done()
     return node[1]
 
 def solve(labels: str, moves: int) -> str:
@@ -135,17 +169,18 @@ def solve2(labels: str, moves: int = 10000000) -> int:
     """Solve the problem."""
     cups = LinkedList.from_labels(labels, size=1000000)
     assert cups.size() == 1000000
-    final = play_game(cups, 10000000)
+    ckpt = checkpoint.Checkpoint("day23.solve2", labels, moves)
+    final = play_game(cups, moves, ckpt)
     result = final.right.value * final.right.right.value
     return result
 
 
 # PART 1
 
-def example1():
+def example1(cases=SAMPLE_CASES):
     """Run example for problem with input arguments."""
     print("EXAMPLE 1:")
-    for arg, expected in SAMPLE_CASES:
+    for arg, expected in cases:
         result = solve(*arg)
         print(f"'{arg}' -> {result} (expected {expected})")
         assert result == expected
@@ -156,6 +191,7 @@ def part1():
     result = solve(*INPUT)
     print(f"result is {result}")
     print("= " * 32)
+    return result
 
 
 # PART 2
@@ -175,11 +211,12 @@ def part2():
     result = solve2(INPUT[0])
     print(f"result is {result}")
     print("= " * 32)
+    return result
 
 
 
 if __name__ == "__main__":
-    example1()
-    part1()
-    example2()
-    part2()
+    run_example(example1)
+    run_part(part1)
+    run_example(example2)
+    run_part(part2)
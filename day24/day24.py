@@ -4,6 +4,13 @@
 #
 from pathlib import Path
 from collections import defaultdict
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from aoc.inputs import load_input, filter_blank_lines
+from aoc.cli import run_example, run_part
+from aoc import checkpoint, progress
+from aoc.automaton import HEX, Automaton, Rule
 
 INPUTFILE = "input.txt"
 
@@ -36,12 +43,6 @@ wseweeenwnesenwwwswnew
 def sample_input():
     return filter_blank_lines(SAMPLE_INPUT.split("\n"))
 
-def load_input(infile):
-    return filter_blank_lines(Path(infile).open())
-
-def filter_blank_lines(lines):
-    return [line.strip() for line in lines if line.strip()]
-
 
 # Solution
 
@@ -73,16 +74,48 @@ def follow_path(line):
 
 def set_tiles(lines):
     """Flip the tiles specified by the input lines, to initiate the exhibit.
-    A dict is returned that maps tile coords (x,y tuple) to a boolean,
-    which is True if that tile is black.
+    A set of the coordinates (x,y tuples) of the black tiles is returned.
     """
-    tiles = defaultdict(bool)
-    for n, line in enumerate(lines):
+    black = set()
+    for line in lines:
         if line.strip():
-            x, y = follow_path(line)
-            tiles[(x, y)] ^= True
-            print(f"{x}, {y}  ({n:3d})")
-    return tiles
+            black ^= {follow_path(line)}
+    return black
+
+# a black tile with zero or more than 2 black neighbors turns white, and a
+# white tile with exactly 2 black neighbors turns black
+RULE = Rule(born=frozenset([2]), survive=frozenset([1, 2]))
+
+def solve(lines):
+    """Solve the problem."""
+    return len(set_tiles(lines))
+
+
+def solve2(lines):
+    """Solve the problem."""
+    ckpt = checkpoint.Checkpoint("day24.solve2", lines)
+    state = ckpt.load()
+    if state:
+        meta, arrays = state
+        start, tiles = meta["day"], checkpoint.unpack_cells(arrays["tiles"], 2)
+    else:
+        start, tiles = 0, set_tiles(lines)
+    exhibit = Automaton(HEX, RULE, tiles)
+    prog = progress.Progress("day24.solve2", total=100, unit="days", done=start)
+    for day in range(start + 1, 101):
+        exhibit.step()
+        print(f"Day {day}: {exhibit.population}")
+        prog.update(day)
+        if ckpt.due():
+            ckpt.save({"day": day}, tiles=checkpoint.pack_cells(exhibit.cells()))
+    prog.finish()
+    ckpt.done()
+    print(exhibit.report())
+    return exhibit.population
+
+
+# Reference solver: the original dict-of-tiles simulation, which the
+# automaton's answers are checked against (see aoc.differential)
 
 def propagate_tiles(tiles):
     """Evolve the tiles for one iteration.  The input is a dict mapping
@@ -111,29 +144,12 @@ def apply_rule(tiles, x, y):
         return True # black
     return is_black # no change
 
-def solve(lines):
-    """Solve the problem."""
-    tiles = defaultdict(bool)
-    for n, line in enumerate(lines):
-        if line.strip():
-            x, y = follow_path(line)
-            tiles[(x, y)] ^= True
-    count = sum([1 for v in tiles.values() if v])
-    return count
-
-
-def solve2(lines):
-    """Solve the problem."""
-    tiles = defaultdict(bool)
-    for n, line in enumerate(lines):
-        if line.strip():
-            x, y = follow_path(line)
-            tiles[(x, y)] ^= True
+def solve2_reference(lines):
+    """Solve the problem with the original propagate_tiles."""
+    tiles = defaultdict(bool, dict.fromkeys(set_tiles(lines), True))
     for day in range(1, 101):
         tiles = propagate_tiles(tiles)
-        count = sum([1 for v in tiles.values() if v])
-        print(f"Day {day}: {count}")
-    return count
+    return sum([1 for v in tiles.values() if v])
 
 
 # PART 1
@@ -156,6 +172,7 @@ def part1(lines):
     expected = 495
     assert result == expected
     print("= " * 32)
+    return result
 
 
 # PART 2
@@ -176,12 +193,13 @@ def part2(lines):
     result = solve2(lines)
     print(f"result is {result}")
     print("= " * 32)
+    return result
 
 
 
 if __name__ == "__main__":
-    example1()
+    run_example(example1)
     lines = load_input(INPUTFILE)
-    part1(lines)
-    example2()
-    part2(lines)
+    run_part(part1, lines)
+    run_example(example2)
+    run_part(part2, lines)
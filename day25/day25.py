@@ -3,6 +3,12 @@
 #  Advent of Code 2020 - day 25
 #
 from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from aoc.inputs import load_input, filter_blank_lines
+from aoc.cli import run_example, run_part
+from aoc.numtheory import DiscreteLog, modpow
 
 INPUTFILE = "input.txt"
 
@@ -17,22 +23,39 @@ SAMPLE_INPUT = """
 def sample_input():
     return filter_blank_lines(SAMPLE_INPUT.split("\n"))
 
-def load_input(infile):
-    return filter_blank_lines(Path(infile).open())
-
-def filter_blank_lines(lines):
-    return [line.strip() for line in lines if line.strip()]
-
 
 # Solution
 
 MODULUS = 20201227
 SUBJECT = 7
 
-def transform(subject, loop_size):
+def transform(subject, loop_size, modulus=MODULUS):
     """Tranform the subject number fllowing https://adventofcode.com/2020/day/25
     The integer result is returned.
     """
+    return modpow(subject, loop_size, modulus)
+
+
+def find_loop_size(public_key, modulus=MODULUS, subject=SUBJECT):
+    """Determine what loop_size transforms the subject to the given
+    public_key, as a discrete log.  The integer loop size is returned.
+    """
+    return DiscreteLog(subject, modulus).log(public_key)
+
+def solve(lines):
+    """Solve the problem."""
+    card_key, door_key = [int(v) for v in lines]
+    card_loop = find_loop_size(card_key)
+    return transform(door_key, card_loop)
+
+
+# Reference solver: the original brute-force search, which the discrete
+# log is checked against (see aoc.differential)
+
+def transform_loop(subject, loop_size):
+    """Tranform the subject number fllowing https://adventofcode.com/2020/day/25,
+    one loop at a time.  The integer result is returned.
+    """
     result = 1
     for _ in range(loop_size):
         result = (result * subject) % MODULUS
@@ -52,11 +75,11 @@ def brute_force_loop_size(public_key):
             return count
     return None
 
-def solve(lines):
-    """Solve the problem."""
+def solve_reference(lines):
+    """Solve the problem with the original brute_force_loop_size."""
     card_key, door_key = [int(v) for v in lines]
     card_loop = brute_force_loop_size(card_key)
-    return transform(door_key, card_loop)
+    return transform_loop(door_key, card_loop)
 
 
 # PART 1
@@ -89,6 +112,7 @@ def part1(lines):
     result = solve(lines)
     print(f"result is {result}")
     print("= " * 32)
+    return result
 
 
 # PART 2
@@ -96,8 +120,8 @@ def part1(lines):
 
 
 if __name__ == "__main__":
-    example1()
+    run_example(example1)
     lines = load_input(INPUTFILE)
-    part1(lines)
+    run_part(part1, lines)
     # example2()
-    # part2(lines)
+    # run_part(part2, lines)
@@ -3,6 +3,12 @@
 #  Advent of Code 2020 - day 3
 #
 from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from aoc.inputs import load_input, filter_blank_lines
+from aoc.cli import run_example, run_part
+from aoc.grid import BitGrid
 
 INPUTFILE = 'input.txt'
 
@@ -25,30 +31,15 @@ TREE = "#"
 def sample_input():
     return list(filter_blank_lines(SAMPLE_LINES))
 
-# Utility functions
-
-def load_input(infile):
-    return list(filter_blank_lines(Path(infile).open()))
-
-def filter_blank_lines(lines):
-    for line in lines:
-        line = line.strip()
-        if line:
-            yield line
-
 # Solution
 
 def solve(lines, slope):
     """Solve the problem."""
     dcol, drow = slope
-    ncol = len(lines[0])
-    row, col = 0, 0
+    grid = BitGrid.from_lines(lines, on=TREE)
     trees = 0
-    while row < len(lines):
-        print(f"({row}, {col}): '{lines[row][col]}'")
-        if lines[row][col] == TREE:
-            trees += 1
-        row, col = row + drow, (col + dcol) % ncol
+    for step, row in enumerate(range(0, grid.height, drow)):
+        trees += grid.get(row, step * dcol, wrap=True)
     return trees
 
 def solve2(lines, slopes):
@@ -77,6 +68,7 @@ def part1(lines):
     result = solve(lines, slope)
     print("result is {}".format(result))
     print('= ' * 32)
+    return result
 
 
 # PART 2
@@ -97,10 +89,11 @@ def part2(lines):
     result = solve2(lines, slopes)
     print("result is {}".format(result))
     print('= ' * 32)
+    return result
 
 if __name__ == '__main__':
-    example()
+    run_example(example)
     lines = load_input(INPUTFILE)
-    part1(lines)
-    example2()
-    part2(lines)
+    run_part(part1, lines)
+    run_example(example2)
+    run_part(part2, lines)
@@ -3,7 +3,15 @@
 #  Advent of Code 2020 - day 4
 #
 from pathlib import Path
+import functools
 import re
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from aoc.inputs import load_lines
+from aoc.cli import run_example, run_part
+from aoc.parsecache import parse_once
+from aoc.mapreduce import SECTION, map_reduce
 
 INPUTFILE = "input.txt"
 
@@ -72,18 +80,11 @@ def sample_input():
 # Utility functions
 
 
-def load_input(infile):
-    return list(Path(infile).open())
-
-
-def filter_blank_lines(lines):
-    for line in lines:
-        line = line.strip()
-        if line:
-            yield line
+load_input = load_lines
 
 
 # Solution
+@parse_once
 def parse_passports(lines):
     passports = []
     passport = {}
@@ -124,11 +125,8 @@ def field_is_valid(key, value):
     return False
 
 
-def solve(lines):
-    """Solve the problem."""
-    passports = parse_passports(lines)
-    print(f"parsed {len(passports)} passports from {len(lines)} input lines")
-
+def count_complete(passports):
+    """Return the number of passports with all the required fields."""
     valid = 0
     i = 0
     for p in passports:
@@ -142,11 +140,8 @@ def solve(lines):
     return valid
 
 
-def solve2(lines):
-    """Solve the problem."""
-    passports = parse_passports(lines)
-    print(f"parsed {len(passports)} passports from {len(lines)} input lines")
-
+def count_valid(passports):
+    """Return the number of passports with all the required fields valid."""
     valid = 0
     i = 0
     for p in passports:
@@ -160,6 +155,36 @@ def solve2(lines):
     return valid
 
 
+def solve(lines):
+    """Solve the problem."""
+    passports = parse_passports(lines)
+    print(f"parsed {len(passports)} passports from {len(lines)} input lines")
+    return count_complete(passports)
+
+
+def solve2(lines):
+    """Solve the problem."""
+    passports = parse_passports(lines)
+    print(f"parsed {len(passports)} passports from {len(lines)} input lines")
+    return count_valid(passports)
+
+
+def count_chunk(lines, counter):
+    # each chunk is parsed just once, so it bypasses the parse cache
+    return counter(parse_passports.__wrapped__(lines))
+
+
+def solve_file(infile, jobs=None):
+    """Solve the problem for a (large) input file, in parallel chunks."""
+    return map_reduce(infile, functools.partial(count_chunk, counter=count_complete),
+                      jobs=jobs, sep=SECTION)
+
+
+def solve2_file(infile, jobs=None):
+    return map_reduce(infile, functools.partial(count_chunk, counter=count_valid),
+                      jobs=jobs, sep=SECTION)
+
+
 # PART 1
 
 
@@ -179,6 +204,7 @@ def part1(lines):
     result = solve(lines)
     print("result is {}".format(result))
     print("= " * 32)
+    return result
 
 
 # PART 2
@@ -204,11 +230,12 @@ def part2(lines):
     result = solve2(lines)
     print("result is {}".format(result))
     print("= " * 32)
+    return result
 
 
 if __name__ == "__main__":
-    example()
+    run_example(example)
     lines = load_input(INPUTFILE)
-    part1(lines)
-    example2()
-    part2(lines)
+    run_part(part1, lines)
+    run_example(example2)
+    run_part(part2, lines)
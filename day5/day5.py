@@ -3,21 +3,15 @@
 #  Advent of Code 2020 - day 5
 #
 from pathlib import Path
+import operator
+import sys
 
-INPUTFILE = "input.txt"
-
-
-# Utility functions
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from aoc.inputs import load_input
+from aoc.cli import run_example, run_part
+from aoc.mapreduce import map_reduce
 
-def load_input(infile):
-    return list(filter_blank_lines(Path(infile).open()))
-
-
-def filter_blank_lines(lines):
-    for line in lines:
-        line = line.strip()
-        if line:
-            yield line
+INPUTFILE = "input.txt"
 
 
 # Solution
@@ -37,9 +31,13 @@ def solve(lines):
     return result
 
 
-def solve2(lines):
-    """Solve the problem."""
-    seat_ids = sorted([decode_pass(line) for line in lines])
+def seat_ids(lines):
+    return {decode_pass(line) for line in lines}
+
+
+def find_seat(seat_ids):
+    """Return the missing seat between the given (occupied) seat ids."""
+    seat_ids = sorted(seat_ids)
     result = 0
     last_seat = 0
     for seat in seat_ids:
@@ -49,6 +47,20 @@ def solve2(lines):
     return result
 
 
+def solve2(lines):
+    """Solve the problem."""
+    return find_seat(seat_ids(lines))
+
+
+def solve_file(infile, jobs=None):
+    """Solve the problem for a (large) input file, in parallel chunks."""
+    return map_reduce(infile, solve, max, jobs=jobs)
+
+
+def solve2_file(infile, jobs=None):
+    return find_seat(map_reduce(infile, seat_ids, operator.or_, jobs=jobs))
+
+
 # PART 1
 
 
@@ -72,6 +84,7 @@ def part1(lines):
     result = solve(lines)
     print(f"result is {result}")
     print("= " * 32)
+    return result
 
 
 # PART 2
@@ -81,10 +94,11 @@ def part2(lines):
     result = solve2(lines)
     print(f"result is {result}")
     print("= " * 32)
+    return result
 
 
 if __name__ == "__main__":
-    example()
+    run_example(example)
     lines = load_input(INPUTFILE)
-    part1(lines)
-    part2(lines)
+    run_part(part1, lines)
+    run_part(part2, lines)
@@ -3,6 +3,12 @@
 #  Advent of Code 2020 - day 6
 #
 from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from aoc.inputs import load_lines
+from aoc.cli import run_example, run_part
+from aoc.mapreduce import SECTION, map_reduce
 
 INPUTFILE = "input.txt"
 
@@ -28,8 +34,7 @@ b
 # Utility functions
 
 
-def load_input(infile):
-    return list(Path(infile).open())
+load_input = load_lines
 
 
 # Solution
@@ -91,6 +96,15 @@ def solve2(lines):
         result += len(group)
     return result
 
+
+def solve_file(infile, jobs=None):
+    """Solve the problem for a (large) input file, in parallel chunks."""
+    return map_reduce(infile, solve, jobs=jobs, sep=SECTION)
+
+
+def solve2_file(infile, jobs=None):
+    return map_reduce(infile, solve2, jobs=jobs, sep=SECTION)
+
 # PART 1
 
 
@@ -107,6 +121,7 @@ def part1(lines):
     result = solve(lines)
     print(f"result is {result}")
     print("= " * 32)
+    return result
 
 
 # PART 2
@@ -124,11 +139,12 @@ def part2(lines):
     result = solve2(lines)
     print(f"result is {result}")
     print("= " * 32)
+    return result
 
 
 if __name__ == "__main__":
-    example1()
+    run_example(example1)
     lines = load_input(INPUTFILE)
-    part1(lines)
-    example2()
-    part2(lines)
+    run_part(part1, lines)
+    run_example(example2)
+    run_part(part2, lines)
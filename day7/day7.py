@@ -4,8 +4,13 @@
 #
 from pathlib import Path
 from collections import defaultdict
-from pprint import pprint
 import re
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from aoc.inputs import load_input, filter_blank_lines
+from aoc.cli import run_example, run_part
+from aoc.parsecache import parse_once
 
 
 INPUTFILE = "input.txt"
@@ -41,25 +46,13 @@ def sample_input2():
     return list(filter_blank_lines(SAMPLE_INPUT2.split("\n")))
 
 
-# Utility functions
-
-
-def load_input(infile):
-    return list(filter_blank_lines(Path(infile).open()))
-
-
-def filter_blank_lines(lines):
-    for line in lines:
-        if line.strip():
-            yield line.strip()
-
-
 # Solution
 
 RULE_RE = re.compile(r"(\w+ \w+) bags contain (\w.*\w)[.]")
 BAGS_RE = re.compile(r"(\d+) (\w+ \w+) bags?")
 
 
+@parse_once
 def parse_rules(lines):
     contains = defaultdict(list)
     contained_by = defaultdict(list)
@@ -130,6 +123,7 @@ def part1(lines):
     result = solve(lines)
     print(f"result is {result}")
     print("= " * 32)
+    return result
 
 
 # PART 2
@@ -154,11 +148,12 @@ def part2(lines):
     result = solve2(lines)
     print(f"result is {result}")
     print("= " * 32)
+    return result
 
 
 if __name__ == "__main__":
-    example1()
+    run_example(example1)
     lines = load_input(INPUTFILE)
-    part1(lines)
-    example2()
-    part2(lines)
+    run_part(part1, lines)
+    run_example(example2)
+    run_part(part2, lines)
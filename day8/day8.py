@@ -4,6 +4,12 @@
 #
 from pathlib import Path
 import re
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from aoc.inputs import load_input, filter_blank_lines
+from aoc.cli import run_example, run_part
+from aoc import counters
 
 INPUTFILE = "input.txt"
 
@@ -24,17 +30,6 @@ def sample_input():
     return filter_blank_lines(SAMPLE_INPUT.split("\n"))
 
 
-# Utility functions
-
-
-def load_input(infile):
-    return list(filter_blank_lines(Path(infile).open()))
-
-
-def filter_blank_lines(lines):
-    return [line.strip() for line in lines if line.strip()]
-
-
 # Solution
 
 INS_RE = re.compile(r"(nop|acc|jmp) ([+-]\d+)$")
@@ -57,6 +52,7 @@ def parse_program(lines):
     return prog
 
 
+@counters.counted("day8.execute_program")
 def execute_program(prog, pc=0, acc=0):
     """Execute the given program starting at the given program counter,
     with the given initial accumulator value.  The program will run until
@@ -76,6 +72,7 @@ def execute_program(prog, pc=0, acc=0):
             pc += 1
         if pc < 0 or pc >= len(prog):
             break
+    counters.count("day8.execute_program.steps", len(seen))
     success = (pc == len(prog))
     return success, pc, acc
 
@@ -123,6 +120,7 @@ def part1(lines):
     result = solve(lines)
     print(f"result is {result}")
     print("= " * 32)
+    return result
 
 
 # PART 2
@@ -141,11 +139,12 @@ def part2(lines):
     result = solve2(lines)
     print(f"result is {result}")
     print("= " * 32)
+    return result
 
 
 if __name__ == "__main__":
-    example1()
+    run_example(example1)
     lines = load_input(INPUTFILE)
-    part1(lines)
-    example2()
-    part2(lines)
+    run_part(part1, lines)
+    run_example(example2)
+    run_part(part2, lines)
@@ -4,6 +4,11 @@
 #
 from pathlib import Path
 from itertools import combinations
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from aoc.inputs import load_input, filter_blank_lines
+from aoc.cli import run_example, run_part
 
 
 INPUTFILE = "input.txt"
@@ -37,17 +42,6 @@ def sample_input():
     return filter_blank_lines(SAMPLE_INPUT.split("\n"))
 
 
-# Utility functions
-
-
-def load_input(infile):
-    return filter_blank_lines(Path(infile).open())
-
-
-def filter_blank_lines(lines):
-    return [line.strip() for line in lines if line.strip()]
-
-
 # Solution
 
 def not_sum(val, prev):
@@ -112,15 +106,18 @@ def example2():
     print("= " * 32)
 
 
-def part2(lines, target):
+def part2(lines, target=None):
+    if target is None:
+        target = solve(lines)
     result = solve2(lines, target)
     print(f"result is {result}")
     print("= " * 32)
+    return result
 
 
 if __name__ == "__main__":
-    example1()
+    run_example(example1)
     lines = load_input(INPUTFILE)
-    val = part1(lines)
-    example2()
-    part2(lines, target=val)
+    val = run_part(part1, lines)
+    run_example(example2)
+    run_part(part2, lines, val)
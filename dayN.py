@@ -3,6 +3,11 @@
 #  Advent of Code 2020 - Day N
 #
 from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from aoc.inputs import load_input, load_lines, filter_blank_lines
+from aoc.cli import run_example, run_part
 
 INPUTFILE = "input.txt"
 
@@ -21,34 +26,12 @@ SAMPLE_CASES = [
 def sample_input():
     return filter_blank_lines(SAMPLE_INPUT.split("\n"))
 
-def load_input(infile):
-    return filter_blank_lines(Path(infile).open())
-
-def filter_blank_lines(lines):
-    return [line.strip() for line in lines if line.strip()]
-
 
 ## Use these if blank lines in input are meaningful.
 def sample_input():
     return SAMPLE_INPUT.strip("\n").split("\n")
 
-def load_input(infile):
-    return [line.strip() for line in Path(infile).open()]
-
-def parse_sections(lines):
-    result = []
-    sect = []
-    for line in lines:
-        line = line.strip()
-        if not line:
-            if sect:
-                result.append(sect)
-            sect = []
-        else:
-            sect.append(line)
-    if sect:
-        result.append(sect)
-    return result
+load_input = load_lines
 
 
 # Solution
@@ -62,10 +45,10 @@ def solve(lines):
 
 #!! DELETE THE example1 FUNCTION YOU'RE NOT GOING TO USE
 
-def example1():
+def example1(cases=SAMPLE_CASES):
     """Run example for problem with input arguments."""
     print("EXAMPLE 1:")
-    for arg, expected in SAMPLE_CASES:
+    for arg, expected in cases:
         result = solve(arg)
         print(f"'{arg}' -> {result} (expected {expected})")
         assert result == expected
@@ -95,8 +78,8 @@ def part1(lines):
 
 
 if __name__ == "__main__":
-    example1()
+    run_example(example1)
     lines = load_input(INPUTFILE)
-    part1(lines)
-    example2()
-    part2(lines)
+    run_part(part1, lines)
+    run_example(example2)
+    run_part(part2, lines)
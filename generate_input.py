@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+"""
+Generate a synthetic puzzle input for a day, at any scale.
+
+    ./generate_input.py 7 1000000 > rules.txt    a million bag rules
+    ./generate_input.py 20 10000 -s 3            a 10,000-tile jigsaw
+"""
+
+import argparse
+import sys
+
+from aoc.generators import GENERATORS, generate
+
+
+def parse_args():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("day", type=int, choices=sorted(GENERATORS), metavar="day")
+    parser.add_argument(
+        "size", type=int, help="Size of the input (its meaning depends on the day)"
+    )
+    parser.add_argument(
+        "-s", "--seed", type=int, default=0, help="Random seed (default: %(default)s)"
+    )
+    parser.add_argument("-o", "--output", help="Output file (default: stdout)")
+    return parser.parse_args()
+
+
+def main():
+    opt = parse_args()
+    text = generate(opt.day, opt.size, opt.seed)
+    if opt.output:
+        with open(opt.output, "w") as f:
+            f.write(text)
+    else:
+        sys.stdout.write(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -2,36 +2,311 @@
 """
 Download some day's input from the AOC site.
 This requires a session key for a particular user's account.
+
+Downloaded inputs are kept in a local content-addressed cache, keyed by
+day and a hash of the session key, so asking for a known input again never
+touches the network.  Use --refresh to revalidate a cached input with a
+conditional request, or --offline to serve only from the cache.
+
+Given a range of days (eg '1-25'), the inputs are fetched concurrently by a
+small pool of threads sharing one HTTP session, subject to a rate limit,
+and written to each dayN/input.txt.
 """
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import argparse
+import hashlib
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
 
-import requests
+ROOT = Path(__file__).resolve().parent
 
 SESSION_KEY = "session_key.txt"
 SITE = "https://adventofcode.com/2020"
+CACHE_DIR = ROOT / ".cache" / "inputs"
+
+RETRY_STATUS = (429, 500, 502, 503, 504)
+MAX_RETRY_AFTER = 300.0   # seconds; longer Retry-After delays are capped
+
+
+def parse_days(text):
+    """Parse a day number ('3') or an inclusive range of days ('1-25')."""
+    first, _, last = text.partition("-")
+    try:
+        days = list(range(int(first), int(last or first) + 1))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid day or range '{text}'")
+    if not days or days[0] < 1 or days[-1] > 25:
+        raise argparse.ArgumentTypeError(f"invalid day or range '{text}'")
+    return days
+
 
 def parse_args():
     parser = argparse.ArgumentParser()
-    parser.add_argument("day", type=int, help="Day number (eg '3')")
+    parser.add_argument("days", type=parse_days,
+                        help="Day number (eg '3'), or range of days (eg '1-25')")
+    parser.add_argument("-w", "--write", action="store_true",
+                        help="Write the input to dayN/input.txt instead of stdout "
+                             "(always done for a range of days)")
+    parser.add_argument("--offline", action="store_true",
+                        help="Serve the input from the local cache only")
+    parser.add_argument("--refresh", action="store_true",
+                        help="Revalidate a cached input with the server")
+    parser.add_argument("-j", "--jobs", type=int, default=4,
+                        help="Concurrent requests for a range of days "
+                             "(default: %(default)s)")
+    parser.add_argument("--rate", type=float, default=2.0,
+                        help="Maximum requests per second (default: %(default)s)")
+    parser.add_argument("--retries", type=int, default=3,
+                        help="Retries for a failed request (default: %(default)s)")
+    parser.add_argument("--site", default=SITE,
+                        help="Base URL of the puzzle site (default: %(default)s)")
     opt = parser.parse_args()
+    if opt.offline and opt.refresh:
+        parser.error("--offline and --refresh are mutually exclusive")
     return opt
 
+
+# Input cache
+
+class InputCache:
+    """A content-addressed store of puzzle inputs.  Each input is stored
+    once under its SHA-256 digest, and an index maps (session, day) to the
+    digest along with the validators needed for a conditional re-fetch.
+    """
+
+    def __init__(self, path=CACHE_DIR):
+        self.path = Path(path)
+        self.index_file = self.path / "index.json"
+        self.lock = threading.Lock()
+        if self.index_file.exists():
+            self.index = json.loads(self.index_file.read_text())
+        else:
+            self.index = {}
+
+    @staticmethod
+    def key(session_hash, day):
+        return f"{session_hash}/{day}"
+
+    def lookup(self, session_hash, day):
+        """Return the index entry for the given session and day, or None."""
+        return self.index.get(self.key(session_hash, day))
+
+    def content(self, entry):
+        return (self.path / "objects" / entry["sha256"]).read_bytes()
+
+    def store(self, session_hash, day, content, etag=None, last_modified=None):
+        digest = hashlib.sha256(content).hexdigest()
+        obj = self.path / "objects" / digest
+        if not obj.exists():
+            atomic_write(obj, content)
+        entry = {
+            "sha256": digest,
+            "etag": etag,
+            "last_modified": last_modified,
+            "fetched": time.time(),
+        }
+        with self.lock:
+            self.index[self.key(session_hash, day)] = entry
+            atomic_write(self.index_file, json.dumps(self.index, indent=2).encode())
+        return entry
+
+
+def atomic_write(path, content):
+    """Write content to path via a temporary file in the same directory, so
+    readers never see a partially written file.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    try:
+        with os.fdopen(fd, "wb") as fp:
+            fp.write(content)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+def session_hash(session_key):
+    return hashlib.sha256(session_key.encode()).hexdigest()[:16]
+
+
+def read_session_key(path=SESSION_KEY):
+    path = Path(path)
+    if not path.exists():
+        return None
+    return path.read_text().strip()
+
+
+# Fetching
+
+class RateLimiter:
+    """Space out calls to wait() so that no more than rate calls per second
+    proceed, across all threads.
+    """
+
+    def __init__(self, rate):
+        self.interval = 1.0 / rate if rate > 0 else 0.0
+        self.next_time = 0.0
+        self.lock = threading.Lock()
+
+    def wait(self):
+        with self.lock:
+            now = time.monotonic()
+            start = max(now, self.next_time)
+            self.next_time = start + self.interval
+        if start > now:
+            time.sleep(start - now)
+
+
+def new_session(pool_size=1):
+    """Return a requests Session whose connection pool is sized for the
+    given number of concurrent requests.
+    """
+    import requests
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def retry_after(resp):
+    """Return the delay in seconds asked for by a response's Retry-After
+    header (a number of seconds, or an HTTP date), or None.
+    """
+    value = resp.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        delay = float(value)
+    except ValueError:
+        from email.utils import parsedate_to_datetime
+        try:
+            delay = parsedate_to_datetime(value).timestamp() - time.time()
+        except (TypeError, ValueError):
+            return None
+    return min(max(delay, 0.0), MAX_RETRY_AFTER)
+
+
+def fetch(session, url, session_key, entry=None, limiter=None, retries=0,
+          backoff=1.0):
+    """GET the given url, conditionally if we have a cached entry.
+    Connection errors and transient server errors are retried with
+    exponential backoff, or after the delay the server asks for with
+    Retry-After.  Returns the response.
+    """
+    headers = {}
+    if entry:
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+    for attempt in range(retries + 1):
+        if limiter:
+            limiter.wait()
+        delay = None
+        try:
+            resp = session.get(url, cookies={'session': session_key}, headers=headers)
+        except OSError:
+            # requests' ConnectionError and Timeout are OSErrors
+            if attempt == retries:
+                raise
+        else:
+            if resp.status_code not in RETRY_STATUS or attempt == retries:
+                return resp
+            delay = retry_after(resp)
+        time.sleep(backoff * 2 ** attempt if delay is None else delay)
+
+
+def get_input(day, cache, session=None, session_key=None, offline=False,
+              refresh=False, site=SITE, limiter=None, retries=0):
+    """Return the input for the given day as bytes, from the cache if we
+    have it, and from the site otherwise.  A tuple (content, status) is
+    returned, where status is 'cached', 'not modified' or 'fetched'.
+    """
+    if not session_key:
+        # cached inputs are per session, so even offline we need the key
+        raise RuntimeError(f"no session key in {SESSION_KEY}")
+    shash = session_hash(session_key)
+    entry = cache.lookup(shash, day)
+    if entry and not refresh:
+        return cache.content(entry), "cached"
+    if offline:
+        raise RuntimeError(f"day {day} input is not in the cache")
+
+    if session is None:
+        session = new_session()
+    url = f"{site}/day/{day}/input"
+    resp = fetch(session, url, session_key, entry, limiter, retries)
+    if resp.status_code == 304 and entry:
+        return cache.content(entry), "not modified"
+    resp.raise_for_status()
+    cache.store(shash, day, resp.content,
+                etag=resp.headers.get("ETag"),
+                last_modified=resp.headers.get("Last-Modified"))
+    return resp.content, "fetched"
+
+
+def get_inputs(days, cache, session_key=None, offline=False, refresh=False,
+               site=SITE, jobs=4, rate=2.0, retries=3, root=ROOT):
+    """Fetch the inputs for the given days concurrently, and write each one
+    to its dayN/input.txt under root.  A dict mapping day to a status
+    message is returned.
+    """
+    session = None if offline else new_session(jobs)
+    limiter = RateLimiter(rate)
+
+    def get_one(day):
+        try:
+            content, status = get_input(day, cache, session, session_key,
+                                        offline, refresh, site, limiter, retries)
+        except Exception as exc:
+            return f"failed: {exc}"
+        atomic_write(Path(root) / f"day{day}" / "input.txt", content)
+        nlines = content.count(b"\n")
+        return f"{status}, {nlines} lines"
+
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        statuses = pool.map(get_one, days)
+        return dict(zip(days, statuses))
+
+
 def main():
     opt = parse_args()
-    url = f"{SITE}/day/{opt.day}/input"
-    # print(f"URL: {url}")
+    cache = InputCache()
+    session_key = read_session_key()
 
-    session_key = Path(SESSION_KEY).read_text().strip()
+    if len(opt.days) > 1:
+        statuses = get_inputs(opt.days, cache, session_key, opt.offline,
+                              opt.refresh, opt.site, opt.jobs, opt.rate,
+                              opt.retries)
+        for day, status in statuses.items():
+            print(f"day {day:2d}: {status}")
+        if any(status.startswith("failed") for status in statuses.values()):
+            sys.exit(1)
+        return
 
-    s = requests.Session()
+    day = opt.days[0]
+    try:
+        content, _ = get_input(day, cache, session_key=session_key,
+                               offline=opt.offline, refresh=opt.refresh,
+                               site=opt.site, limiter=RateLimiter(opt.rate),
+                               retries=opt.retries)
+    except Exception as exc:
+        print(f"Error: {exc}", file=sys.stderr)
+        sys.exit(1)
 
-    resp = s.get(url, cookies={'session': session_key})
-    # print(f"OK: {resp.ok}")
-
-    print(resp.content.decode())
+    if opt.write:
+        atomic_write(ROOT / f"day{day}" / "input.txt", content)
+    else:
+        print(content.decode(), end="")
 
 
 if __name__ == '__main__':
     main()
-
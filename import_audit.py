@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Report how long each day module takes to import, from `python -X
+importtime`, and which of its imports cost the most.  Exits with a
+non-zero status if any day is over the start-up budget.
+
+    ./import_audit.py               all days, against the default budget
+    ./import_audit.py 20 -v         day 20's heaviest and direct imports
+"""
+
+import argparse
+import sys
+
+from aoc.days import day_paths
+from aoc.importtime import BUDGET_MS, heaviest, measure
+
+
+def parse_args():
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "days", type=int, nargs="*", help="Day numbers to audit (default: all)"
+    )
+    parser.add_argument(
+        "-b",
+        "--budget",
+        type=float,
+        default=BUDGET_MS,
+        help="Import-time budget per day, in ms (default: %(default)s)",
+    )
+    parser.add_argument(
+        "-n",
+        "--repeat",
+        type=int,
+        default=3,
+        help="Imports per day; the fastest is reported (default: %(default)s)",
+    )
+    parser.add_argument(
+        "-v",
+        "--verbose",
+        action="store_true",
+        help="Also list each day's direct imports",
+    )
+    return parser.parse_args()
+
+
+def main():
+    opt = parse_args()
+    over = []
+    print(f"{'day':>3} {'import (ms)':>11}  heaviest (self ms)")
+    print("-" * 64)
+    for day in day_paths(opt.days or None):
+        node = measure(day, opt.repeat)
+        top = ", ".join([f"{n.name} {n.self_us / 1000:.1f}" for n in heaviest(node, 3)])
+        status = ""
+        if node.ms > opt.budget:
+            over.append(day)
+            status = "  OVER BUDGET"
+        print(f"{day:3d} {node.ms:11.1f}  {top}{status}")
+        if opt.verbose:
+            for child in sorted(
+                node.children, key=lambda n: n.cumulative_us, reverse=True
+            ):
+                print(f"{'':16}{child.name:<28} {child.ms:8.1f}")
+    print("-" * 64)
+    if over:
+        print(f"over the {opt.budget:g}ms budget: {', '.join(map(str, over))}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
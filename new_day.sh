@@ -3,8 +3,9 @@
 #
 
 usage () {
-    echo "Usage: $0 <day>"
+    echo "Usage: $0 <day> [--offline | --refresh]"
     echo "Create the directory for the given day."
+    echo "Any options are passed on to get_input.py."
     exit 0
 }
 
@@ -15,6 +16,7 @@ error () {
 
 test -n "$1" || usage
 DAY=$1
+shift
 
 dir="day${DAY}"
 prog="$dir/day${DAY}.py"
@@ -30,7 +32,7 @@ test -f "$prog" || \
 chmod +x "$prog"
 echo "Wrote $prog"
 
-./get_input.py $DAY > "$infile" || \
+./get_input.py --write "$@" $DAY || \
     error "Unable to download input data"
 echo "Downloaded $(wc -l $infile | awk '{print $1}') lines to $infile"
 
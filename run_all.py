@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Run the solutions for every day (or the given days) across a pool of
+worker processes, and report each part's answer along with the wall-clock
+and CPU time it took.
+
+Answers are cached by a hash of each day's module and input, so parts
+whose solver and input haven't changed are not re-run (see --no-cache).
+"""
+
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import argparse
+import functools
+import json
+import os
+import time
+
+from aoc import parsecache
+from aoc.cache import ResultCache
+from aoc.days import PARTS, day_parts, timed_part
+from aoc.memory import format_size
+from aoc.results import JsonLines, part_record
+
+
+def parse_args():
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "days", type=int, nargs="*", help="Day numbers to run (default: all)"
+    )
+    parser.add_argument(
+        "-p", "--part", type=int, choices=PARTS, help="Run only this part"
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=os.cpu_count(),
+        help="Number of worker processes (default: %(default)s)",
+    )
+    parser.add_argument(
+        "-m",
+        "--memory",
+        action="store_true",
+        help="Also report each part's peak memory (slower)",
+    )
+    parser.add_argument(
+        "--counters",
+        metavar="FILE",
+        help="Write each part's hot-path event counts to FILE, as JSON",
+    )
+    parser.add_argument(
+        "--jsonl",
+        metavar="FILE",
+        help="Append a JSON line with each part's answer and timings to "
+        "FILE ('-' for stdout, instead of the table)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Run every part, without reading or writing cached answers",
+    )
+    parser.add_argument(
+        "--clear-cache",
+        action="store_true",
+        help="Empty the answer and parsed-input caches first",
+    )
+    opt = parser.parse_args()
+    return opt
+
+
+def print_table(results, memory=False):
+    peak_header = f" {'peak mem':>10}" if memory else ""
+    print(
+        f"{'day':>3} {'part':>4} {'wall (s)':>10} {'cpu (s)':>10}{peak_header}  answer"
+    )
+    print("-" * 64)
+    for res in results:
+        answer = res.answer if res.error is None else f"ERROR {res.error}"
+        if res.cached:
+            answer = f"{answer} (cached)"
+        peak = ""
+        if memory:
+            peak = f" {format_size(res.peak) if res.peak is not None else '-':>10}"
+        print(
+            f"{res.day:3d} {res.part:4d} {res.wall:10.3f} {res.cpu:10.3f}"
+            f"{peak}  {answer}"
+        )
+    print("-" * 64)
+    total_wall = sum([res.wall for res in results])
+    total_cpu = sum([res.cpu for res in results])
+    print(f"{'total':>8} {total_wall:10.3f} {total_cpu:10.3f}")
+
+
+def main():
+    opt = parse_args()
+    tasks = day_parts(opt.days or None)
+    if opt.part:
+        tasks = [(day, part) for day, part in tasks if part == opt.part]
+
+    cache = ResultCache()
+    if opt.clear_cache:
+        cache.clear()
+        parsecache.clear()
+
+    start = time.perf_counter()
+    results = []
+    if not (opt.no_cache or opt.memory or opt.counters):
+        for day, part in list(tasks):
+            res = cache.get_result(day, part)
+            if res:
+                results.append(res)
+                tasks.remove((day, part))
+
+    run = functools.partial(
+        timed_part, trace_memory=opt.memory, count_events=opt.counters is not None
+    )
+    with ProcessPoolExecutor(max_workers=opt.jobs) as pool:
+        futures = [pool.submit(run, day, part) for day, part in tasks]
+        for future in as_completed(futures):
+            res = future.result()
+            if not opt.no_cache:
+                cache.put_result(res)
+            results.append(res)
+    elapsed = time.perf_counter() - start
+
+    results.sort(key=lambda res: (res.day, res.part))
+    if opt.jsonl:
+        out = JsonLines(opt.jsonl)
+        for res in results:
+            out.write(part_record(res))
+    if opt.jsonl != "-":
+        print_table(results, opt.memory)
+        print(f"elapsed {elapsed:.3f}s on {opt.jobs} workers")
+    if opt.counters:
+        counts = {f"day{res.day}.part{res.part}": res.counts for res in results}
+        with open(opt.counters, "w") as f:
+            json.dump(counts, f, indent=2)
+            f.write("\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Solve a (large) input file for one of the days whose records can be solved
+independently, splitting it into chunks across a pool of worker processes.
+
+    ./run_chunked.py 2 big.txt -j 8          both parts of day 2
+    ./run_chunked.py 18 -g 10000000 -p 2     a generated 10M-line input
+"""
+
+import argparse
+import os
+import sys
+import time
+
+from aoc.days import PARTS, load_day
+from aoc.generators import generated_input
+
+
+def parse_args():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("day", type=int)
+    parser.add_argument(
+        "infile", nargs="?", help="Input file (default: the day's input.txt)"
+    )
+    parser.add_argument(
+        "-g",
+        "--generate",
+        type=int,
+        metavar="SIZE",
+        help="Use a generated input of this size instead",
+    )
+    parser.add_argument(
+        "-s",
+        "--seed",
+        type=int,
+        default=0,
+        help="Random seed for --generate (default: %(default)s)",
+    )
+    parser.add_argument(
+        "-p", "--part", type=int, choices=PARTS, help="Run only this part"
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=os.cpu_count(),
+        help="Number of worker processes (default: %(default)s)",
+    )
+    return parser.parse_args()
+
+
+def main():
+    opt = parse_args()
+    module = load_day(opt.day)
+    if not hasattr(module, "solve_file"):
+        sys.exit(f"day {opt.day} can't be solved in chunks")
+    if opt.generate:
+        infile = generated_input(opt.day, opt.generate, opt.seed)
+    else:
+        infile = opt.infile or os.path.join(
+            os.path.dirname(module.__file__), module.INPUTFILE
+        )
+    size = os.path.getsize(infile)
+
+    funcs = {1: module.solve_file, 2: getattr(module, "solve2_file", None)}
+    for part in [opt.part] if opt.part else PARTS:
+        if funcs[part] is None:
+            continue
+        start = time.perf_counter()
+        answer = funcs[part](infile, jobs=opt.jobs)
+        wall = time.perf_counter() - start
+        print(
+            f"day {opt.day} part {part}: {answer}  ({size / wall / 2**20:.1f} MiB/s, "
+            f"{wall:.3f}s on {opt.jobs} workers)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Run every day's sample cases (the exampleN functions, and each entry of
+their SAMPLE_CASES lists) across a pool of worker processes, and report
+each case's result and timing.  Exits with a non-zero status if any case
+failed.
+"""
+
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import argparse
+import os
+import sys
+import time
+
+from aoc.results import JsonLines, case_record, to_stderr
+from aoc.samples import collect_cases, run_case
+
+
+def parse_args():
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "days", type=int, nargs="*", help="Day numbers to check (default: all)"
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=os.cpu_count(),
+        help="Number of worker processes (default: %(default)s)",
+    )
+    parser.add_argument(
+        "-k", "--match", help="Run only the cases whose name contains this string"
+    )
+    parser.add_argument(
+        "--jsonl",
+        metavar="FILE",
+        help="Append a JSON line with each case's result and timings to FILE "
+        "('-' for stdout, with the rest of the output on stderr)",
+    )
+    parser.add_argument(
+        "-l", "--list", action="store_true", help="List the cases, without running them"
+    )
+    return parser.parse_args()
+
+
+def main():
+    opt = parse_args()
+    cases = collect_cases(opt.days or None)
+    if opt.match:
+        cases = [case for case in cases if opt.match in case.name]
+    if opt.list:
+        for case in cases:
+            print(case.name)
+        return
+
+    if opt.jsonl == "-":
+        to_stderr()
+    out = JsonLines(opt.jsonl) if opt.jsonl else None
+    start = time.perf_counter()
+    results = []
+    with ProcessPoolExecutor(max_workers=opt.jobs) as pool:
+        futures = [pool.submit(run_case, case) for case in cases]
+        for future in as_completed(futures):
+            res = future.result()
+            status = "ok" if res.error is None else f"FAILED {res.error}"
+            print(f"{res.case.name:<24} {res.wall:9.3f}s  {status}", flush=True)
+            results.append(res)
+            if out:
+                out.write(case_record(res))
+    elapsed = time.perf_counter() - start
+
+    failed = [res for res in results if res.error is not None]
+    total = sum([res.wall for res in results])
+    print("-" * 64)
+    print(
+        f"{len(results) - len(failed)} passed, {len(failed)} failed; "
+        f"{total:.3f}s of cases in {elapsed:.3f}s on {opt.jobs} workers"
+    )
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Time solvers on generated inputs of doubling size, and report the growth
+order fitted to their run times.  Exits with a non-zero status if any
+study looks superlinear.
+
+    ./scaling_study.py                      all studies, from n = 1000
+    ./scaling_study.py day18-evaluate -v    one study, with its timings
+    ./scaling_study.py --list               the studies, and what n counts
+"""
+
+import argparse
+import sys
+
+from aoc.scaling import MIN_TIME, STUDIES, SUPERLINEAR, fit_order, ladder, run_study
+
+
+def parse_args():
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "studies", nargs="*", metavar="study", help="Studies to run (default: all)"
+    )
+    parser.add_argument(
+        "--start",
+        type=int,
+        default=1000,
+        help="Smallest input size (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--steps",
+        type=int,
+        default=7,
+        help="Number of sizes, doubling each time (default: %(default)s)",
+    )
+    parser.add_argument(
+        "-n",
+        "--repeat",
+        type=int,
+        default=3,
+        help="Runs per size; the fastest is used (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--max-time",
+        type=float,
+        default=2.0,
+        help="Stop a study's ladder after a run this long, "
+        "in seconds (default: %(default)s)",
+    )
+    parser.add_argument("--list", action="store_true", help="List the studies and exit")
+    parser.add_argument(
+        "-v", "--verbose", action="store_true", help="Also print the time at each size"
+    )
+    opt = parser.parse_args()
+    unknown = [name for name in opt.studies if name not in STUDIES]
+    if unknown:
+        parser.error(f"unknown studies: {', '.join(unknown)}")
+    return opt
+
+
+def main():
+    opt = parse_args()
+    if opt.list:
+        for study in STUDIES.values():
+            print(f"{study.name:<20} n: {study.note}")
+        return
+
+    flagged = []
+    sizes = ladder(opt.start, opt.steps)
+    print(f"{'study':<20} {'sizes':>13} {'k':>5} {'last':>5}  order")
+    print("-" * 64)
+    for name in opt.studies or STUDIES:
+        points = run_study(STUDIES[name], sizes, opt.repeat, opt.max_time)
+        fit = fit_order(points)
+        status = ""
+        if fit.flagged:
+            flagged.append(name)
+            status = "  SUPERLINEAR"
+        span = f"{points[0].size}-{points[-1].size}"
+        print(
+            f"{name:<20} {span:>13} {fit.exponent:5.2f} {fit.last:5.2f}  "
+            f"{fit.order}{status}"
+        )
+        if opt.verbose:
+            for point in points:
+                mark = "" if point.time >= MIN_TIME else "  (not fitted)"
+                print(f"{'':20} {point.size:>13} {point.time * 1000:11.2f}ms{mark}")
+    print("-" * 64)
+    if flagged:
+        print(f"growth above n^{SUPERLINEAR:g}: {', '.join(flagged)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Run or talk to the warm solver daemon, which keeps the day modules and
+their inputs loaded between runs.
+
+    ./solverd.py serve &        start the daemon
+    ./solverd.py run 15 1 2     run day 15, parts 1 and 2
+    ./solverd.py status
+    ./solverd.py stop
+"""
+
+import argparse
+import sys
+
+from aoc.daemon import SOCKET_PATH, SolverServer, request
+from aoc.days import PARTS
+
+
+def parse_args():
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "-s", "--socket", default=SOCKET_PATH, help="Socket path (default: %(default)s)"
+    )
+    commands = parser.add_subparsers(dest="cmd", required=True)
+    commands.add_parser("serve", help="Run the daemon")
+    run = commands.add_parser("run", help="Run some parts of a day")
+    run.add_argument("day", type=int)
+    run.add_argument("parts", type=int, nargs="*", help="Parts to run (default: all)")
+    forget = commands.add_parser("forget", help="Drop cached modules and inputs")
+    forget.add_argument("day", type=int, nargs="?")
+    commands.add_parser("status", help="Report on the daemon")
+    commands.add_parser("stop", help="Stop the daemon")
+    opt = parser.parse_args()
+    if opt.cmd == "run" and any(part not in PARTS for part in opt.parts):
+        parser.error(f"parts must be one of {PARTS}")
+    return opt
+
+
+def main():
+    opt = parse_args()
+    if opt.cmd == "serve":
+        try:
+            server = SolverServer(opt.socket)
+        except RuntimeError as exc:
+            sys.exit(f"Error: {exc}")
+        print(f"listening on {opt.socket}")
+        server.serve()
+        return
+
+    try:
+        if opt.cmd == "run":
+            messages = [
+                {"cmd": "run", "day": opt.day, "part": part} for part in opt.parts
+            ]
+            results = []
+            for message in messages or [{"cmd": "run", "day": opt.day}]:
+                response = request(message, opt.socket)
+                if not response["ok"]:
+                    print(f"Error: {response['error']}", file=sys.stderr)
+                    sys.exit(1)
+                results.extend(response["results"])
+            for res in results:
+                if res["error"]:
+                    print(f"day {res['day']} part {res['part']}: ERROR {res['error']}")
+                else:
+                    print(
+                        f"day {res['day']} part {res['part']}: {res['answer']}  "
+                        f"(wall {res['wall']:.3f}s, cpu {res['cpu']:.3f}s)"
+                    )
+            if any(res["error"] for res in results):
+                sys.exit(1)
+        elif opt.cmd == "forget":
+            request({"cmd": "forget", "day": opt.day}, opt.socket)
+        else:
+            print(request({"cmd": opt.cmd}, opt.socket))
+    except (ConnectionRefusedError, FileNotFoundError):
+        print(f"Error: no daemon listening on {opt.socket}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Check that each day's alternative solver backends give the same answers
+as the reference solver, on the samples, a generated input and the puzzle
+input, and show their speedups over the reference side by side.  Exits
+with a non-zero status if any backend disagrees or fails.
+
+    ./verify_backends.py                 every check
+    ./verify_backends.py 17 19           the checks for days 17 and 19
+    ./verify_backends.py day24-part2 -n 3
+"""
+
+import argparse
+import sys
+
+from aoc.differential import CHECKS, run_check
+
+
+def parse_args():
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "checks",
+        nargs="*",
+        metavar="check",
+        help="Checks to run, by name or day number (default: all)",
+    )
+    parser.add_argument(
+        "-n",
+        "--repeat",
+        type=int,
+        default=1,
+        help="Runs per backend and input; the fastest is used "
+        "(default: %(default)s)",
+    )
+    parser.add_argument(
+        "--no-input", action="store_true", help="Skip the puzzle inputs"
+    )
+    parser.add_argument(
+        "--list",
+        action="store_true",
+        help="List the checks and their backends, and exit",
+    )
+    opt = parser.parse_args()
+    unknown = [name for name in opt.checks if not selected(name)]
+    if unknown:
+        parser.error(f"unknown checks: {', '.join(unknown)}")
+    return opt
+
+
+def selected(name):
+    """Return the names of the checks given by name or day number."""
+    if name.isdigit():
+        return [check.name for check in CHECKS.values() if check.day == int(name)]
+    return [name] if name in CHECKS else []
+
+
+def format_answer(answer, width=20):
+    text = str(answer)
+    return text if len(text) <= width else text[: width - 3] + "..."
+
+
+def main():
+    opt = parse_args()
+    names = [name for arg in opt.checks for name in selected(arg)] or list(CHECKS)
+    if opt.list:
+        for name in names:
+            backends = [backend.name for backend in CHECKS[name].backends]
+            print(f"{name:<20} {backends[0]} (reference) vs {', '.join(backends[1:])}")
+        return
+
+    failed = []
+    for name in names:
+        check = CHECKS[name]
+        backends = [backend.name for backend in check.backends]
+        width = max(12, *[len(b) for b in backends])
+        print(name)
+        header = f"  {'case':<16} {'answer':>20}  " + "  ".join(
+            f"{b:>{width}}{'':7}" for b in backends
+        )
+        print(header.rstrip())
+        for outcome in run_check(check, opt.repeat, not opt.no_input):
+            reference = outcome.times.get(backends[0])
+            cells = []
+            for backend in backends:
+                time = outcome.times.get(backend)
+                if time is None:
+                    cells.append(f"{'FAILED':>{width}}{'':7}")
+                elif reference is None or backend == backends[0]:
+                    cells.append(f"{time * 1000:{width - 2}.1f}ms{'':7}")
+                else:
+                    cells.append(
+                        f"{time * 1000:{width - 2}.1f}ms "
+                        f"{reference / max(time, 1e-9):5.2f}x"
+                    )
+            answer = format_answer(outcome.answers.get(backends[0], "-"))
+            print(f"  {outcome.case:<16} {answer:>20}  " + "  ".join(cells))
+            for backend, error in outcome.errors.items():
+                print(f"    {backend} failed: {error}")
+            if not outcome.agrees:
+                failed.append(f"{name} ({outcome.case})")
+                if not outcome.errors:
+                    answers = ", ".join(
+                        f"{backend} {format_answer(answer)}"
+                        for backend, answer in outcome.answers.items()
+                    )
+                    print(f"    MISMATCH: {answers}")
+    if failed:
+        print(f"backends disagree: {', '.join(failed)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()